@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Latency of bin/aliases.py and bin/tools.py on large synthetic catalogs.
+
+The real catalogs hold a few hundred entries. This generates catalogs of
+1k, 10k and 100k entries in the ALIAS_MAP / TOOL_MAP shape and measures
+each script against them:
+
+  startup   wall time of a subprocess per entry mode (-s, -d, --json,
+            --search, the overview and --help), cold (empty cache) and warm
+  lookup    1000 describe / JSON lookups in-process
+  search    the ranking behind --search, and the TUI's incremental ranking
+            (filter_aliases / load_all_matching) typed one key at a time
+  render    rich rendering of one category table (add_aliases / show_tools)
+  tui       keystroke to updated table in Textual's headless pilot
+
+Each size gets a scratch copy of bin/ whose map is replaced by the
+synthetic one, plus its own DOTFILES_DIR (no live sources) and
+XDG_CACHE_HOME. In-process measurements run in a child process per script
+and size, so imports and caches never leak between them.
+
+Results are written as flat ``metric → ms`` JSON. With --baseline, a
+metric slower than the baseline by more than --tolerance (and by more
+than MIN_DELTA_MS) fails the run.
+
+    python3 bench/catalog_bench.py                          # Every size
+    python3 bench/catalog_bench.py --sizes 1000 -o run.json
+    python3 bench/catalog_bench.py --baseline run.json      # Exit 1 on a regression
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BIN_DIR = ROOT_DIR / "bin"
+RESULTS_DIR = ROOT_DIR / "bench" / "results"
+
+SIZES = (1_000, 10_000, 100_000)
+RUNS = 5
+SEED = 20240601
+
+# A regression is slower by this fraction of the baseline and by MIN_DELTA_MS
+TOLERANCE = 0.25
+MIN_DELTA_MS = 0.5
+
+# Script → (file, line the catalog is injected before, map it replaces)
+SCRIPTS = {
+    "aliases": ("aliases.py", "\nALL_ALIASES = ", "ALIAS_MAP"),
+    "tools": ("tools.py", "\nALL_TOOLS = ", "TOOL_MAP"),
+}
+
+INJECTION = """
+import json as _bench_json
+with open({path!r}, encoding="utf-8") as _bench_file:
+    {name} = {{Category(key): [tuple(entry) for entry in entries] for key, entries in _bench_json.load(_bench_file).items()}}
+"""
+
+WORDS = (
+    "git", "grep", "find", "list", "show", "sync", "diff", "push", "pull", "edit",
+    "view", "open", "copy", "move", "make", "test", "lint", "run", "build", "watch",
+    "serve", "clean", "fetch", "merge", "tag", "log", "docker", "kube", "node", "rust",
+)
+
+LOOKUPS = 1000
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SYNTHETIC CATALOGS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def categories_of(source: str) -> list[str]:
+    """Values of the ``Category`` enum in a script, read without importing it."""
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == "Category":
+            return [
+                stmt.value.value
+                for stmt in node.body
+                if isinstance(stmt, ast.Assign) and isinstance(stmt.value, ast.Constant)
+            ]
+    raise SystemExit("no Category enum found")
+
+
+def synthetic_catalog(script: str, size: int, categories: list[str]) -> dict[str, list[tuple[str, str, str]]]:
+    """``size`` entries spread over ``categories``; names are unique, the rest is word salad."""
+    rng = random.Random(SEED)
+    catalog: dict[str, list] = {category: [] for category in categories}
+    for i in range(size):
+        first, second, third = rng.sample(WORDS, 3)
+        name = f"{first[:rng.randint(1, 4)]}{second[:rng.randint(1, 3)]}{i:x}"
+        if script == "aliases":
+            entry = (name, f"{first} {second} --{third}", f"{first.capitalize()} the {second} with {third}")
+        else:
+            entry = (name, f"{first.capitalize()} {second} for {third} work", f"{name} {third} --{second}")
+        catalog[categories[i % len(categories)]].append(entry)
+    return catalog
+
+
+def workspace(root: Path, size: int) -> tuple[Path, dict[str, str], dict[str, dict]]:
+    """Scratch bin/, environment and catalogs for one size."""
+    base = root / str(size)
+    bin_dir = base / "bin"
+    shutil.copytree(BIN_DIR / "foxden", bin_dir / "foxden", ignore=shutil.ignore_patterns("__pycache__"))
+    (base / "dotfiles").mkdir()
+
+    catalogs = {}
+    for script, (file, anchor, name) in SCRIPTS.items():
+        source = (BIN_DIR / file).read_text(encoding="utf-8")
+        if anchor not in source:
+            raise SystemExit(f"{file}: {anchor.strip()!r} not found, cannot inject the catalog")
+        catalog = synthetic_catalog(script, size, categories_of(source))
+        data_file = base / f"{script}.json"
+        data_file.write_text(json.dumps(catalog), encoding="utf-8")
+        injection = INJECTION.format(path=str(data_file), name=name)
+        (bin_dir / file).write_text(source.replace(anchor, injection + anchor, 1), encoding="utf-8")
+        catalogs[script] = catalog
+
+    env = {
+        **os.environ,
+        "DOTFILES_DIR": str(base / "dotfiles"),
+        "XDG_CACHE_HOME": str(base / "cache"),
+        "FOXDEN_SEARCH_DEBOUNCE_MS": "0",
+        "COLUMNS": "120",
+        "LINES": "40",
+    }
+    return bin_dir, env, catalogs
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# STARTUP (subprocesses)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def entry_modes(script: str, catalog: dict[str, list]) -> dict[str, list[str]]:
+    """Mode → arguments, for names and a category that exist in ``catalog``."""
+    category, entries = next((key, value) for key, value in catalog.items() if value)
+    name = entries[len(entries) // 2][0]
+    modes = {
+        "show": ["-s", category],
+        "describe": ["-d", name],
+        "search": ["--search", name[:3]],
+        "overview": [],
+        "help": ["--help"],
+    }
+    if script == "tools":
+        modes["json"] = ["--json", name]
+    return modes
+
+
+def run_once(argv: list[str], bin_dir: Path, env: dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *argv],
+        cwd=bin_dir,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=600,
+    )
+    return (time.perf_counter() - started) * 1000
+
+
+def startup_metrics(script: str, bin_dir: Path, env: dict[str, str], catalog: dict, runs: int) -> dict[str, float]:
+    file = SCRIPTS[script][0]
+    cache = Path(env["XDG_CACHE_HOME"])
+    metrics = {}
+    for mode, args in entry_modes(script, catalog).items():
+        shutil.rmtree(cache, ignore_errors=True)
+        metrics[f"startup/cold/{mode}"] = run_once([file, *args], bin_dir, env)
+        metrics[f"startup/warm/{mode}"] = statistics.median(run_once([file, *args], bin_dir, env) for _ in range(runs))
+    return metrics
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# IN-PROCESS (child worker)
+# ═══════════════════════════════════════════════════════════════════════════
+
+def timed(call, repeat: int = 1) -> float:
+    """Median milliseconds of ``repeat`` calls."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def tui_metrics(module, queries: list[str]) -> dict[str, float]:
+    """Keystroke-to-table latency in the headless pilot."""
+    import asyncio
+
+    import textual.app
+
+    captured = {}
+    original = textual.app.App.run
+    textual.app.App.run = lambda self, *args, **kwargs: captured.setdefault("app", self)
+    try:
+        module.run_tui()
+    finally:
+        textual.app.App.run = original
+    app = captured["app"]
+
+    # Stamp the moment the table is updated, so the pilot's own waiting is not counted
+    updated = asyncio.Event()
+    finished = [0.0]
+
+    def signalling(method):
+        def wrapper(*args) -> None:
+            method(*args)
+            finished[0] = time.perf_counter()
+            updated.set()
+        return wrapper
+
+    app.load_all_matching = signalling(app.load_all_matching)
+    app.load_category = signalling(app.load_category)
+
+    metrics = {}
+    started = time.perf_counter()
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        metrics["tui/mount"] = (time.perf_counter() - started) * 1000
+
+        keystrokes = []
+        clears = []
+        for query in queries:
+            await pilot.press("/")
+            for char in query:
+                updated.clear()
+                started = time.perf_counter()
+                await pilot.press(char)
+                await asyncio.wait_for(updated.wait(), timeout=60)
+                keystrokes.append((finished[0] - started) * 1000)
+            updated.clear()
+            started = time.perf_counter()
+            await pilot.press("escape")
+            await asyncio.wait_for(updated.wait(), timeout=60)
+            clears.append((finished[0] - started) * 1000)
+        metrics["tui/keystroke/p50"] = statistics.median(keystrokes)
+        metrics["tui/keystroke/max"] = max(keystrokes)
+        metrics["tui/clear"] = statistics.median(clears)
+
+        categories = list(type(app.current_category))
+        metrics["tui/category/first"] = timed(lambda: app.load_category(categories[1]))
+        metrics["tui/category/again"] = timed(lambda: app.load_category(categories[1]))
+    return metrics
+
+
+def worker(script: str, bin_dir: str) -> dict[str, float]:
+    """In-process metrics of one script, run with the workspace environment."""
+    import asyncio
+    import contextlib
+    import importlib
+    import io
+
+    sys.path.insert(0, bin_dir)
+    metrics = {}
+    started = time.perf_counter()
+    module = importlib.import_module(script)
+    catalog = module.get_catalog()
+    metrics["catalog/load"] = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(SEED)
+    names = [record.name for record in catalog]
+    sample = rng.sample(names, min(LOOKUPS, len(names)))
+    queries = [name[:3] for name in rng.sample(names, 5)]
+
+    describe = module.print_alias_plain if script == "aliases" else module.print_tool_plain
+    with contextlib.redirect_stdout(io.StringIO()):
+        metrics[f"lookup/describe x{len(sample)}"] = timed(lambda: [describe(name) for name in sample], 3)
+    if script == "tools":
+        metrics[f"lookup/json x{len(sample)}"] = timed(lambda: [module.get_tool_json(name) for name in sample], 3)
+
+    search = module.search_aliases if script == "aliases" else module.search_tools
+    metrics["search/cli"] = statistics.median(timed(lambda: search(query)) for query in queries)
+
+    from foxden.search import FuzzyIndex, IncrementalSearch
+
+    def type_queries() -> None:
+        incremental = IncrementalSearch(FuzzyIndex(catalog))
+        for query in queries:
+            for end in range(1, len(query) + 1):
+                incremental.rank(query[:end])
+
+    metrics["search/incremental"] = timed(type_queries, 3)
+
+    category = next(cat for cat in module.Category if catalog.in_category(cat))
+    entries = [record.entry for record in catalog.in_category(category)]
+    if script == "aliases":
+        statuses = [module.alias_status(category, name, command) for name, command, _ in entries]
+        render = module.render_aliases
+    else:
+        statuses = [module.tool_status(name) for name, _, _ in entries]
+        render = module.render_tools
+    metrics["render/category"] = timed(lambda: render(category, entries, statuses, 120, lambda data: None), 3)
+
+    metrics.update(asyncio.run(tui_metrics(module, queries[:2])))
+    return metrics
+
+
+def inprocess_metrics(script: str, bin_dir: Path, env: dict[str, str]) -> dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", script, str(bin_dir)],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=3600,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"{script} worker failed:\n{result.stderr}")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RESULTS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def regressions(metrics: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """Metrics slower than the baseline by more than ``tolerance`` and MIN_DELTA_MS."""
+    failed = []
+    for name, value in metrics.items():
+        before = baseline.get(name)
+        if before is not None and value > before * (1 + tolerance) and value - before > MIN_DELTA_MS:
+            failed.append(name)
+    return failed
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Comma-separated catalog sizes")
+    parser.add_argument("--scripts", default=",".join(SCRIPTS), help="Comma-separated scripts to measure")
+    parser.add_argument("--runs", type=int, default=RUNS, help="Warm startup runs per mode (median)")
+    parser.add_argument("-o", "--output", type=Path, help="Results file (default bench/results/<time>.json)")
+    parser.add_argument("--baseline", type=Path, help="Earlier results to compare with")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="Allowed slowdown, as a fraction")
+    parser.add_argument("--worker", nargs=2, metavar=("SCRIPT", "BIN_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(*args.worker)))
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["metrics"] if args.baseline else {}
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scripts = [script for script in args.scripts.split(",") if script in SCRIPTS]
+
+    metrics: dict[str, float] = {}
+    with tempfile.TemporaryDirectory(prefix="foxden-bench-") as scratch:
+        for size in sizes:
+            bin_dir, env, catalogs = workspace(Path(scratch), size)
+            for script in scripts:
+                measured = {
+                    **startup_metrics(script, bin_dir, env, catalogs[script], args.runs),
+                    **inprocess_metrics(script, bin_dir, env),
+                }
+                for name, value in measured.items():
+                    key = f"{script}/{size}/{name}"
+                    metrics[key] = round(value, 3)
+                    before = baseline.get(key)
+                    change = f"  {(value / before - 1) * 100:+6.1f}%" if before else ""
+                    print(f"{value:10.2f} ms  {key}{change}", flush=True)
+
+    output = args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "meta": {
+            "commit": git_commit(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "runs": args.runs,
+        },
+        "metrics": metrics,
+    }, indent=2) + "\n")
+    print(f"Wrote {output}")
+
+    if baseline and not baseline.keys() & metrics.keys():
+        print(f"No metrics in common with {args.baseline}; nothing compared")
+    failed = regressions(metrics, baseline, args.tolerance)
+    for name in failed:
+        print(f"FAIL  {name}: {baseline[name]:.2f} ms → {metrics[name]:.2f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup budget for the plain entry points of bin/aliases.py and bin/tools.py.
+
+These commands run from shell hooks and fzf previews, where import time is
+most of the latency. Each one runs under ``python -X importtime``; the check
+fails when a command imports a heavy UI library, or when its total import
+time (median of several runs) goes over its budget.
+
+    python3 bench/startup_budget.py       # Check, exit 1 on a regression
+    python3 bench/startup_budget.py -v    # Also list the slowest imports
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BIN_DIR = Path(__file__).resolve().parent.parent / "bin"
+RUNS = 7
+
+# Command (relative to bin/) → total import time budget in milliseconds
+BUDGETS = [
+    (["tools.py", "--json", "bat"], 50),
+    (["tools.py", "--json", "--format", "shell", "bat", "fd", "nope"], 50),
+    (["tools.py", "--describe", "bat"], 50),
+    (["aliases.py", "--describe", "ga"], 50),
+]
+
+HEAVY_MODULES = ("rich", "typer", "click", "textual")
+
+
+def import_profile(argv: list[str]) -> dict[str, int]:
+    """Run a command under -X importtime and return {module: cumulative µs}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=BIN_DIR,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented; keep the depth so totals are not double counted
+        profile[name.rstrip()] = int(cumulative)
+    return profile
+
+
+def top_level_ms(profile: dict[str, int]) -> float:
+    return sum(us for name, us in profile.items() if not name.startswith("  ")) / 1000
+
+
+def main() -> int:
+    verbose = "-v" in sys.argv[1:]
+    failed = False
+
+    for argv, budget in BUDGETS:
+        profiles = [import_profile(argv) for _ in range(RUNS)]
+        median = statistics.median(top_level_ms(p) for p in profiles)
+        modules = {name.strip() for name in profiles[0]}
+        heavy = sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+
+        ok = median <= budget and not heavy
+        failed |= not ok
+        status = "ok" if ok else "FAIL"
+        print(f"{status:<4}  {median:6.1f} ms / {budget} ms  {' '.join(argv)}")
+        if heavy:
+            print(f"      imports heavy modules: {', '.join(heavy[:5])}")
+        if verbose:
+            slowest = sorted(profiles[0].items(), key=lambda item: item[1], reverse=True)[:8]
+            for name, us in slowest:
+                print(f"      {us / 1000:6.1f} ms  {name.strip()}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
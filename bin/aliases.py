@@ -9,16 +9,38 @@
 # ///
 
 from enum import Enum
-from typing import Optional
-
-import typer
-from rich.box import HEAVY, ROUNDED
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-console = Console()
-app = typer.Typer(help="CLI tool to display and manage aliases")
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Optional
+import os
+import sys
+
+from foxden import ingest
+from foxden.catalog import Catalog, load_catalog
+from foxden.fastpath import (
+    parse_completion,
+    parse_plain_audit,
+    parse_plain_describe,
+    parse_plain_fts,
+    parse_plain_search,
+    parse_plain_usage,
+    parse_terminal_all,
+    parse_terminal_show,
+    print_fields,
+    print_row,
+    quiet_broken_pipe,
+)
+
+# rich, typer and textual are imported where they are used, so the plain
+# paths (-d on a pipe, cached -s tables) stay fast enough for shell hooks,
+# fzf previews and tmux popups.
+
+
+@lru_cache(maxsize=None)
+def get_console():
+    """Shared rich console, created on first use."""
+    from rich.console import Console
+    return Console()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -34,6 +56,7 @@ class Category(str, Enum):
     SYS = "sys"
     GNU = "gnu"
     FN = "fn"
+    TMUX = "tmux"
 
 
 # Category metadata: (icon, title, description)
@@ -46,6 +69,7 @@ CATEGORY_META = {
     Category.SYS: ("󰒓", "System", "macOS & system"),
     Category.GNU: ("󰌽", "GNU", "GNU coreutils"),
     Category.FN: ("󰊕", "Functions", "Shell functions"),
+    Category.TMUX: ("", "Tmux", "Tmux key bindings"),
 }
 
 
@@ -248,107 +272,681 @@ ALIAS_MAP = {
     Category.SYS: SYS_ALIASES,
     Category.GNU: GNU_ALIASES,
     Category.FN: FN_ALIASES,
+    Category.TMUX: [],
+}
+
+ALL_ALIASES = list(chain.from_iterable(ALIAS_MAP.values()))
+
+# Fields of an entry in external catalog files (see foxden.external)
+EXTERNAL_FIELDS = ("name", "command", "description")
+
+# Live config under $DOTFILES_DIR that the catalog is built from: (tag, path, parser).
+# ALIAS_MAP supplies descriptions and ordering on top (see ingest.overlay).
+ALIAS_SOURCES = [
+    ("zsh", "zsh/.aliases", ingest.parse_zsh),
+    ("git", "git/.gitconfig", ingest.parse_gitconfig),
+    ("tmux", "tmux/.tmux.conf", ingest.parse_tmux),
+]
+
+# Source section (zsh banner, or the source itself) → category of uncurated entries
+SECTION_CATEGORIES = {
+    "SHELL SHORTCUTS": Category.TERM,
+    "EDITORS": Category.FN,
+    "MODERN CLI REPLACEMENTS": Category.FILES,
+    "GIT - BASICS": Category.GIT,
+    "DIRECTORY NAVIGATION": Category.NAV,
+    "PACKAGE MANAGERS": Category.PKG,
+    "GNU COREUTILS (macOS replacements)": Category.GNU,
+    "TMUX": Category.TERM,
+    "macOS SPECIFIC": Category.SYS,
+    "FUNCTIONS": Category.FN,
+    "gitconfig": Category.GIT,
+    "tmux": Category.TMUX,
 }
 
-ALL_ALIASES = sum(ALIAS_MAP.values(), [])
+
+def source_category(record: ingest.IngestRecord) -> Category:
+    """Category for a live entry that ALIAS_MAP does not describe."""
+    name, command, _, section = record
+    if not command:
+        return Category.FN  # Shell function
+    return SECTION_CATEGORIES.get(section, Category.TERM)
+
+
+def alias_sections(sources: list) -> dict:
+    """ALIAS_MAP overlaid on the records parsed from every source."""
+    records = chain.from_iterable(records for _, records in sources)
+    return ingest.overlay(ALIAS_MAP, records, source_category)
+
+
+@lru_cache(maxsize=None)
+def get_sources() -> list:
+    """``(contents hash, records)`` of every live source (see ingest.load_source)."""
+    root = ingest.dotfiles_dir()
+    return [
+        ingest.load_source(tag, os.path.join(root, path), parse)
+        for tag, path, parse in ALIAS_SOURCES
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_local_catalog() -> Catalog:
+    """Aliases from the live dotfiles plus ALIAS_MAP, indexed for O(1) lookups.
+
+    The snapshot is keyed by this file and the hash of every source, and a
+    source is only re-parsed after it changes, so a warm run reads no config.
+    """
+    sources = get_sources()
+    return load_catalog(
+        "aliases",
+        __file__,
+        lambda: ((cat.value, aliases) for cat, aliases in alias_sections(sources).items()),
+        Category,
+        extra="".join(digest for digest, _ in sources).encode(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_external():
+    """Category files of a shared alias inventory, read per category (see foxden.external)."""
+    from foxden.external import ExternalCatalog
+    return ExternalCatalog(
+        "aliases",
+        EXTERNAL_FIELDS,
+        (cat.value for cat in Category),
+        lambda: (record.name for record in get_local_catalog()),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_catalog() -> Catalog:
+    """The local catalog plus every external category, for lookups and search.
+
+    Listings of one category go through category_entries instead, which
+    leaves the other external files unread.
+    """
+    external = get_external()
+    if not external:
+        return get_local_catalog()
+    digest, sections = external.sections()
+    sources = get_sources()
+    return load_catalog(
+        "aliases-external",
+        __file__,
+        lambda: chain(((cat.value, aliases) for cat, aliases in alias_sections(sources).items()), sections),
+        Category,
+        extra=("".join(digest for digest, _ in sources) + digest).encode(),
+    )
+
+
+@lru_cache(maxsize=None)
+def category_entries(category: Category) -> list[tuple[str, str, str]]:
+    """One category's entries: the local ones, then its external file alone."""
+    entries = [record.entry for record in get_local_catalog().in_category(category)]
+    return entries + get_external().entries(category.value)
+
+
+def category_count(category: Category) -> int:
+    """Entries in a category, with external ones counted from the manifest if it is current."""
+    return len(get_local_catalog().in_category(category)) + get_external().count(category.value)
+
+
+# Static zsh completion function, installed into a directory on $fpath
+COMPLETION_FILE = "_foxden_aliases"
+
+# Listing marks for the installed-status column
+STATUS_MARKS = {True: "[green]✓[/]", False: "[red]✗[/]", None: "[dim]·[/]"}
+
+
+@lru_cache(maxsize=None)
+def get_path_index():
+    """Executables on $PATH, listed once per directory (see foxden.pathindex)."""
+    from foxden import pathindex
+    return pathindex.load()
+
+
+@lru_cache(maxsize=None)
+def live_functions() -> frozenset[str]:
+    """Names of the shell functions zsh/.aliases defines, from the ingest pass."""
+    _, records = get_sources()[0]
+    return frozenset(name for name, command, _, _ in records if not command)
+
+
+def alias_status(category: Category, name: str, command: str) -> Optional[bool]:
+    """Whether an alias's command resolves here; None for tmux binds, which tmux runs.
+
+    A live shell function is defined, so it resolves; its command column is
+    only a description ("gitignore.io").
+    """
+    if category is Category.TMUX:
+        return None
+    if name in live_functions():
+        return True
+    # Local aliases only: a listing of one category must not load every external file
+    return get_path_index().resolves(command, get_local_catalog())
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # RICH CLI OUTPUT
 # ═══════════════════════════════════════════════════════════════════════════
 
-def add_aliases(category: Category, aliases: list[tuple[str, str, str]]) -> None:
-    """Display a category of aliases in a styled table with pagination if needed."""
-    import os
-    import shutil
-    import subprocess
-    from io import StringIO
-    
+def alias_panel(category: Category, aliases: list[tuple[str, str, str]], statuses: list):
+    """A category of aliases as a styled table in a panel."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
     icon, title, desc = CATEGORY_META[category]
-    
+
     table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
     table.add_column("Alias", style="cyan bold", width=15)
     table.add_column("Command", style="green", width=35)
     table.add_column("Description")
 
-    for name, command, description in aliases:
-        table.add_row(f"[cyan bold]{name}[/]", f"[green]{command}[/]", description)
+    for (name, command, description), status in zip(aliases, statuses):
+        table.add_row(STATUS_MARKS[status], f"[cyan bold]{name}[/]", f"[green]{command}[/]", description)
 
-    panel = Panel(
+    return Panel(
         table,
         title=f"[blue bold]{icon}  {title}[/]",
         subtitle=f"[dim]{desc}[/]",
         title_align="center",
         border_style="blue"
     )
-    
-    # Use pager if content exceeds terminal height and we're in a TTY
-    terminal_height = shutil.get_terminal_size().lines
-    estimated_lines = len(aliases) * 2 + 6
-    
-    if estimated_lines > terminal_height and os.isatty(1):
-        # Render to string with ANSI codes
-        string_io = StringIO()
-        temp_console = Console(file=string_io, force_terminal=True)
-        temp_console.print()
-        temp_console.print(panel)
-        temp_console.print()
-        output = string_io.getvalue()
-        
-        # Pipe through less with ANSI support
-        pager = subprocess.Popen(
-            ["less", "-R", "-S"],
-            stdin=subprocess.PIPE,
-            text=True
-        )
-        pager.communicate(input=output)
-    else:
+
+
+def render_aliases(
+    category: Category,
+    aliases: list[tuple[str, str, str]],
+    statuses: list,
+    width: int,
+    write: Callable[[bytes], None],
+) -> None:
+    """Stream the ANSI rendering of alias_panel at a given terminal width to ``write``."""
+    from rich.console import Console
+
+    from foxden.pager import TextSink
+
+    console = Console(file=TextSink(write), force_terminal=True, width=width)
+    console.print()
+    console.print(alias_panel(category, aliases, statuses))
+    console.print()
+
+
+def write_aliases(category: Category, aliases: list[tuple[str, str, str]], out) -> None:
+    """Write a category's table to a foxden.pager.Pager, from the render cache when warm."""
+    from foxden import rendercache
+
+    statuses = [alias_status(category, name, command) for name, command, _ in aliases]
+    rendercache.cached_render(
+        __file__,
+        (category.value, aliases, statuses),
+        lambda width, write: render_aliases(category, aliases, statuses, width, write),
+        out.write,
+    )
+
+
+def add_aliases(category: Category, aliases: list[tuple[str, str, str]]) -> None:
+    """Display a category of aliases in a styled table with pagination if needed.
+
+    On a terminal the rendering comes from foxden.rendercache, so a warm
+    run does not import rich.
+    """
+    if not sys.stdout.isatty():
+        statuses = [alias_status(category, name, command) for name, command, _ in aliases]
+        console = get_console()
         console.print()
-        console.print(panel)
+        console.print(alias_panel(category, aliases, statuses))
         console.print()
+        return
+
+    from foxden.pager import Pager
+
+    with Pager() as out:
+        write_aliases(category, aliases, out)
+
+
+def show_all_aliases() -> None:
+    """Display every category, streamed to the pager one table at a time."""
+    if not sys.stdout.isatty():
+        for category in Category:
+            aliases = category_entries(category)
+            if aliases:
+                add_aliases(category, aliases)
+        return
+
+    from foxden.pager import Pager
+
+    with Pager() as out:
+        for category in Category:
+            if out.closed:
+                break  # The reader quit less: skip rendering (and loading) the rest
+            aliases = category_entries(category)
+            if aliases:
+                write_aliases(category, aliases, out)
 
 
 def show_category_aliases(category: Category):
     """Display aliases for a specific category."""
-    if category in ALIAS_MAP:
-        add_aliases(category, ALIAS_MAP[category])
+    aliases = category_entries(category)
+    if aliases:
+        add_aliases(category, aliases)
 
 
 def show_alias_description(alias_name: str):
     """Show detailed description for a specific alias."""
-    for name, command, description in ALL_ALIASES:
-        if name == alias_name:
-            # Find which category this alias belongs to
-            cat_name = "Unknown"
-            for cat, aliases in ALIAS_MAP.items():
-                if any(a[0] == alias_name for a in aliases):
-                    icon, title, _ = CATEGORY_META[cat]
-                    cat_name = f"{icon}  {title}"
-                    break
-
-            main_table = Table(box=HEAVY, border_style="blue", show_header=False, width=80)
-            main_table.add_column("Key", style="cyan bold", width=15)
-            main_table.add_column("Value", style="white")
-
-            main_table.add_row("Alias", f"[cyan bold]{name}[/]")
-            main_table.add_row("Command", f"[green]{command}[/]")
-            main_table.add_row("Description", description)
-            main_table.add_row("Category", cat_name)
-
-            console.print()
-            console.print(Panel(main_table, title="[blue bold]Alias Details[/]", border_style="blue"))
-            console.print()
-            return
+    from rich.box import HEAVY
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
+    record = get_catalog().get(alias_name)
+    if record is None:
+        console.print(f"[red]Alias '{alias_name}' not found.[/]")
+        return
+
+    name, command, description = record.entry
+    icon, title, _ = CATEGORY_META[record.category]
+
+    main_table = Table(box=HEAVY, border_style="blue", show_header=False, width=80)
+    main_table.add_column("Key", style="cyan bold", width=15)
+    main_table.add_column("Value", style="white")
+
+    main_table.add_row("Alias", f"[cyan bold]{name}[/]")
+    main_table.add_row("Command", f"[green]{command}[/]")
+    main_table.add_row("Description", description)
+    main_table.add_row("Category", f"{icon}  {title}")
+
+    console.print()
+    console.print(Panel(main_table, title="[blue bold]Alias Details[/]", border_style="blue"))
+    console.print()
+
+
+def print_alias_plain(alias_name: str) -> None:
+    """Print an alias's details as plain text (pipes, fzf previews)."""
+    record = get_catalog().get(alias_name)
+    if record is None:
+        print(f"Alias '{alias_name}' not found.")
+        return
+    name, command, description = record.entry
+    print_fields([
+        ("Alias", name),
+        ("Command", command),
+        ("Description", description),
+        ("Category", CATEGORY_META[record.category][1]),
+    ])
+
+
+def search_aliases(query: str, category: Optional[Category] = None) -> list:
+    """Aliases matching ``query`` as a fuzzy subsequence, best match first."""
+    from foxden.search import FuzzyIndex
+
+    return FuzzyIndex(get_catalog(), "search-aliases").search(query, category)
+
+
+def show_search_results(query: str, category: Optional[Category] = None) -> int:
+    """Display ranked search results in a styled table; returns the match count."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.markup import escape
+    from rich.table import Table
+
+    from foxden.search import count_label
+
+    console = get_console()
+    results = search_aliases(query, category)
+    if not results:
+        console.print(f"[red]No aliases match '{escape(query)}'.[/]")
+        return 0
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
+    table.add_column("Alias", style="cyan bold", width=15)
+    table.add_column("Command", style="green", width=35)
+    table.add_column("Description")
+
+    for record in results:
+        name, command, description = record.entry
+        icon = CATEGORY_META[record.category][0]
+        status = STATUS_MARKS[alias_status(record.category, name, command)]
+        table.add_row(status, f"[cyan bold]{name}[/]", f"[green]{command}[/]", f"{icon} {description}")
+
+    console.print()
+    console.print(Panel(
+        table,
+        title=f"[blue bold]󰍉  {escape(query)}[/]",
+        subtitle=f"[dim]{count_label(results)} matches, best first[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+    console.print()
+    return len(results)
+
+
+def print_search_plain(query: str, category: Optional[Category] = None) -> int:
+    """Print ranked search results as tab-separated fields; returns the match count."""
+    results = search_aliases(query, category)
+    for record in results:
+        print_row(record.entry)
+    return len(results)
 
-    console.print(f"[red]Alias '{alias_name}' not found.[/]")
+
+# Columns of the SQLite store besides name and category (see foxden.export)
+STORE_COLUMNS = ("command", "description")
+
+# Columns of its full-text index, name first
+INDEXED_COLUMNS = ("name", "command", "description")
+
+
+def catalog_files() -> list[str]:
+    """Every file the catalog is built from, for the search store's sync key."""
+    root = ingest.dotfiles_dir()
+    paths = [__file__, *(os.path.join(root, path) for _, path, _ in ALIAS_SOURCES)]
+    return paths + get_external().paths()
+
+
+def fulltext_search(query: str, category: Optional[Category] = None, marks: Optional[tuple[str, str]] = None) -> list[dict]:
+    """bm25-ranked word matches from the SQLite store, which is synced first if the catalog changed.
+
+    Raises sqlite3.Error when SQLite lacks FTS5.
+    """
+    from foxden import export, fts
+
+    path = export.default_output(export.ExportFormat.SQLITE, "aliases")
+    fts.sync(path, fts.source_key(catalog_files()), iter_alias_json, STORE_COLUMNS, INDEXED_COLUMNS)
+    return fts.search(
+        path, query, INDEXED_COLUMNS, category.value if category else None, marks=marks or fts.PLAIN_MARKS
+    )
+
+
+def show_fulltext_results(query: str, category: Optional[Category] = None) -> int:
+    """Display full-text matches with their hits highlighted; returns the match count."""
+    import sqlite3
+
+    from rich.box import ROUNDED
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
+    try:
+        results = fulltext_search(query, category, marks=("\x02", "\x03"))
+    except sqlite3.Error as error:
+        console.print(f"[red]Full-text search unavailable: {escape(str(error))}[/]")
+        return 0
+    if not results:
+        console.print(f"[red]No aliases match '{escape(query)}'.[/]")
+        return 0
+
+    def marked(text: str, style: str) -> str:
+        return f"[{style}]" + escape(text).replace("\x02", "[reverse]").replace("\x03", "[/reverse]") + "[/]"
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("Alias", width=15)
+    table.add_column("Command", style="green", width=35)
+    table.add_column("Match")
+
+    for result in results:
+        icon = CATEGORY_META[Category(result["category"])][0]
+        table.add_row(
+            marked(result["highlight"], "cyan bold"),
+            escape(result["command"]),
+            f"{icon} " + marked(result["snippet"], "default"),
+        )
+
+    console.print()
+    console.print(Panel(
+        table,
+        title=f"[blue bold]󰍉  {escape(query)}[/]",
+        subtitle=f"[dim]{len(results)} matches, bm25 ranked[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+    console.print()
+    return len(results)
+
+
+def print_fulltext_plain(query: str, category: Optional[Category] = None) -> int:
+    """Print full-text matches as name, command, description and snippet fields; returns the count."""
+    import sqlite3
+
+    try:
+        results = fulltext_search(query, category)
+    except sqlite3.Error as error:
+        print(f"Full-text search unavailable: {error}", file=sys.stderr)
+        return 0
+    for result in results:
+        print_row((result["name"], result["command"], result["description"], result["snippet"]))
+    return len(results)
+
+
+def alias_usage(category: Optional[Category] = None) -> list:
+    """``(record, runs)`` for every alias and function, most run first.
+
+    Counts come from $HISTFILE via foxden.usage, which only parses the
+    history appended since the last run. Tmux bindings never reach the
+    shell history and are left out.
+    """
+    from foxden import usage
+
+    counts = usage.scan()
+    seen = set()
+    rows = []
+    for record in get_catalog():
+        if record.category is Category.TMUX or record.name in seen:
+            continue
+        if category is not None and record.category is not category:
+            continue
+        seen.add(record.name)
+        rows.append((record, counts.get(record.name.encode(), 0)))
+    rows.sort(key=lambda row: -row[1])  # Stable: catalog order among ties
+    return rows
+
+
+def show_usage(category: Optional[Category] = None) -> None:
+    """Display aliases ranked by use, then the ones never run."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from foxden.usage import history_file
+
+    console = get_console()
+    rows = alias_usage(category)
+    used = [(record, runs) for record, runs in rows if runs]
+    unused = [record for record, runs in rows if not runs]
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("#", style="dim", justify="right", width=4)
+    table.add_column("Alias", style="cyan bold", width=15)
+    table.add_column("Runs", style="yellow", justify="right", width=8)
+    table.add_column("Command", style="green")
+    for rank, (record, runs) in enumerate(used, 1):
+        name, command, _ = record.entry
+        icon = CATEGORY_META[record.category][0]
+        table.add_row(str(rank), f"[cyan bold]{name}[/]", str(runs), f"{icon} [green]{command}[/]")
+
+    console.print()
+    console.print(Panel(
+        table,
+        title="[blue bold]󰄨  Most used[/]",
+        subtitle=f"[dim]{len(used)} of {len(rows)} run, from {history_file()}[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+
+    if unused:
+        never = Table(box=ROUNDED, border_style="red", show_header=False, expand=True)
+        never.add_column("Category", style="dim", width=14, no_wrap=True)
+        never.add_column("Aliases", style="cyan")
+        for cat in Category:
+            names = [record.name for record in unused if record.category is cat]
+            if names:
+                icon, title, _ = CATEGORY_META[cat]
+                never.add_row(f"{icon}  {title}", ", ".join(names))
+        console.print(Panel(
+            never,
+            title="[red bold]Never used[/]",
+            subtitle=f"[dim]{len(unused)} aliases[/]",
+            title_align="center",
+            border_style="red"
+        ))
+    console.print()
+
+
+def print_usage_plain(category: Optional[Category] = None) -> None:
+    """Print ``runs<TAB>alias<TAB>category`` lines, most run first; unused ones end with 0."""
+    for record, runs in alias_usage(category):
+        print(f"{runs}\t{record.name}\t{record.category.value}")
+
+
+def audit_aliases() -> list[dict]:
+    """Every alias and function of zsh/.aliases resolved against the PATH index.
+
+    Records come from foxden.pathindex.PathIndex.audit; see there for the
+    fields. Curated entries are left out: only live definitions shadow
+    anything.
+    """
+    tag, path, parse = ALIAS_SOURCES[0]
+    _, records = ingest.load_source(tag, os.path.join(ingest.dotfiles_dir(), path), parse)
+    aliases = {name: command for name, command, _, _ in records if command}
+    functions = {name for name, command, _, _ in records if not command}
+    return list(get_path_index().audit(aliases, functions))
+
+
+def show_audit() -> int:
+    """Display aliases with missing targets and the executables aliases hide; returns the missing count."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
+    results = audit_aliases()
+    missing = [result for result in results if result["missing"]]
+    shadowing = [result for result in results if result["shadows"] and not result["missing"]]
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
+    table.add_column("Alias", style="cyan bold", width=15)
+    table.add_column("Runs", style="green")
+    table.add_column("Shadows", style="yellow")
+    for result in missing + shadowing:
+        mark = STATUS_MARKS[not result["missing"]]
+        if result["kind"] == "function":
+            runs = "[dim]function[/]"
+        elif result["missing"]:
+            runs = f"[red]{result['target'] or result['command']} (not found)[/]"
+        else:
+            runs = f"{result['target']} [dim]→ {result['resolved']}[/]"
+        table.add_row(mark, f"[cyan bold]{result['name']}[/]", runs, result["shadows"] or "")
+
+    console.print()
+    console.print(Panel(
+        table,
+        title="[blue bold]󰒃  Alias audit[/]",
+        subtitle=f"[dim]{len(results)} definitions, {len(missing)} missing targets, "
+                 f"{sum(1 for result in results if result['shadows'])} shadowing[/]",
+        title_align="center",
+        border_style="red" if missing else "blue"
+    ))
+    console.print()
+    return len(missing)
+
+
+def print_audit_plain() -> int:
+    """Print one JSON record per alias and function; returns the missing count."""
+    from foxden.formats import encode
+
+    missing = 0
+    for result in audit_aliases():
+        missing += result["missing"]
+        print(encode(result))
+    return missing
+
+
+def show_shell_profile(runs: int) -> bool:
+    """Display where interactive zsh startup time goes; False if zsh is missing."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from foxden import shellprofile
+
+    console = get_console()
+    try:
+        with console.status(f"[cyan]Starting zsh {runs}× untraced and {runs}× traced…[/]"):
+            report = shellprofile.profile(runs)
+    except FileNotFoundError:
+        console.print("[red]zsh is not installed.[/]")
+        return False
+
+    files = Table(box=ROUNDED, border_style="blue", expand=True)
+    files.add_column("File", style="cyan")
+    files.add_column("p50 ms", style="yellow", justify="right", width=8)
+    files.add_column("p95 ms", style="yellow", justify="right", width=8)
+    for path, p50, p95 in report["files"]:
+        files.add_row(path, f"{p50 * 1000:.1f}", f"{p95 * 1000:.1f}")
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
+    table.add_column("File", style="cyan")
+    table.add_column("Block", style="green")
+    table.add_column("p50 ms", style="yellow", justify="right", width=8)
+    table.add_column("p95 ms", style="yellow", justify="right", width=8)
+    table.add_column("Costliest line", style="dim", no_wrap=True)
+    for path, block, p50, p95, hot, where in report["items"]:
+        table.add_row("[red]⚑[/]" if hot else "", path, block, f"{p50 * 1000:.1f}", f"{p95 * 1000:.1f}", where)
+
+    startup_p50, startup_p95 = report["startup"]
+    traced_p50, _ = report["traced"]
+    console.print()
+    console.print(Panel(files, title="[blue bold]󰈔  Files[/]", title_align="center", border_style="blue"))
+    console.print(Panel(
+        table,
+        title=f"[blue bold]󰔛  zsh startup: {startup_p50 * 1000:.0f} ms p50, {startup_p95 * 1000:.0f} ms p95[/]",
+        subtitle=f"[dim]{report['runs']} runs, {traced_p50 * 1000:.0f} ms p50 traced · ⚑ = {shellprofile.HOT_SHARE:.0%} of the cost[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+    console.print()
+    return True
+
+
+def print_shell_profile_plain(runs: int) -> bool:
+    """Print ``p50_ms<TAB>p95_ms<TAB>hot<TAB>file<TAB>block`` lines, costliest first.
+
+    The first line is the untraced startup, with file "(total)", and file
+    totals follow with an empty block.
+    """
+    from foxden import shellprofile
+
+    try:
+        report = shellprofile.profile(runs)
+    except FileNotFoundError:
+        print("zsh is not installed.", file=sys.stderr)
+        return False
+    p50, p95 = report["startup"]
+    print(f"{p50 * 1000:.2f}\t{p95 * 1000:.2f}\t-\t(total)\t")
+    for path, p50, p95 in report["files"]:
+        print(f"{p50 * 1000:.2f}\t{p95 * 1000:.2f}\t-\t{path}\t")
+    for path, block, p50, p95, hot, _ in report["items"]:
+        print(f"{p50 * 1000:.2f}\t{p95 * 1000:.2f}\t{'*' if hot else '-'}\t{path}\t{block}")
+    return True
 
 
 def show_help():
     """Display help information with category overview."""
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    console = get_console()
     console.print("\n[cyan bold]Usage:[/]")
     console.print("  [green]aliases -s git[/]       Show git aliases")
     console.print("  [green]aliases -s files[/]    Show file operation aliases")
     console.print("  [green]aliases -d ga[/]       Describe 'ga' alias")
+    console.print("  [green]aliases --search gcb[/] Fuzzy search aliases")
+    console.print("  [green]aliases --usage[/]     Rank aliases by use")
     console.print("  [green]aliases --tui[/]       Interactive browser")
 
     table = Table(title="[bold]Categories[/]", show_header=True, box=ROUNDED, border_style="blue")
@@ -359,8 +957,7 @@ def show_help():
 
     for cat in Category:
         icon, title, desc = CATEGORY_META[cat]
-        count = len(ALIAS_MAP[cat])
-        table.add_row(icon, cat.value, desc, str(count))
+        table.add_row(icon, cat.value, desc, str(category_count(cat)))
 
     console.print()
     console.print(table)
@@ -374,11 +971,16 @@ def show_help():
 
 def run_tui():
     """Launch the Textual TUI application."""
+    import asyncio
+    import threading
+
     from textual.app import App, ComposeResult
     from textual.binding import Binding
     from textual.containers import Container
     from textual.widgets import DataTable, Footer, Header, Input, Static, ListView, ListItem, Label
 
+    from foxden.search import FuzzyIndex, IncrementalSearch, count_label, search_debounce
+
     class AliasApp(App):
         """Interactive alias browser TUI."""
         
@@ -451,12 +1053,16 @@ def run_tui():
             Binding("escape", "clear_search", "Clear"),
             Binding("j", "cursor_down", "Down", show=False),
             Binding("k", "cursor_up", "Up", show=False),
+            Binding("f2", "search_stats", "Debug", show=False),
         ]
 
         def __init__(self):
             super().__init__()
             self.current_category = Category.GIT
             self.search_query = ""
+            self.search_index = None  # Built on the first search: it needs every category
+            self.search_index_lock = threading.Lock()  # Searches run in worker threads
+            self.search_debounce = search_debounce()
             self.showing_all = False  # True when showing cross-category search results
 
         def compose(self) -> ComposeResult:
@@ -473,62 +1079,117 @@ def run_tui():
             with Container(id="main"):
                 yield Input(placeholder="Search aliases... (press /)", id="search")
                 with Container(id="table-container"):
-                    yield DataTable(id="alias-table")
+                    yield DataTable(id="search-table")
                 yield Static("Select an alias to see details", id="details")
             yield Footer()
 
         def on_mount(self) -> None:
-            table = self.query_one("#alias-table", DataTable)
-            table.add_columns("Alias", "Command", "Description")
-            table.cursor_type = "row"
+            # Built row sets, keyed by category; None holds search results
+            self.tables = {None: self.setup_table(self.query_one("#search-table", DataTable))}
+            self.search_scope = None
+            self.row_categories = {}  # Name → category of every row shown so far
             self.load_category(self.current_category)
 
+        def setup_table(self, table: DataTable) -> DataTable:
+            table.add_column("", key="status")
+            table.add_column("Alias", key="name")
+            table.add_column("Command")
+            table.add_column("Description")
+            table.cursor_type = "row"
+            return table
+
+        def show_table(self, key) -> DataTable:
+            """Show the table for ``key``; a category's rows are built on first visit only."""
+            table = self.tables.get(key)
+            if table is None:
+                table = self.setup_table(DataTable(id=f"table-{key.value}"))
+                for entry in category_entries(key):
+                    self.row_categories[entry[0]] = key
+                    table.add_row(self.status_mark(key, entry[0], entry[1]), *entry, key=entry[0])
+                self.query_one("#table-container", Container).mount(table)
+                self.tables[key] = table
+            for other in self.tables.values():
+                other.display = other is table
+            self.active_table = table
+            return table
+
+        def show_rows(self, records: list, scope) -> None:
+            """Diff the search table to ``records``, keyed by name, in rank order.
+
+            ``scope`` is the category being filtered, or None for results from
+            all categories (those rows carry their category icon).
+            """
+            table = self.show_table(None)
+            if scope != self.search_scope:
+                table.clear()  # Cells differ between scopes, nothing to reuse
+                self.search_scope = scope
+
+            wanted = {record.name for record in records}
+            shown = {key.value for key in table.rows}
+            for name in shown - wanted:
+                table.remove_row(name)
+            added = [record for record in records if record.name not in shown]
+            for record in added:
+                name, command, description = record.entry
+                self.row_categories[name] = record.category
+                status = self.status_mark(record.category, name, command)
+                if scope is None:
+                    icon = CATEGORY_META[record.category][0]
+                    table.add_row(status, name, command, f"{icon} {description}", key=name)
+                else:
+                    table.add_row(status, name, command, description, key=name)
+            ranked = [record.name for record in records]
+            if [row.key.value for row in table.ordered_rows] != ranked:
+                rank = {name: i for i, name in enumerate(ranked)}
+                table.sort("name", key=rank.__getitem__)
+
+        def status_mark(self, category: Category, name: str, command: str) -> str:
+            return STATUS_MARKS[alias_status(category, name, command)]
+
+        def searcher(self) -> IncrementalSearch:
+            """The search index over every category, built once by the first search.
+
+            Only called from worker threads, so the build never blocks input.
+            """
+            with self.search_index_lock:
+                if self.search_index is None:
+                    self.search_index = IncrementalSearch(FuzzyIndex(get_catalog(), "search-aliases"))
+                return self.search_index
+
         def load_category(self, category: Category) -> None:
             self.current_category = category
             self.showing_all = False
-            table = self.query_one("#alias-table", DataTable)
-            table.clear()
 
-            aliases = ALIAS_MAP[category]
-            filtered = self.filter_aliases(aliases)
-
-            for name, command, description in filtered:
-                table.add_row(name, command, description)
+            if self.search_query:
+                # Ranked in a worker, like run_search; a keystroke cancels it
+                self.run_worker(
+                    self.search_category(category, self.search_query), group="search", exclusive=True
+                )
+                return
+            self.show_table(category)
+            self.show_category_details(category, category_entries(category))
 
+        def show_category_details(self, category: Category, records: list) -> None:
             icon, title, desc = CATEGORY_META[category]
             self.query_one("#details", Static).update(
-                f"[bold]{icon}  {title}[/] — {desc} ({len(filtered)} aliases)"
+                f"[bold]{icon}  {title}[/] — {desc} ({count_label(records)} aliases)"
             )
 
-        def load_all_matching(self) -> None:
-            """Load aliases from ALL categories matching the search query."""
+        def load_all_matching(self, results: list) -> None:
+            """Show search results for aliases from ALL categories."""
             self.showing_all = True
-            table = self.query_one("#alias-table", DataTable)
-            table.clear()
-
-            query = self.search_query.lower()
-            results = []
-            for cat in Category:
-                for name, command, description in ALIAS_MAP[cat]:
-                    if query in name.lower() or query in command.lower() or query in description.lower():
-                        results.append((name, command, description, cat))
-
-            for name, command, description, cat in results:
-                icon = CATEGORY_META[cat][0]
-                table.add_row(name, command, f"{icon} {description}")
+            self.show_rows(results, None)
 
             self.query_one("#details", Static).update(
-                f"[bold]󰍉  Search Results[/] — {len(results)} matches across all categories"
+                f"[bold]󰍉  Search Results[/] — {count_label(results)} matches across all categories"
             )
 
-        def filter_aliases(self, aliases: list) -> list:
-            if not self.search_query:
-                return aliases
-            query = self.search_query.lower()
-            return [
-                (n, c, d) for n, c, d in aliases
-                if query in n.lower() or query in c.lower() or query in d.lower()
-            ]
+        async def search_category(self, category: Category, query: str) -> None:
+            """Search results within one category, ranked off the UI thread."""
+            results = await asyncio.to_thread(lambda: self.searcher().rank(query, category))
+            if query == self.search_query and category == self.current_category:
+                self.show_rows(results, category)
+                self.show_category_details(category, results)
 
         def on_list_view_selected(self, event: ListView.Selected) -> None:
             item_id = event.item.id
@@ -537,46 +1198,53 @@ def run_tui():
                 self.load_category(Category(cat_name))
 
         def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-            table = self.query_one("#alias-table", DataTable)
-            row_key = event.row_key
-            row = table.get_row(row_key)
+            row = event.data_table.get_row(event.row_key)
             if row:
-                name, command, description = row
-                # Find the category for this alias
-                cat_info = ""
-                for cat in Category:
-                    if any(a[0] == name for a in ALIAS_MAP[cat]):
-                        icon, title, _ = CATEGORY_META[cat]
-                        cat_info = f" [{title}]"
-                        break
+                _, name, command, description = row
+                category = self.row_categories.get(name)
+                cat_info = f" [{CATEGORY_META[category][1]}]" if category else ""
                 details = f"[cyan bold]{name}[/]{cat_info} → [green]{command}[/]\n{description}"
                 self.query_one("#details", Static).update(details)
 
         def on_input_changed(self, event: Input.Changed) -> None:
             if event.input.id == "search":
                 self.search_query = event.value
-                if self.search_query:
-                    self.load_all_matching()
-                else:
-                    self.load_category(self.current_category)
+                # exclusive: a newer keystroke cancels the pending search
+                self.run_worker(self.run_search(event.value), group="search", exclusive=True)
+
+        async def run_search(self, query: str) -> None:
+            """Debounced search off the UI thread; only the newest result set is shown."""
+            await asyncio.sleep(self.search_debounce)
+            if not query:
+                self.load_category(self.current_category)
+                return
+            # The first search builds the index, so it runs off the UI thread too
+            results = await asyncio.to_thread(lambda: self.searcher().rank(query))
+            if query == self.search_query:
+                self.load_all_matching(results)
 
         def action_focus_search(self) -> None:
             self.query_one("#search", Input).focus()
 
         def action_clear_search(self) -> None:
+            self.workers.cancel_group(self, "search")
             search = self.query_one("#search", Input)
             search.value = ""
             self.search_query = ""
             self.showing_all = False
             self.load_category(self.current_category)
 
+        def action_search_stats(self) -> None:
+            if self.search_index is None:
+                self.notify("No searches yet", title="Search cache")
+                return
+            self.notify(self.search_index.stats(), title="Search cache")
+
         def action_cursor_down(self) -> None:
-            table = self.query_one("#alias-table", DataTable)
-            table.action_cursor_down()
+            self.active_table.action_cursor_down()
 
         def action_cursor_up(self) -> None:
-            table = self.query_one("#alias-table", DataTable)
-            table.action_cursor_up()
+            self.active_table.action_cursor_up()
 
     app = AliasApp()
     app.run()
@@ -586,51 +1254,311 @@ def run_tui():
 # MAIN CLI
 # ═══════════════════════════════════════════════════════════════════════════
 
-@app.command()
-def main(
-    show: Optional[Category] = typer.Option(
-        None, "--show", "-s", help="Show aliases for a specific category"
-    ),
-    describe: str = typer.Option(
-        None, "--describe", "-d", help="Describe a specific alias"
-    ),
-    tui: bool = typer.Option(
-        False, "--tui", "-t", help="Launch interactive TUI browser"
-    ),
-):
+def iter_alias_json():
+    """Yield every alias as a dictionary for machine consumption, category by category."""
+    catalog = get_catalog()
+    for category in Category:
+        _, title, _ = CATEGORY_META[category]
+        for record in catalog.in_category(category):
+            name, command, description = record.entry
+            yield {
+                "name": name,
+                "command": command,
+                "description": description,
+                "category": category.value,
+                "category_title": title,
+            }
+
+
+# Reference page columns: (header, record key, as code)
+REFERENCE_COLUMNS = (
+    ("Alias", "name", True),
+    ("Command", "command", True),
+    ("Description", "description", False),
+)
+
+
+def export_aliases(fmt, output: Optional[str]) -> None:
+    """Write every alias as NDJSON, a SQLite table or the docs reference page.
+
+    Files and rows whose content did not change are left alone.
     """
-    CLI tool to display and manage shell aliases and functions.
-
-    Categories:
-      git    - Version control shortcuts
-      files  - Modern file operations  
-      nav    - Directory jumping
-      term   - Terminal & shell
-      pkg    - Package managers
-      sys    - macOS & system
-      gnu    - GNU coreutils
-      fn     - Shell functions
-
-    Examples:
-      aliases              # Show categories
-      aliases -s git       # Show git aliases
-      aliases -d ga        # Describe 'ga' alias
-      aliases --tui        # Interactive browser
-    """
-    if tui:
-        run_tui()
-        return
+    from foxden import export
 
-    if describe:
-        show_alias_description(describe)
+    path = output or export.default_output(fmt, "aliases")
+    records = iter_alias_json()
+    if fmt == export.ExportFormat.SQLITE:
+        written, unchanged, removed = export.export_sqlite(path, records, STORE_COLUMNS, INDEXED_COLUMNS)
+        print(f"{path}: {written} written, {removed} removed, {unchanged} unchanged")
         return
 
-    if show:
-        show_category_aliases(show)
+    if fmt == export.ExportFormat.MARKDOWN:
+        headings = {cat.value: (title, desc) for cat, (_, title, desc) in CATEGORY_META.items()}
+        chunks = export.markdown_page(path, export.markdown_block(records, REFERENCE_COLUMNS, headings))
+    else:
+        chunks = export.ndjson_lines(records)
+    changed = export.write_if_changed(path, chunks)
+    if path != "-":
+        print(f"Wrote {path}" if changed else f"{path} is up to date")
+
+
+def rebuild_manifest() -> bool:
+    """Recount the external category files and rewrite their manifest (see foxden.external)."""
+    from foxden.external import MANIFEST_NAME, catalog_dir, write_manifest
+
+    directory = catalog_dir("aliases")
+    if not os.path.isdir(directory):
+        get_console().print(f"[red]No external catalog at {directory}[/]")
+        return False
+    manifest = write_manifest(directory, EXTERNAL_FIELDS, (record.name for record in get_local_catalog()))
+    counts = ", ".join(f"{category} {info['count']}" for category, info in manifest["categories"].items())
+    print(f"Wrote {os.path.join(directory, MANIFEST_NAME)}: {counts or 'no category files'}")
+    return True
+
+
+def fast_main(argv: list[str]) -> bool:
+    """Answer plain-output requests without importing typer or rich.
+
+    Returns False when the arguments need the full CLI.
+    """
+    alias_name = parse_plain_describe(argv)
+    if alias_name is not None:
+        print_alias_plain(alias_name)
+        return True
+
+    query = parse_plain_search(argv)
+    if query is not None:
+        sys.exit(0 if print_search_plain(query) else 1)
+
+    query = parse_plain_fts(argv)
+    if query is not None:
+        sys.exit(0 if print_fulltext_plain(query) else 1)
+
+    show = parse_terminal_show(argv)
+    if show is not None:
+        try:
+            category = Category(show)
+        except ValueError:
+            return False  # typer reports the valid choices
+        show_category_aliases(category)
+        return True
+
+    directory = parse_completion(argv)
+    if directory is not None:
+        install_completion(directory)
+        return True
+
+    if parse_terminal_all(argv):
+        show_all_aliases()
+        return True
+
+    if parse_plain_usage(argv):
+        print_usage_plain()
+        return True
+
+    if parse_plain_audit(argv):
+        sys.exit(1 if print_audit_plain() else 0)
+
+    return False
+
+
+def completion_values() -> dict[str, list[tuple[str, str]]]:
+    """Values the static zsh completion offers, by kind."""
+    return {
+        "category": [(cat.value, CATEGORY_META[cat][2]) for cat in Category],
+        "alias": [(record.name, record.entry[2]) for record in get_catalog()],
+    }
+
+
+def install_completion(directory: str) -> None:
+    """Write the static zsh completion into ``directory`` ("-" prints it).
+
+    The file is only rewritten when the catalog or the CLI changed, so
+    install.sh can call this on every run.
+    """
+    from foxden import completion
+
+    values = completion_values()
+    digest = completion.completion_digest(__file__, chain.from_iterable(values.values()))
+
+    def build() -> str:
+        import typer.main
+
+        command = typer.main.get_command(build_app())
+        return completion.zsh_script("aliases", command, values, {"show": "category", "describe": "alias"}, digest)
+
+    if directory == "-":
+        sys.stdout.write(build())
         return
+    path = os.path.join(directory, COMPLETION_FILE)
+    if completion.write_completion(path, digest, build):
+        print(f"Wrote {path}")
+
+
+def build_app():
+    """The typer app behind the full CLI."""
+    import typer
+
+    from foxden.export import ExportFormat
+
+    app = typer.Typer(help="CLI tool to display and manage aliases")
+
+    @app.command()
+    def main(
+        show: Optional[Category] = typer.Option(
+            None, "--show", "-s", help="Show aliases for a specific category"
+        ),
+        describe: str = typer.Option(
+            None, "--describe", "-d", help="Describe a specific alias"
+        ),
+        search: Optional[str] = typer.Option(
+            None, "--search", help="Fuzzy search aliases, best match first (limit with -s)"
+        ),
+        fulltext: bool = typer.Option(
+            False, "--fts", help="With --search: match words in the SQLite FTS5 store, bm25 ranked with highlights"
+        ),
+        show_all: bool = typer.Option(
+            False, "--all", "-a", help="Show every category, paged"
+        ),
+        usage: bool = typer.Option(
+            False, "--usage", help="Rank aliases by runs in $HISTFILE and list unused ones (limit with -s)"
+        ),
+        audit: bool = typer.Option(
+            False, "--audit", help="Check alias targets and list shadowed executables (JSON lines on a pipe, exit 1 if any is missing)"
+        ),
+        profile_shell: bool = typer.Option(
+            False, "--profile-shell", help="Profile interactive zsh startup per file and block"
+        ),
+        runs: int = typer.Option(
+            20, "--runs", min=1, help="zsh startups to time with --profile-shell"
+        ),
+        completion: Optional[str] = typer.Option(
+            None, "--completion", metavar="DIR", help="Write static zsh completion to DIR (- prints it)"
+        ),
+        tui: bool = typer.Option(
+            False, "--tui", "-t", help="Launch interactive TUI browser"
+        ),
+        export_format: Optional[ExportFormat] = typer.Option(
+            None, "--export", help="Export every alias, rewriting only what changed"
+        ),
+        output: Optional[str] = typer.Option(
+            None, "--output", "-o", metavar="PATH",
+            help="Where --export writes (default: stdout, cache dir or docs/reference/aliases.md)",
+        ),
+        manifest: bool = typer.Option(
+            False, "--rebuild-manifest", help="Recount the external catalog files into their manifest"
+        ),
+    ):
+        """
+        CLI tool to display and manage shell aliases and functions.
+
+        Categories:
+          git    - Version control shortcuts
+          files  - Modern file operations  
+          nav    - Directory jumping
+          term   - Terminal & shell
+          pkg    - Package managers
+          sys    - macOS & system
+          gnu    - GNU coreutils
+          fn     - Shell functions
+          tmux   - Tmux key bindings
+
+        Aliases are read from zsh/.aliases, the [alias] section of
+        git/.gitconfig and tmux/.tmux.conf under $DOTFILES_DIR.
+
+        Examples:
+          aliases              # Show categories
+          aliases -s git       # Show git aliases
+          aliases -d ga        # Describe 'ga' alias
+          aliases --search gcb # Fuzzy search, best match first
+          aliases --search "interactive rebase" --fts  # Word search, bm25 ranked
+          aliases -a           # Every category, paged
+          aliases --usage      # Most used and never used aliases
+          aliases --profile-shell        # What zsh startup spends time on
+          aliases --audit | jq 'select(.missing)'  # Broken alias targets
+          aliases --tui        # Interactive browser
+          aliases --completion ~/.zfunc  # Static zsh completion
+          aliases --export markdown      # Regenerate docs/reference/aliases.md
+          aliases --rebuild-manifest     # After editing $FOXDEN_CATALOG_DIR/aliases/
+        """
+        if manifest:
+            if not rebuild_manifest():
+                raise typer.Exit(1)
+            return
+
+        if export_format:
+            export_aliases(export_format, output)
+            return
+
+        if completion:
+            install_completion(completion)
+            return
+
+        if tui:
+            run_tui()
+            return
+
+        if describe:
+            if sys.stdout.isatty():
+                show_alias_description(describe)
+            else:
+                print_alias_plain(describe)
+            return
+
+        if search is not None:
+            if fulltext:
+                show_results, print_results = show_fulltext_results, print_fulltext_plain
+            else:
+                show_results, print_results = show_search_results, print_search_plain
+            if sys.stdout.isatty():
+                hits = show_results(search, show)
+            else:
+                hits = print_results(search, show)
+            if not hits:
+                raise typer.Exit(1)
+            return
+
+        if audit:
+            missing = show_audit() if sys.stdout.isatty() else print_audit_plain()
+            if missing:
+                raise typer.Exit(1)
+            return
+
+        if profile_shell:
+            if sys.stdout.isatty():
+                profiled = show_shell_profile(runs)
+            else:
+                profiled = print_shell_profile_plain(runs)
+            if not profiled:
+                raise typer.Exit(1)
+            return
+
+        if usage:
+            if sys.stdout.isatty():
+                show_usage(show)
+            else:
+                print_usage_plain(show)
+            return
+
+        if show:
+            show_category_aliases(show)
+            return
+
+        if show_all:
+            show_all_aliases()
+            return
+
+        show_help()
+
+    return app
+
 
-    show_help()
+def cli() -> None:
+    """Full CLI with typer parsing and rich output."""
+    build_app()()
 
 
 if __name__ == "__main__":
-    app()
+    with quiet_broken_pipe():
+        if not fast_main(sys.argv[1:]):
+            cli()
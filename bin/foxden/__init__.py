@@ -0,0 +1,6 @@
+"""
+Fox's Den support modules shared by bin/aliases.py and bin/tools.py.
+
+Everything in this package sticks to the standard library so the scripts
+can use it on their fast paths without pulling in rich, typer or textual.
+"""
@@ -0,0 +1,68 @@
+"""
+Locked Homebrew versions from Brewfile.lock.json.
+
+`brew bundle` records the exact version of every formula and cask it
+installed in the lockfile, which is enough to answer "which version?"
+without Homebrew (Linux CI, fzf previews). The ~180 KB JSON document is
+parsed once into a compact index:
+
+  {name: (kind, version, bottle tags)}
+
+``kind`` is "brew" or "cask" and ``bottle tags`` lists the platforms with
+a prebuilt bottle (empty for casks and formulae built from source). Tap
+formulae are indexed under their full name and their short name.
+
+The index is cached with snapshot.load_tracked, so a run only stats the
+lockfile until it changes.
+"""
+
+import os
+from typing import Optional
+
+from foxden import snapshot
+from foxden.ingest import dotfiles_dir
+
+# Bump when the index layout changes, so cached indexes are rebuilt
+LOCK_VERSION = 1
+
+LOCK_KINDS = ("brew", "cask")
+
+LockEntry = tuple[str, str, tuple[str, ...]]
+
+
+def lock_path() -> str:
+    return os.path.join(dotfiles_dir(), "Brewfile.lock.json")
+
+
+def parse_lock(contents: bytes) -> dict[str, LockEntry]:
+    """Index the formulae and casks of a lockfile; an unreadable one is empty."""
+    import json
+
+    try:
+        entries = json.loads(contents)["entries"]
+    except (ValueError, KeyError, TypeError):
+        return {}
+
+    index: dict[str, LockEntry] = {}
+    for kind in LOCK_KINDS:
+        for name, entry in (entries.get(kind) or {}).items():
+            bottle = entry.get("bottle")
+            tags = tuple(sorted(bottle.get("files", ()))) if isinstance(bottle, dict) else ()
+            record = (kind, str(entry.get("version", "")), tags)
+            index.setdefault(name, record)
+            index.setdefault(name.rsplit("/", 1)[-1], record)  # sesh for joshmedeski/sesh/sesh
+    return index
+
+
+def load(path: Optional[str] = None) -> dict[str, LockEntry]:
+    """The lockfile index, re-parsed only after the file changes."""
+    _, index = snapshot.load_tracked(
+        "brew-lock", path or lock_path(), parse_lock, salt=f"lock:{LOCK_VERSION}".encode()
+    )
+    return index
+
+
+def describe(entry: LockEntry) -> str:
+    """``0.24.0 (brew, bottled)`` style summary of one entry."""
+    kind, version, tags = entry
+    return f"{version} ({kind}, bottled)" if tags else f"{version} ({kind})"
@@ -0,0 +1,126 @@
+"""
+Indexed catalog shared by aliases.py and tools.py.
+
+Both scripts describe their catalog as ordered (category, entries) sections
+where each entry is a ``(name, field, field)`` tuple. A Catalog flattens the
+sections into records and precomputes every index the CLIs and TUIs need,
+so describe, --json and row selection are dictionary hits instead of
+nested scans over every category.
+
+The raw index is plain data so it can be stored in a snapshot:
+
+  rows         [(name, field, field, category), ...] in catalog order
+  by_name      {name: row}
+  by_lower     {name.lower(): row}
+  by_category  {category: [row, ...]}
+
+The first entry wins when a name appears twice, matching the old scans.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from foxden import snapshot
+
+Section = tuple[str, list[tuple[str, str, str]]]
+
+
+class Record:
+    """One catalog entry and the category that owns it."""
+
+    __slots__ = ("entry", "category", "row")
+
+    def __init__(self, entry: tuple[str, str, str], category: Any, row: int):
+        self.entry = entry
+        self.category = category
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self.entry[0]
+
+    def __repr__(self) -> str:
+        return f"Record({self.entry!r}, {self.category!r})"
+
+
+class Catalog:
+    """Records plus name, lowercase name and category indexes."""
+
+    __slots__ = ("records", "_by_name", "_by_lower", "_by_category")
+
+    def __init__(self, index: dict, category: Callable[[str], Any] = str):
+        categories = {key: category(key) for key in index["by_category"]}
+        self.records = [
+            Record((name, first, second), categories[key], row)
+            for row, (name, first, second, key) in enumerate(index["rows"])
+        ]
+        records = self.records
+        self._by_name = {name: records[row] for name, row in index["by_name"].items()}
+        self._by_lower = {name: records[row] for name, row in index["by_lower"].items()}
+        self._by_category = {
+            categories[key]: [records[row] for row in rows]
+            for key, rows in index["by_category"].items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Record]:
+        return iter(self.records)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def get(self, name: str) -> Optional[Record]:
+        """Exact name lookup."""
+        return self._by_name.get(name)
+
+    def get_lower(self, name: str) -> Optional[Record]:
+        """Case-insensitive name lookup."""
+        return self._by_lower.get(name.lower())
+
+    def category_of(self, name: str) -> Optional[Any]:
+        """Category owning ``name``, or None."""
+        record = self._by_name.get(name)
+        return record.category if record else None
+
+    def in_category(self, category: Any) -> list[Record]:
+        """Records of one category, in catalog order."""
+        return self._by_category.get(category, [])
+
+
+def build_index(sections: Iterable[Section]) -> dict:
+    """Flatten (category, entries) sections into rows plus lookup indexes."""
+    rows = []
+    by_name: dict[str, int] = {}
+    by_lower: dict[str, int] = {}
+    by_category: dict[str, list[int]] = {}
+    for category, entries in sections:
+        members = by_category.setdefault(category, [])
+        for name, first, second in entries:
+            row = len(rows)
+            rows.append((name, first, second, category))
+            by_name.setdefault(name, row)
+            by_lower.setdefault(name.lower(), row)
+            members.append(row)
+    return {
+        "rows": rows,
+        "by_name": by_name,
+        "by_lower": by_lower,
+        "by_category": by_category,
+    }
+
+
+def load_catalog(
+    tag: str,
+    source_file: str,
+    sections: Callable[[], Iterable[Section]],
+    category: Callable[[str], Any] = str,
+    extra: bytes = b"",
+) -> Catalog:
+    """Build a Catalog from the snapshot of ``source_file``, indexing on a miss.
+
+    ``extra`` keys the snapshot on other inputs, such as hashes of the
+    config files the sections were parsed from.
+    """
+    index = snapshot.load_for_file(tag, source_file, lambda: build_index(sections()), extra)
+    return Catalog(index, category)
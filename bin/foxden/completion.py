@@ -0,0 +1,148 @@
+"""
+Static zsh completion scripts for aliases.py and tools.py.
+
+Typer's own completion runs the script on every Tab press, which means
+uv, Python, typer and rich before the first candidate shows. Instead each
+CLI writes a completion function with its options, categories and names
+baked in, so completing `tools -d <Tab>` never forks anything.
+
+Options are read from the typer command (only when a script is written);
+values come from the catalog. The file records a digest of both, so
+``write_completion`` can be run from install.sh every time and only
+rewrites the file after the catalog or the CLI changed.
+"""
+
+import os
+from typing import Callable, Iterable
+
+from foxden import snapshot
+
+# Part of the digest, with this file's source: installed files follow generator changes
+COMPLETION_VERSION = 1
+
+DIGEST_PREFIX = "# catalog: "
+
+# Options typer adds for its dynamic completion
+SKIPPED_PARAMS = ("install_completion", "show_completion")
+
+
+def completion_digest(source_file: str, entries: Iterable[tuple[str, str]]) -> str:
+    """Digest of the CLI's and this generator's source and the ``(value, description)`` pairs."""
+    sources = []
+    for path in (source_file, __file__):
+        with open(path, "rb") as f:
+            sources.append(f.read())
+    values = "\n".join(f"{value}\t{description}" for value, description in entries)
+    return snapshot.source_hash(f"completion:{COMPLETION_VERSION}".encode(), *sources, values.encode())
+
+
+def _quote(text: str) -> str:
+    return "'" + text.replace("'", "'\\''") + "'"
+
+
+def _describe_entry(value: str, description: str) -> str:
+    value = value.replace("\\", "\\\\").replace(":", "\\:")
+    description = " ".join(description.split())
+    return _quote(f"{value}:{description}")
+
+
+def _spec_text(text: str) -> str:
+    text = " ".join(text.split())
+    for char in "\\[]:":
+        text = text.replace(char, f"\\{char}")
+    return text.replace("'", "'\\''")
+
+
+def option_specs(command, states: dict[str, str]) -> list[str]:
+    """``_arguments`` specs for a click command; ``states`` maps parameter names to value lists.
+
+    Parameters are duck-typed, since recent typer releases vendor click.
+    """
+    specs = []
+    for param in command.params:
+        if param.name in SKIPPED_PARAMS:
+            continue
+        state = states.get(param.name)
+        if param.param_type_name == "argument":
+            specs.append(f"'*:{param.name}:->{state}'" if state else f"'*:{param.name}:'")
+            continue
+        flags = [*param.opts, *param.secondary_opts]
+        help_text = _spec_text(getattr(param, "help", None) or "")
+        choices = getattr(param.type, "choices", None)
+        if getattr(param, "is_flag", False):
+            action = ""
+        elif state:
+            action = f":{param.name}:->{state}"
+        elif choices:
+            action = f":{param.name}:({' '.join(str(choice) for choice in choices)})"
+        elif getattr(param, "metavar", None) == "DIR":
+            action = f":{param.name}:_files -/"
+        else:
+            action = f":{param.name}: "
+        if len(flags) > 1:
+            specs.append(f"'({' '.join(flags)})'{{{','.join(flags)}}}'[{help_text}]{action}'")
+        else:
+            specs.append(f"'{flags[0]}[{help_text}]{action}'")
+    specs.append("'--help[Show the help and exit]'")
+    return specs
+
+
+def zsh_script(
+    command_name: str,
+    command,
+    values: dict[str, list[tuple[str, str]]],
+    states: dict[str, str],
+    digest: str,
+) -> str:
+    """Completion function for ``command_name``.
+
+    ``values`` maps a value kind ("category", "tool") to its ``(value,
+    description)`` pairs and ``states`` maps parameter names to a kind.
+    """
+    lines = [
+        f"#compdef {command_name}",
+        f"# Generated by `{command_name} --completion`; do not edit.",
+        f"{DIGEST_PREFIX}{digest}",
+        "",
+        'local curcontext="$curcontext" state line',
+    ]
+    for kind, entries in values.items():
+        lines.append(f"local -a {kind}_values")
+        lines.append(f"{kind}_values=(")
+        lines.extend(f"  {_describe_entry(value, description)}" for value, description in entries)
+        lines.append(")")
+    lines.append("")
+    lines.append("_arguments -C \\")
+    lines.extend(f"  {spec} \\" for spec in option_specs(command, states))
+    lines.append("  && return 0")
+    lines.append("")
+    lines.append("case $state in")
+    for kind in values:
+        lines.append(f"  ({kind}) _describe -t {kind} {kind} {kind}_values ;;")
+    lines.append("esac")
+    return "\n".join(lines) + "\n"
+
+
+def installed_digest(path: str) -> str:
+    """Digest recorded in an installed completion file, or "" if there is none."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            for _ in range(3):
+                line = f.readline()
+                if line.startswith(DIGEST_PREFIX):
+                    return line[len(DIGEST_PREFIX):].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def write_completion(path: str, digest: str, build: Callable[[], str]) -> bool:
+    """Write ``build()`` to ``path`` unless it already has ``digest``; True if written."""
+    if installed_digest(path) == digest:
+        return False
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(build())
+    os.replace(tmp, path)
+    return True
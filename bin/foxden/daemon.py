@@ -0,0 +1,179 @@
+"""
+Catalog daemon - keep a catalog resident and answer lookups over a Unix socket.
+
+Protocol (line based, UTF-8):
+  client → one name per line
+  daemon → one record per line, misses included (see foxden.formats)
+  client → ``@shell`` / ``@json`` switches the encoding for the connection
+  client → an empty line closes the connection
+
+Connections stay open between requests, so a client can issue hundreds of
+lookups without paying for a new process or a new connection each time.
+
+Every request first checks the stamps of the files the catalog was built
+from. Once one changed, the daemon closes connections without answering
+(clients fall back to their own lookup) and stops, so its caller can start
+over on the new catalog instead of serving the old one.
+"""
+
+import json
+import os
+from typing import Any, Callable, Optional
+
+from foxden.formats import Format, encode, found, not_found
+
+
+def socket_path(name: str) -> str:
+    """Return the per-user socket path for the daemon called ``name``."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(base, f"foxden-{os.getuid()}", f"{name}.sock")
+
+
+def is_running(path: str) -> bool:
+    """Check whether a daemon is accepting connections on ``path``."""
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def serve(
+    path: str,
+    records: dict[str, dict],
+    prefix: str = "",
+    source_key: Optional[Callable[[], Any]] = None,
+) -> bool:
+    """Answer lookups for ``records`` on ``path`` until interrupted.
+
+    ``source_key`` is checked before every request against its value at
+    startup. Returns True when it changed, False when interrupted.
+    """
+    import signal
+    import socketserver
+    import threading
+
+    key = source_key() if source_key is not None else None
+    changed = threading.Event()
+    # Encode every answer once up front; a lookup is then a dict hit + write
+    responses = {
+        fmt: {
+            name.encode(): encode(found(record), fmt, prefix).encode() + b"\n"
+            for name, record in records.items()
+        }
+        for fmt in Format
+    }
+
+    class LookupHandler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            fmt = Format.JSON
+            for line in self.rfile:
+                name = line.strip()
+                if not name:
+                    break
+                if changed.is_set():
+                    return
+                if source_key is not None and source_key() != key:
+                    changed.set()
+                    # In the background: shutdown() blocks until serve_forever's next poll
+                    threading.Thread(target=server.shutdown, daemon=True).start()
+                    return
+                if name.startswith(b"@"):
+                    try:
+                        fmt = Format(name[1:].decode())
+                    except ValueError:
+                        pass  # Unknown encoding, keep the current one
+                    continue
+                response = responses[fmt].get(name)
+                if response is None:
+                    response = encode(not_found(name.decode()), fmt, prefix).encode() + b"\n"
+                self.wfile.write(response)
+
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        if is_running(path):
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        os.unlink(path)  # Stale socket from a crashed daemon
+
+    server = socketserver.ThreadingUnixStreamServer(path, LookupHandler)
+    server.daemon_threads = True
+    signal.signal(signal.SIGTERM, signal.default_int_handler)  # Clean up on kill too
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(path)
+    return changed.is_set()
+
+
+class Client:
+    """Lookup client for a running daemon, falling back to an in-process lookup."""
+
+    def __init__(self, path: str, fallback: Callable[[str], Optional[dict]], timeout: float = 1.0):
+        self.fallback = fallback
+        self._sock: Optional["socket.socket"] = None
+        self._file = None
+        if not os.path.exists(path):
+            return  # No daemon; skips importing socket on the common path
+
+        import socket
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            return
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    @property
+    def connected(self) -> bool:
+        return self._sock is not None
+
+    def lookup(self, name: str) -> Optional[dict]:
+        """Look up ``name`` via the daemon, or in-process if it is unavailable."""
+        name = name.strip()
+        if self._file is not None and name:
+            try:
+                self._file.write(name.encode() + b"\n")
+                self._file.flush()
+                line = self._file.readline()
+                if line:
+                    record = json.loads(line)
+                    return record if record.pop("found") else None
+            except OSError:
+                pass
+            self.close()  # Daemon went away mid-session
+        return self.fallback(name)
+
+    def close(self) -> None:
+        if self._sock is None:
+            return
+        file, sock = self._file, self._sock
+        self._sock = None
+        self._file = None
+        try:
+            file.write(b"\n")
+            file.flush()
+        except OSError:
+            pass
+        try:
+            file.close()
+        except OSError:
+            pass  # Closing flushes again, to a daemon that may be gone
+        sock.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,262 @@
+"""
+Bulk catalog exports: NDJSON, a SQLite table and the docs reference pages.
+
+Records come from a generator and go out one at a time, so the rendered
+export never sits in memory whole, however large the catalog.
+
+Exports are incremental, so docs builds and downstream consumers only
+see a change when the catalog changed:
+
+  ndjson, markdown  written to a temporary file while hashed; the target is
+                    replaced only when its own hash (read in blocks) differs
+  sqlite            every row of ``foxden_entries`` carries the hash of its
+                    record; only rows whose hash changed are written, and rows
+                    of entries that are gone are deleted. An FTS5 index
+                    follows the table through triggers, so it is updated for
+                    exactly those rows. Every table is ``foxden_`` prefixed,
+                    so other tables in the same database are left alone
+
+A reference page keeps its hand-written prose. Only the lines between
+``BLOCK_START`` and ``BLOCK_END`` are generated; a page without them gets
+the block appended.
+"""
+
+import os
+from enum import Enum
+from hashlib import blake2b
+from typing import Iterable, Iterator, Optional
+
+from foxden.formats import encode
+
+# Part of the SQLite schema marker: bump to rebuild exported tables
+EXPORT_VERSION = 3
+
+# Bytes read at a time when hashing an existing export
+BLOCK_SIZE = 1024 * 1024
+
+# Markers around the generated part of a reference page
+BLOCK_START = "<!-- foxden:export:start -->"
+BLOCK_END = "<!-- foxden:export:end -->"
+
+# SQLite tables are prefixed, so an export into a database that holds
+# other tables (-o app.db) never drops or rewrites them
+TABLE = "foxden_entries"
+
+# Full-text index over TABLE, kept in step by triggers (see foxden.fts)
+FTS_TABLE = "foxden_entries_fts"
+
+# Key/value table holding the schema marker and the FTS store's sync key
+META_TABLE = "foxden_meta"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    SQLITE = "sqlite"
+    MARKDOWN = "markdown"
+
+
+def default_output(fmt: ExportFormat, tag: str) -> str:
+    """Where an export goes unless told otherwise ("-" is stdout)."""
+    from foxden import snapshot
+    from foxden.ingest import dotfiles_dir
+
+    if fmt == ExportFormat.MARKDOWN:
+        return os.path.join(dotfiles_dir(), "docs", "reference", f"{tag}.md")
+    if fmt == ExportFormat.SQLITE:
+        return os.path.join(snapshot.cache_dir(), f"{tag}.sqlite")
+    return "-"
+
+
+def file_hash(path: str) -> Optional[str]:
+    """Hash of a file's contents, read in blocks; None if it cannot be read."""
+    digest = blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(BLOCK_SIZE), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def write_if_changed(path: str, chunks: Iterable[str]) -> bool:
+    """Stream ``chunks`` to ``path`` ("-" for stdout); False if the file already held them."""
+    import sys
+
+    if path == "-":
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+        return True
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    digest = blake2b(digest_size=16)
+    try:
+        with open(tmp, "wb") as f:
+            for chunk in chunks:
+                data = chunk.encode("utf-8")
+                digest.update(data)
+                f.write(data)
+        if file_hash(path) == digest.hexdigest():
+            os.remove(tmp)
+            return False
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return True
+
+
+def ndjson_lines(records: Iterable[dict]) -> Iterator[str]:
+    for record in records:
+        yield encode(record) + "\n"
+
+
+def _cell(value, code: bool) -> str:
+    text = " ".join(str(value or "").split()).replace("|", "\\|")
+    if not text:
+        return ""
+    if code:
+        return f"`` {text} ``" if "`" in text else f"`{text}`"
+    return text.replace("<", "&lt;").replace(">", "&gt;")  # Plain cells may hold HTML
+
+
+def markdown_block(
+    records: Iterable[dict],
+    columns: tuple[tuple[str, str, bool], ...],
+    headings: dict[str, tuple[str, str]],
+) -> Iterator[str]:
+    """The generated part of a reference page: one table per category.
+
+    ``columns`` are ``(header, record key, as code)``; ``headings`` maps a
+    category to its ``(title, description)``. Records arrive grouped by
+    category. The tables sit in a ``v-pre`` container, so VitePress does
+    not read ``{{ }}`` in a command as a Vue expression.
+    """
+    yield BLOCK_START + "\n"
+    yield "<!-- Generated by --export markdown; edit the catalog, not these tables. -->\n"
+    yield "\n::: v-pre\n"
+    current = None
+    for record in records:
+        if record["category"] != current:
+            current = record["category"]
+            title, description = headings.get(current, (current, ""))
+            yield f"\n## {title}\n\n"
+            if description:
+                yield f"{description}\n\n"
+            yield "| " + " | ".join(header for header, _, _ in columns) + " |\n"
+            yield "|" + "|".join("---" for _ in columns) + "|\n"
+        yield "| " + " | ".join(_cell(record.get(key), code) for _, key, code in columns) + " |\n"
+    yield "\n:::\n\n" + BLOCK_END + "\n"
+
+
+def markdown_page(path: str, block: Iterable[str]) -> Iterator[str]:
+    """The page at ``path`` with its generated block replaced by ``block``.
+
+    The existing page is read line by line, as ``block`` is consumed.
+    """
+    try:
+        f = open(path, encoding="utf-8")
+    except OSError:
+        yield from block
+        return
+    with f:
+        replaced = False
+        skipping = False
+        last = ""
+        for line in f:
+            if skipping:
+                skipping = line.strip() != BLOCK_END
+                continue
+            if line.strip() == BLOCK_START and not replaced:
+                yield from block
+                replaced = skipping = True
+                continue
+            last = line
+            yield line
+        if not replaced:
+            yield "\n" if last.endswith("\n") or not last else "\n\n"
+            yield from block
+
+
+def _create_fts(conn, indexed: tuple[str, ...]) -> None:
+    """FTS5 index over the ``indexed`` columns of TABLE, with triggers mirroring every write."""
+    fields = ", ".join(indexed)
+    new = ", ".join(f"new.{column}" for column in indexed)
+    old = ", ".join(f"old.{column}" for column in indexed)
+    conn.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        f"{fields}, content='{TABLE}', content_rowid='rowid', prefix='2 3')"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE}_insert AFTER INSERT ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE} (rowid, {fields}) VALUES (new.rowid, {new}); END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE}_delete AFTER DELETE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, {fields}) VALUES ('delete', old.rowid, {old}); END"
+    )
+    conn.execute(
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE}_update AFTER UPDATE ON {TABLE} BEGIN "
+        f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, {fields}) VALUES ('delete', old.rowid, {old}); "
+        f"INSERT INTO {FTS_TABLE} (rowid, {fields}) VALUES (new.rowid, {new}); END"
+    )
+
+
+def export_sqlite(
+    path: str, records: Iterable[dict], columns: tuple[str, ...], indexed: tuple[str, ...] = ()
+) -> tuple[int, int, int]:
+    """Bring the TABLE table at ``path`` in line with ``records``.
+
+    Rows hold ``name``, ``category``, the ``columns`` fields, the whole
+    record as JSON and its hash. ``indexed`` names the columns of an FTS5
+    index to keep alongside (none by default). Returns ``(written,
+    unchanged, removed)``.
+    """
+    import sqlite3
+
+    schema = f"{EXPORT_VERSION}:{','.join(columns)}:{','.join(indexed)}"
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {META_TABLE} (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute(f"SELECT value FROM {META_TABLE} WHERE key = 'schema'").fetchone()
+            if row is None or row[0] != schema:
+                conn.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+                conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+                conn.execute(f"INSERT OR REPLACE INTO {META_TABLE} VALUES ('schema', ?)", (schema,))
+            fields = "".join(f", {column} TEXT" for column in columns)
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} "
+                f"(name TEXT PRIMARY KEY, category TEXT NOT NULL{fields}, record TEXT NOT NULL, hash TEXT NOT NULL)"
+            )
+            if indexed:
+                _create_fts(conn, indexed)
+            conn.execute("CREATE TEMP TABLE seen (name TEXT PRIMARY KEY)")
+
+            names = ("name", "category", *columns, "record", "hash")
+            upsert = (
+                f"INSERT INTO {TABLE} ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)}) "
+                f"ON CONFLICT(name) DO UPDATE SET "
+                + ", ".join(f"{name} = excluded.{name}" for name in names[1:])
+            )
+            written = unchanged = 0
+            for record in records:
+                data = encode(record)
+                digest = blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+                name = record["name"]
+                if conn.execute("INSERT OR IGNORE INTO seen VALUES (?)", (name,)).rowcount == 0:
+                    continue  # A later duplicate of a name; the first one wins, as in the catalog
+                row = conn.execute(f"SELECT hash FROM {TABLE} WHERE name = ?", (name,)).fetchone()
+                if row is not None and row[0] == digest:
+                    unchanged += 1
+                    continue
+                conn.execute(upsert, (name, record["category"], *(record.get(c) for c in columns), data, digest))
+                written += 1
+            removed = conn.execute(f"DELETE FROM {TABLE} WHERE name NOT IN (SELECT name FROM temp.seen)").rowcount
+            conn.execute("DROP TABLE temp.seen")
+    finally:
+        conn.close()
+    return written, unchanged, removed
@@ -0,0 +1,247 @@
+"""
+Catalog entries kept outside the scripts, one file per category.
+
+A shared inventory can hold tens of thousands of entries, far too many
+for Python literals that every invocation compiles or unmarshals. They
+live in a directory instead, ``$FOXDEN_CATALOG_DIR/<tag>`` (default
+``$DOTFILES_DIR/catalog/<tag>``), next to a small manifest:
+
+  manifest.json   {"version": 2, "local": "<names key>",
+                   "categories": {"cli": {"file": "cli.ndjson", "count": 1234,
+                                          "size": 98765}, ...}}
+
+Category files are NDJSON (one entry per line), JSON (a list) or TOML (an
+``[[entries]]`` array). An entry is a list of the three fields or an
+object keyed by field name, ``("name", "description", "example")`` for
+tools and ``("name", "command", "description")`` for aliases.
+
+An external entry never overrides one the script defines itself (a
+"local" name), and a name repeated in a file keeps its first entry. The
+manifest counts entries after dropping both, and records a key of the
+local names it was counted against and the size of every file. While
+the key and a file's size still match, the manifest alone answers "how
+many in this category", and a category file is only parsed when that
+category is asked for; otherwise the count comes from the parsed file.
+Each file is cached with snapshot.load_tracked, so a warm run only stats
+it. ``write_manifest`` (``--rebuild-manifest``) recounts the files after
+they change.
+"""
+
+import os
+import sys
+from hashlib import blake2b
+from typing import Callable, Iterable, Optional
+
+from foxden import snapshot
+from foxden.catalog import Section
+from foxden.ingest import dotfiles_dir
+
+# Bump when the parsers change, so cached category files are re-parsed
+EXTERNAL_VERSION = 2
+
+MANIFEST_NAME = "manifest.json"
+
+# Category file suffixes, in the order write_manifest looks for them
+FILE_FORMATS = (".ndjson", ".jsonl", ".json", ".toml")
+
+Entry = tuple[str, str, str]
+
+
+def catalog_dir(tag: str) -> str:
+    """Directory of the external ``tag`` catalog ($FOXDEN_CATALOG_DIR/<tag>)."""
+    base = os.environ.get("FOXDEN_CATALOG_DIR") or os.path.join(dotfiles_dir(), "catalog")
+    return os.path.join(base, tag)
+
+
+def _entry(value, fields: tuple[str, ...]) -> Optional[Entry]:
+    if isinstance(value, dict):
+        value = [value.get(field, "") for field in fields]
+    if not isinstance(value, (list, tuple)) or len(value) != 3 or not value[0]:
+        return None
+    return tuple("" if field is None else str(field) for field in value)
+
+
+def _records(path: str, contents: bytes) -> list:
+    """The raw entries of a category file, by its suffix."""
+    import json
+
+    text = contents.decode("utf-8", "replace")
+    if path.endswith((".ndjson", ".jsonl")):
+        records = []
+        for line in text.splitlines():
+            line = line.strip()
+            if line:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # One bad line should not hide the rest
+        return records
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            print(f"foxden: {path} needs Python 3.11+ (tomllib)", file=sys.stderr)
+            return []
+        try:
+            return tomllib.loads(text).get("entries", [])
+        except tomllib.TOMLDecodeError:
+            return []
+    try:
+        value = json.loads(text or "[]")
+    except ValueError:
+        return []
+    return value.get("entries", []) if isinstance(value, dict) else value
+
+
+def names_key(names: Iterable[str]) -> str:
+    """Key of a set of names, as the manifest records the local names."""
+    return blake2b("\0".join(sorted(set(names))).encode(), digest_size=16).hexdigest()
+
+
+def unique_entries(entries: Iterable[Entry], local: Iterable[str]) -> list[Entry]:
+    """Entries whose name is not local, the first of each name only."""
+    seen = set(local)
+    unique = []
+    for entry in entries:
+        if entry[0] not in seen:
+            seen.add(entry[0])
+            unique.append(entry)
+    return unique
+
+
+def parse_entries(path: str, contents: bytes, fields: tuple[str, ...]) -> list[Entry]:
+    """Entries of a category file; malformed ones are skipped."""
+    entries = []
+    for value in _records(path, contents):
+        entry = _entry(value, fields)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+def parse_manifest(contents: bytes) -> tuple[str, dict[str, tuple[str, int, Optional[int]]]]:
+    """``(local names key, {category: (file, count, size)})`` from a manifest; an unreadable one is empty."""
+    import json
+
+    try:
+        manifest = json.loads(contents)
+        categories = {
+            str(category): (str(info["file"]), int(info.get("count", 0)), info.get("size"))
+            for category, info in manifest["categories"].items()
+        }
+        return str(manifest.get("local", "")), categories
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return "", {}
+
+
+class ExternalCatalog:
+    """The manifest of one external catalog, with category files parsed on demand.
+
+    ``local`` returns the names the script defines itself; it is only
+    called once a count or a listing needs them.
+    """
+
+    __slots__ = ("tag", "directory", "fields", "categories", "local_key", "_local", "_counted")
+
+    def __init__(
+        self,
+        tag: str,
+        fields: tuple[str, ...],
+        known: Iterable[str],
+        local: Callable[[], Iterable[str]] = tuple,
+        directory: Optional[str] = None,
+    ):
+        self.tag = tag
+        self.directory = directory or catalog_dir(tag)
+        self.fields = fields
+        self._local = local
+        self._counted: Optional[bool] = None
+        _, (self.local_key, manifest) = snapshot.load_tracked(
+            f"external-{tag}-manifest",
+            os.path.join(self.directory, MANIFEST_NAME),
+            parse_manifest,
+            salt=f"external:{EXTERNAL_VERSION}".encode(),
+        )
+        known = set(known)
+        self.categories = {category: info for category, info in manifest.items() if category in known}
+
+    def __bool__(self) -> bool:
+        return bool(self.categories)
+
+    def local(self) -> frozenset:
+        if not isinstance(self._local, frozenset):
+            self._local = frozenset(self._local())
+        return self._local
+
+    def count(self, category: str) -> int:
+        """Entries a category lists, from the manifest while it is current for that file."""
+        info = self.categories.get(category)
+        if info is None:
+            return 0
+        if self._counted is None:
+            self._counted = self.local_key == names_key(self.local())
+        stamp = snapshot.file_stamp(os.path.join(self.directory, info[0]))
+        if self._counted and stamp is not None and stamp[1] == info[2]:
+            return info[1]
+        return len(self.entries(category))  # Edited since the manifest was written
+
+    def load(self, category: str) -> tuple[str, list[Entry]]:
+        """``(contents hash, entries)`` of one category, parsed only after its file changes."""
+        info = self.categories.get(category)
+        if info is None:
+            return "", []
+        path = os.path.join(self.directory, info[0])
+        return snapshot.load_tracked(
+            f"external-{self.tag}-{category}",
+            path,
+            lambda contents: parse_entries(path, contents, self.fields),
+            salt=f"external:{EXTERNAL_VERSION}:{','.join(self.fields)}".encode(),
+        )
+
+    def paths(self) -> list[str]:
+        """The manifest and every category file, for keys over what the catalog is built from."""
+        files = (os.path.join(self.directory, info[0]) for info in self.categories.values())
+        return [os.path.join(self.directory, MANIFEST_NAME), *files]
+
+    def entries(self, category: str) -> list[Entry]:
+        """A category's entries, without local names and repeats."""
+        return unique_entries(self.load(category)[1], self.local())
+
+    def sections(self) -> tuple[str, list[Section]]:
+        """Every category: a digest of all the files, and their ``(category, entries)``."""
+        digests = []
+        sections = []
+        for category in self.categories:
+            digest, entries = self.load(category)
+            digests.append(digest)
+            sections.append((category, entries))
+        return "".join(digests), sections
+
+
+def write_manifest(directory: str, fields: tuple[str, ...], local: Iterable[str] = ()) -> dict:
+    """Recount the category files in ``directory`` and rewrite its manifest.
+
+    A category file is named after its category (``cli.ndjson``). Entries
+    named in ``local`` are not counted, nor are repeated names.
+    """
+    import json
+
+    local = frozenset(local)
+    categories = {}
+    for name in sorted(os.listdir(directory)):
+        category, suffix = os.path.splitext(name)
+        if suffix not in FILE_FORMATS or category in categories or name == MANIFEST_NAME:
+            continue
+        with open(os.path.join(directory, name), "rb") as f:
+            contents = f.read()
+        count = len(unique_entries(parse_entries(name, contents, fields), local))
+        categories[category] = {"file": name, "count": count, "size": len(contents)}
+
+    manifest = {"version": EXTERNAL_VERSION, "local": names_key(local), "categories": categories}
+    path = os.path.join(directory, MANIFEST_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+    return manifest
@@ -0,0 +1,158 @@
+"""
+Import-light argument handling for the plain-output entry points.
+
+Shell hooks and fzf previews call the scripts for a single record, where
+importing typer and rich costs more than the answer itself. The scripts try
+these parsers first and only build the full typer app when they return None.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+from foxden.formats import Format
+
+JSON_FLAGS = ("--json", "-j")
+FORMAT_FLAGS = ("--format", "-f")
+DESCRIBE_FLAGS = ("--describe", "-d")
+SEARCH_FLAGS = ("--search",)
+VERSIONS_FLAGS = ("--versions",)
+OUTDATED_FLAGS = ("--outdated",)
+SHOW_FLAGS = ("--show", "-s")
+ALL_FLAGS = ("--all", "-a")
+COMPLETION_FLAGS = ("--completion",)
+USAGE_FLAGS = ("--usage",)
+AUDIT_FLAGS = ("--audit",)
+FTS_FLAGS = ("--fts",)
+
+
+def parse_json_args(argv: list[str]) -> Optional[tuple[list[str], Format]]:
+    """Parse ``--json [-f FORMAT] [NAME...]`` in any order, or None if it is anything else."""
+    names: list[str] = []
+    fmt = Format.JSON
+    seen_json = False
+    args = iter(argv)
+    for arg in args:
+        value = None
+        if arg in JSON_FLAGS:
+            seen_json = True
+            continue
+        if arg in FORMAT_FLAGS:
+            value = next(args, None)
+        elif arg.startswith("--format="):
+            value = arg.partition("=")[2]
+        elif arg.startswith("-"):
+            return None  # Let the full CLI handle (or reject) it
+        else:
+            names.append(arg)
+            continue
+        try:
+            fmt = Format(value)
+        except ValueError:
+            return None
+    return (names, fmt) if seen_json else None
+
+
+def _plain_value(argv: list[str], flags: tuple[str, ...]) -> Optional[str]:
+    if len(argv) == 2 and argv[0] in flags and not sys.stdout.isatty():
+        return argv[1]
+    return None
+
+
+def parse_plain_describe(argv: list[str]) -> Optional[str]:
+    """Return the name for ``-d NAME`` when stdout is not a terminal."""
+    return _plain_value(argv, DESCRIBE_FLAGS)
+
+
+def parse_plain_search(argv: list[str]) -> Optional[str]:
+    """Return the query for ``--search QUERY`` when stdout is not a terminal."""
+    return _plain_value(argv, SEARCH_FLAGS)
+
+
+def parse_plain_fts(argv: list[str]) -> Optional[str]:
+    """Return the query for ``--search QUERY --fts`` (flags in any order) when stdout is not a terminal."""
+    if len(argv) != 3:
+        return None
+    rest = [arg for arg in argv if arg not in FTS_FLAGS]
+    return _plain_value(rest, SEARCH_FLAGS) if len(rest) == 2 else None
+
+
+def parse_plain_versions(argv: list[str]) -> Optional[list[str]]:
+    """Return the groups for ``--versions [GROUP...]`` when stdout is not a terminal."""
+    if not argv or argv[0] not in VERSIONS_FLAGS or sys.stdout.isatty():
+        return None
+    groups = argv[1:]
+    return None if any(group.startswith("-") for group in groups) else groups
+
+
+def parse_plain_outdated(argv: list[str]) -> bool:
+    """Whether the arguments are exactly ``--outdated`` and stdout is not a terminal."""
+    return len(argv) == 1 and argv[0] in OUTDATED_FLAGS and not sys.stdout.isatty()
+
+
+def parse_terminal_show(argv: list[str]) -> Optional[str]:
+    """Return the category for ``-s CATEGORY`` when stdout is a terminal.
+
+    That output comes from foxden.rendercache, so a warm run needs no rich.
+    """
+    if len(argv) == 2 and argv[0] in SHOW_FLAGS and sys.stdout.isatty():
+        return argv[1]
+    return None
+
+
+def parse_terminal_all(argv: list[str]) -> bool:
+    """Whether the arguments are exactly ``--all`` and stdout is a terminal."""
+    return len(argv) == 1 and argv[0] in ALL_FLAGS and sys.stdout.isatty()
+
+
+def parse_completion(argv: list[str]) -> Optional[str]:
+    """Return the directory for ``--completion DIR``."""
+    if len(argv) == 2 and argv[0] in COMPLETION_FLAGS:
+        return argv[1]
+    return None
+
+
+def parse_plain_usage(argv: list[str]) -> bool:
+    """Whether the arguments are exactly ``--usage`` and stdout is not a terminal."""
+    return len(argv) == 1 and argv[0] in USAGE_FLAGS and not sys.stdout.isatty()
+
+
+def parse_plain_audit(argv: list[str]) -> bool:
+    """Whether the arguments are exactly ``--audit`` and stdout is not a terminal."""
+    return len(argv) == 1 and argv[0] in AUDIT_FLAGS and not sys.stdout.isatty()
+
+
+def print_fields(rows: list[tuple[str, str]]) -> None:
+    """Print aligned ``Key: value`` lines, the plain form of a details panel."""
+    width = max(len(key) for key, _ in rows) + 1
+    for key, value in rows:
+        print(f"{key + ':':<{width}} {value}")
+
+
+# Tab-separated output has no quoting, so tabs and newlines inside a field
+# would start a new column or row; they are printed as spaces instead
+TSV_FIELD = str.maketrans("\t\r\n", "   ")
+
+
+def print_row(fields: Iterable[str]) -> None:
+    """Print one tab-separated line, the plain form of a table row."""
+    print("\t".join(field.translate(TSV_FIELD) for field in fields))
+
+
+@contextmanager
+def quiet_broken_pipe() -> Iterator[None]:
+    """Exit quietly when the reader of stdout goes away (``tools ... | head``).
+
+    SIGPIPE stays ignored, since the pager and the daemon client handle
+    EPIPE themselves; only a BrokenPipeError that reaches the entry point
+    becomes a silent exit with the status a SIGPIPE death would give.
+    """
+    try:
+        try:
+            yield
+        finally:
+            sys.stdout.flush()  # Surface a pending EPIPE here, not at interpreter exit
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(141)
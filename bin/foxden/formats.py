@@ -0,0 +1,62 @@
+"""
+Line formats for machine-readable catalog output.
+
+Every record is written as exactly one line so results can be streamed and
+consumed with ``while read`` loops:
+
+  json   {"name": "bat", ..., "found": true}
+  shell  tool_name='bat' ... tool_found=1   (ready for ``eval``)
+
+Misses are explicit records with ``found`` set to false.
+"""
+
+import json
+import shlex
+from enum import Enum
+from typing import Iterable, Iterator
+
+
+class Format(str, Enum):
+    JSON = "json"
+    SHELL = "shell"
+
+
+def found(record: dict) -> dict:
+    """Mark a catalog record as a hit."""
+    return {**record, "found": True}
+
+
+def not_found(name: str) -> dict:
+    """Explicit record for a name missing from the catalog."""
+    return {"name": name, "found": False}
+
+
+def _shell_value(value) -> str:
+    if value is None:
+        return "''"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return shlex.quote(str(value))
+
+
+def encode(record: dict, fmt: Format = Format.JSON, prefix: str = "") -> str:
+    """Encode a record as a single line (without the trailing newline)."""
+    if fmt == Format.SHELL:
+        return " ".join(f"{prefix}{key}={_shell_value(value)}" for key, value in record.items())
+    return json.dumps(record)
+
+
+def read_names(lines: Iterable[str]) -> Iterator[str]:
+    """Yield names from NDJSON lines: "bat", {"name": "bat"} or a bare bat."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            value = line
+        if isinstance(value, dict):
+            value = value.get("name")
+        if value:
+            yield str(value)
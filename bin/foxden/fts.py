@@ -0,0 +1,127 @@
+"""
+Full-text search over the catalog's SQLite store (``--search Q --fts``).
+
+The store is the table ``--export sqlite`` writes to the cache dir, with an
+FTS5 index over the name and the text fields (see foxden.export). Before a
+query, ``sync`` compares a key made of the stat stamps of every file the
+catalog is built from with the one the store was last synced at. Only on
+a mismatch are the records exported again, which rewrites just the rows
+whose hash changed, and the index with them. A warm query is therefore a
+few stats and one SQL statement; the catalog is never loaded in Python.
+
+Words match as prefixes (``chec`` finds checkout), results are ranked by
+bm25 with the name weighted above the other columns, and each comes with
+a snippet of its best matching column, hits wrapped in markers.
+"""
+
+import os
+from typing import Callable, Iterable, Optional
+
+from foxden import export, snapshot
+
+# Part of the sync key: bump when what a sync stores changes
+FTS_VERSION = 1
+
+# Ranked results returned by search unless asked otherwise
+DEFAULT_LIMIT = 50
+
+# bm25 weight of the name column; the other columns weigh 1
+NAME_WEIGHT = 10.0
+
+# Tokens of context in a snippet
+SNIPPET_TOKENS = 10
+
+# Marks around matched tokens in highlights and snippets
+PLAIN_MARKS = ("[", "]")
+
+
+def source_key(paths: Iterable[str]) -> str:
+    """Key of the files a catalog is built from, by path and stat stamp (no reads)."""
+    parts = [f"fts:{FTS_VERSION}:{export.EXPORT_VERSION}"]
+    for path in paths:
+        parts.append(f"{path}\0{snapshot.file_stamp(path)}")
+    return snapshot.source_hash("\n".join(parts).encode())
+
+
+def match_expression(query: str) -> Optional[str]:
+    """FTS5 query for the words of ``query``, each a quoted prefix; None if it has no words."""
+    import re
+
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+def sync(
+    path: str,
+    key: str,
+    records: Callable[[], Iterable[dict]],
+    columns: tuple[str, ...],
+    indexed: tuple[str, ...],
+) -> Optional[tuple[int, int, int]]:
+    """Re-export ``records()`` into the store unless it was synced at ``key``.
+
+    Returns the export's ``(written, unchanged, removed)``, or None when the
+    store was current.
+    """
+    import sqlite3
+
+    if os.path.exists(path):
+        conn = sqlite3.connect(path)
+        try:
+            row = conn.execute(f"SELECT value FROM {export.META_TABLE} WHERE key = 'source'").fetchone()
+        except sqlite3.Error:
+            row = None
+        finally:
+            conn.close()
+        if row is not None and row[0] == key:
+            return None
+
+    counts = export.export_sqlite(path, records(), columns, indexed)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            conn.execute(f"INSERT OR REPLACE INTO {export.META_TABLE} VALUES ('source', ?)", (key,))
+    finally:
+        conn.close()
+    return counts
+
+
+def search(
+    path: str,
+    query: str,
+    indexed: tuple[str, ...],
+    category: Optional[str] = None,
+    limit: int = DEFAULT_LIMIT,
+    marks: tuple[str, str] = PLAIN_MARKS,
+) -> list[dict]:
+    """Best ``limit`` matches for ``query``, best first.
+
+    ``indexed`` are the columns of the index, name first. Each result is the
+    exported record plus ``highlight`` (the name with its hits marked) and
+    ``snippet`` (the best matching column around its hits).
+    """
+    import json
+    import sqlite3
+
+    expression = match_expression(query)
+    if expression is None:
+        return []
+    table, fts = export.TABLE, export.FTS_TABLE
+    weights = ", ".join(str(NAME_WEIGHT if column == "name" else 1.0) for column in indexed)
+    sql = (
+        f"SELECT e.record, highlight({fts}, 0, :open, :close), "
+        f"snippet({fts}, -1, :open, :close, '…', {SNIPPET_TOKENS}) "
+        f"FROM {fts} JOIN {table} AS e ON e.rowid = {fts}.rowid "
+        f"WHERE {fts} MATCH :match"
+        + (" AND e.category = :category" if category else "")
+        + f" ORDER BY bm25({fts}, {weights}) LIMIT :limit"
+    )
+    params = {"open": marks[0], "close": marks[1], "match": expression, "category": category, "limit": limit}
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+    return [{**json.loads(record), "highlight": highlight, "snippet": snippet} for record, highlight, snippet in rows]
@@ -0,0 +1,253 @@
+"""
+Catalog records parsed from the live dotfiles.
+
+aliases.py documents shortcuts that really live in zsh/.aliases (aliases
+and functions), the [alias] section of git/.gitconfig and the bind lines of
+tmux/.tmux.conf. The parsers here turn each file into records:
+
+  (name, command, note, section)
+
+``note`` is the comment that introduces the entry (a group comment such as
+"# stash", or the comment above a function) and ``section`` the banner or
+source it came from, which the caller maps to a category. Curated
+descriptions are layered on top with ``overlay``.
+
+Each source is cached with snapshot.load_tracked, so a file is only
+re-parsed after it changes; re and shlex are imported by the parsers, which
+keeps them off the warm path.
+"""
+
+import os
+from typing import Any, Callable, Iterable, Optional
+
+from foxden import snapshot
+
+# Bump when a parser's or overlay's output changes, so cached parses (and the
+# catalogs keyed by their hashes) are rebuilt
+INGEST_VERSION = 3
+
+IngestRecord = tuple[str, str, str, str]
+
+ALIAS_PATTERN = r"^alias\s+([^=\s]+)=(.*)$"
+FUNCTION_PATTERN = r"^(?:function\s+)?([\w.+-]+)\s*\(\)\s*\{"
+BANNER_PATTERN = r"^#{3,}\s*$"
+GIT_SECTION_PATTERN = r"^\s*\[([^\]]+)\]"
+GIT_ENTRY_PATTERN = r"^\s*([\w.-]+)\s*=\s*(.*)$"
+
+# Commented-out config ("# bind P display-popup ...") is not a description
+CODE_COMMENT_PATTERN = (
+    r"^(alias \S+=|export \w+=|(set|setw|set-option) -|bind(-key)? (-\S+ )*\S+ [a-z]+-[a-z-]+)"
+)
+
+
+def dotfiles_dir() -> str:
+    """Return $DOTFILES_DIR, defaulting to ~/dotfiles like install.sh."""
+    return os.environ.get("DOTFILES_DIR") or os.path.join(os.path.expanduser("~"), "dotfiles")
+
+
+def _comment(line: str) -> str:
+    import re
+
+    text = line.lstrip("#").strip()
+    return "" if re.match(CODE_COMMENT_PATTERN, text) else text
+
+
+def _unquote(value: str) -> str:
+    import shlex
+
+    try:
+        return " ".join(shlex.split(value))
+    except ValueError:
+        return value.strip()
+
+
+def parse_zsh(text: str) -> list[IngestRecord]:
+    """Top-level ``alias name=value`` lines and ``name() {`` functions."""
+    import re
+
+    records = []
+    section = ""
+    note = ""
+    in_banner = False
+    in_comment = False
+    for line in text.splitlines():
+        if re.match(BANNER_PATTERN, line):
+            in_banner = not in_banner
+            continue
+        if in_banner:
+            section = line.lstrip("#").strip() or section
+            note = ""
+            continue
+        if not line.strip():
+            note = ""
+            in_comment = False
+            continue
+        if line.startswith("#"):
+            # A comment block is described by its first line ("# usage: ..." follows)
+            note = note if in_comment else _comment(line)
+            in_comment = bool(note)
+            continue
+        in_comment = False
+        match = re.match(ALIAS_PATTERN, line)
+        if match:
+            records.append((match.group(1), _unquote(match.group(2)), note, section))
+            continue
+        match = re.match(FUNCTION_PATTERN, line)
+        if match:
+            records.append((match.group(1), "", note, section))
+            note = ""
+    return records
+
+
+def parse_gitconfig(text: str) -> list[IngestRecord]:
+    """Entries of the ``[alias]`` section, named as they are typed (``git l``)."""
+    import re
+
+    records = []
+    in_alias = False
+    note = ""
+    for line in text.splitlines():
+        match = re.match(GIT_SECTION_PATTERN, line)
+        if match:
+            in_alias = match.group(1).strip() == "alias"
+            continue
+        if line.lstrip().startswith(("#", ";")):
+            note = line.lstrip().lstrip("#;").strip()
+            continue
+        match = re.match(GIT_ENTRY_PATTERN, line)
+        if not in_alias or not match:
+            continue
+        name, value = match.groups()
+        value = value.strip()
+        if len(value) > 1 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        value = value.replace('\\"', '"')
+        command = value[1:] if value.startswith("!") else f"git {value}"
+        records.append((f"git {name}", command, note or "Git config alias", "gitconfig"))
+        note = ""
+    return records
+
+
+def _logical_lines(text: str) -> Iterable[str]:
+    """Join continuation lines and quotes that span lines, as tmux does."""
+    import shlex
+
+    pending = ""
+    for line in text.splitlines():
+        pending = f"{pending}\n{line}" if pending else line
+        if pending.endswith("\\"):
+            pending = pending[:-1]
+            continue
+        try:
+            shlex.split(pending, comments=True)
+        except ValueError:
+            continue  # Unbalanced quote: the command goes on
+        yield pending
+        pending = ""
+    if pending:
+        yield pending
+
+
+def _tmux_bind(line: str, note: str) -> Optional[IngestRecord]:
+    """The record of one ``bind`` line, or None if it binds nothing."""
+    import shlex
+
+    lexer = shlex.shlex(line, posix=True)
+    lexer.whitespace_split = True
+    args = iter(lexer.get_token, None)
+    table = "prefix"
+    description = note
+    key = ""
+    next(args)  # bind / bind-key
+    for arg in args:
+        if arg == "-n":
+            table = "root"
+        elif arg == "-T":
+            table = next(args, table)
+        elif arg == "-N":
+            description = next(args, description)
+        elif arg.startswith("-") and len(arg) > 1:
+            continue  # -r and friends do not change what the key does
+        else:
+            key = arg
+            break
+    if not key:
+        return None
+    # The lexer's offset after each token bounds the raw command text, quotes
+    # included and a trailing comment left out; a quote spanning lines is
+    # shown on one
+    start = end = lexer.instream.tell()
+    for _ in args:
+        end = lexer.instream.tell()
+    command = " ".join(part.strip() for part in line[start:end].strip().splitlines())
+    name = key if table == "root" else f"{table} {key}"
+    return (name, command, description, "tmux")
+
+
+def parse_tmux(text: str) -> list[IngestRecord]:
+    """``bind``/``bind-key`` lines, named by key table and key (``prefix g``).
+
+    A comment above a bind describes that bind only.
+    """
+    records = []
+    note = ""
+    for line in _logical_lines(text):
+        stripped = line.strip()
+        if not stripped:
+            note = ""
+            continue
+        if stripped.startswith("#"):
+            note = _comment(stripped) or note
+            continue
+        if not stripped.startswith(("bind ", "bind-key ")):
+            continue
+        try:
+            record = _tmux_bind(stripped, note)
+        except ValueError:
+            record = None  # Unbalanced quotes: tmux rejects the line too
+        note = ""
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def load_source(tag: str, path: str, parse: Callable[[str], list[IngestRecord]]) -> tuple[str, list]:
+    """``(contents hash, records)`` for one source, re-parsed only after it changes."""
+    return snapshot.load_tracked(
+        f"source-{tag}",
+        path,
+        lambda contents: parse(contents.decode("utf-8", "replace")),
+        salt=f"ingest:{INGEST_VERSION}".encode(),
+    )
+
+
+def overlay(
+    curated: dict[Any, list[tuple[str, str, str]]],
+    ingested: Iterable[IngestRecord],
+    category_of: Callable[[IngestRecord], Any],
+) -> dict[Any, list[tuple[str, str, str]]]:
+    """Merge live records into curated sections.
+
+    A curated entry keeps its category, position and description; the live
+    command replaces the curated one when the source has one (functions
+    have none). Live entries nobody curated are appended to the category
+    ``category_of`` picks, described by their source comment. Curated
+    entries with no live counterpart (plugin aliases, for instance) stay.
+    A name defined twice keeps its last definition, as the shell does.
+    """
+    live: dict[str, IngestRecord] = {}
+    for record in ingested:
+        live[record[0]] = record
+
+    sections = {category: [] for category in curated}
+    for category, entries in curated.items():
+        for name, command, description in entries:
+            record = live.pop(name, None)
+            if record is not None and record[1]:
+                command = record[1]
+            sections[category].append((name, command, description))
+
+    for record in live.values():
+        name, command, note, _ = record
+        sections.setdefault(category_of(record), []).append((name, command or "function", note))
+    return sections
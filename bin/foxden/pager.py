@@ -0,0 +1,99 @@
+"""
+Terminal output that goes through less when it does not fit the screen.
+
+Pager is a sink for rendered output. Lines are held back only until they
+outnumber the terminal's rows; then less starts with the backlog and gets
+every later chunk as soon as it is written, so the first screen shows
+while the rest is still being rendered. Output that fits never starts a
+pager, and the choice rests on the real line count rather than a guess.
+
+When the reader quits less early, writes fail with EPIPE (Python ignores
+SIGPIPE); the sink then sets ``closed`` so callers stop rendering.
+"""
+
+import os
+import sys
+from typing import Callable, Optional
+
+PAGER_COMMAND = ["less", "-R", "-S"]
+
+
+class Pager:
+    """Bytes sink that starts less once the output outgrows the terminal."""
+
+    __slots__ = ("height", "paging", "lines", "backlog", "process", "closed")
+
+    def __init__(self, height: Optional[int] = None):
+        import shutil
+
+        self.height = height or shutil.get_terminal_size().lines
+        self.paging = sys.stdout.isatty()
+        self.lines = 0
+        self.backlog: list[bytes] = []
+        self.process = None
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        if self.closed:
+            return
+        if self.process is None:
+            if not self.paging:
+                self._send(sys.stdout.buffer, data)
+                return
+            self.backlog.append(data)
+            self.lines += data.count(b"\n")
+            if self.lines <= self.height:
+                return
+            import subprocess
+
+            self.process = subprocess.Popen(PAGER_COMMAND, stdin=subprocess.PIPE)
+            data = b"".join(self.backlog)
+            self.backlog.clear()
+        self._send(self.process.stdin, data)
+
+    def _send(self, stream, data: bytes) -> None:
+        try:
+            stream.write(data)
+            stream.flush()
+        except (BrokenPipeError, ValueError):
+            self.closed = True  # The reader is gone: stop producing
+            if stream is sys.stdout.buffer:
+                # Keep the interpreter's final flush from failing again
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+    def close(self) -> None:
+        if self.process is None:
+            if self.backlog and not self.closed:
+                self._send(sys.stdout.buffer, b"".join(self.backlog))
+            self.backlog.clear()
+        else:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                pass
+            self.process.wait()
+        self.closed = True
+
+    def __enter__(self) -> "Pager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        # Ctrl+C while less is open stops the rendering, not the program
+        return exc_type is KeyboardInterrupt and self.process is not None
+
+
+class TextSink:
+    """File-like adapter so a rich Console can print into a bytes writer."""
+
+    encoding = "utf-8"
+
+    def __init__(self, write: Callable[[bytes], None]):
+        self._write = write
+
+    def write(self, text: str) -> int:
+        self._write(text.encode())
+        return len(text)
+
+    def flush(self) -> None:
+        pass
@@ -0,0 +1,175 @@
+"""
+Index of the executables on $PATH.
+
+Answering "is this installed?" for every row of a listing with
+shutil.which stats each PATH directory once per name. Instead every PATH
+directory is listed once into a name → path index. Listings are cached per
+directory with the directory's mtime (which changes whenever an entry is
+added, removed or renamed), so a later run only rescans the directories
+that changed, typically none.
+"""
+
+import os
+import stat
+from typing import Container, Iterable, Iterator, Optional
+
+from foxden import snapshot
+
+CACHE_NAME = "path-index.marshal"
+
+# Shell builtins and keywords an alias or function may start with
+SHELL_BUILTINS = frozenset({
+    ".", "alias", "autoload", "bg", "builtin", "cd", "command", "echo", "eval",
+    "exec", "exit", "export", "fg", "function", "jobs", "kill", "local", "print", "printf",
+    "pushd", "popd", "read", "source", "set", "test", "type", "unalias",
+    "unset", "which",
+})
+
+
+def path_dirs(path: Optional[str] = None) -> list[str]:
+    """Directories of ``path`` (default $PATH) in lookup order, without duplicates."""
+    dirs = []
+    for directory in (os.environ.get("PATH", "") if path is None else path).split(os.pathsep):
+        directory = directory or "."
+        if directory not in dirs:
+            dirs.append(directory)
+    return dirs
+
+
+def scan_dir(directory: str) -> list[str]:
+    """Names of the executable files in one directory."""
+    names = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    mode = entry.stat().st_mode  # Follows symlinks, as exec does
+                except OSError:
+                    continue  # Dangling symlink
+                if stat.S_ISREG(mode) and mode & 0o111:
+                    names.append(entry.name)
+    except OSError:
+        pass
+    return names
+
+
+class PathIndex:
+    """Executable name → full path, first PATH directory wins."""
+
+    __slots__ = ("paths",)
+
+    def __init__(self, listings: Iterable[tuple[str, list[str]]]):
+        paths: dict[str, str] = {}
+        for directory, names in listings:
+            for name in names:
+                paths.setdefault(name, os.path.join(directory, name))
+        self.paths = paths
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def which(self, name: str) -> Optional[str]:
+        """Like shutil.which for a bare name, from the index."""
+        return self.paths.get(name)
+
+    def resolves(self, command: str, known: Container[str] = frozenset()) -> bool:
+        """Whether the first word of a shell command would run.
+
+        ``known`` holds the aliases and functions the shell also defines.
+        Leading ``sudo``, ``command`` and VAR=value assignments are skipped.
+        """
+        word = command_word(command)
+        if word is None:
+            return False
+        if os.sep in word:
+            return os.access(word, os.X_OK)
+        return word in self.paths or word in SHELL_BUILTINS or word in known
+
+    def locate(self, word: str, functions: Container[str] = frozenset()) -> Optional[str]:
+        """What a command word runs: a path, "builtin", "function", or None if nothing."""
+        if os.sep in word:
+            return word if os.access(word, os.X_OK) else None
+        if word in self.paths:
+            return self.paths[word]
+        if word in SHELL_BUILTINS:
+            return "builtin"
+        return "function" if word in functions else None
+
+    def audit(self, aliases: dict[str, str], functions: Iterable[str] = ()) -> Iterator[dict]:
+        """One record per alias and function, resolved against this index in one pass.
+
+        An alias's target is the first word of its command, followed through
+        other aliases as zsh expands them (``ix`` → ``iexit`` → ``tmux``).
+        ``resolved`` is what the target runs (see ``locate``, None when
+        missing) and ``shadows`` what the name hides: the executable or
+        builtin that would run without the definition.
+        """
+        functions = frozenset(functions)
+        for name, command in aliases.items():
+            target = command_word(command)
+            seen = {name}
+            while target in aliases and target not in seen:
+                seen.add(target)
+                target = command_word(aliases[target])
+            resolved = self.locate(target, functions) if target else None
+            yield {
+                "name": name,
+                "kind": "alias",
+                "command": command,
+                "target": target,
+                "resolved": resolved,
+                "missing": resolved is None,
+                "shadows": self.locate(name),
+            }
+        for name in sorted(functions):
+            yield {
+                "name": name,
+                "kind": "function",
+                "command": None,
+                "target": None,
+                "resolved": "function",
+                "missing": False,
+                "shadows": self.locate(name),
+            }
+
+
+def command_word(command: str) -> Optional[str]:
+    """The word a shell command runs, past ``sudo``, ``command`` and VAR=value assignments."""
+    for word in command.split():
+        if word in ("sudo", "command", "noglob") or ("=" in word and not word.startswith("=")):
+            continue
+        return os.path.expanduser(word)
+    return None
+
+
+def load(path: Optional[str] = None) -> PathIndex:
+    """Index of ``path`` (default $PATH), rescanning only directories whose mtime changed."""
+    cache_file = os.path.join(snapshot.cache_dir(), CACHE_NAME)
+    try:
+        cached = snapshot.read(cache_file)
+    except (OSError, ValueError, EOFError, TypeError):
+        cached = {}
+
+    listings = {}
+    changed = False
+    for directory in path_dirs(path):
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue  # Missing PATH entries are common and harmless
+        entry = cached.get(directory)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, scan_dir(directory))
+            changed = True
+        listings[directory] = entry
+
+    if changed:
+        try:
+            # Keep other directories too, so shells with different PATHs share the cache
+            snapshot.write(cache_file, {**cached, **listings})
+        except OSError:
+            pass
+    return PathIndex((directory, names) for directory, (_, names) in listings.items())
@@ -0,0 +1,173 @@
+"""
+Latest releases from a Python package index, for `tools --outdated`.
+
+Every uv tool used to be checked with its own curl call, one TLS handshake
+and one round-trip after another. Here the lookups run on a bounded pool of
+worker threads, each keeping one keep-alive connection per host, so N
+packages cost about N / workers round-trips on warm connections.
+
+Answers are cached on disk per package with the response's ETag and
+Last-Modified. Within the TTL no request is made at all; after it, the
+request is conditional and a 304 only refreshes the entry. The index is
+the PyPI JSON API unless $FOXDEN_PYPI_URL points elsewhere (a mirror, or a
+local stand-in server in tests).
+"""
+
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+from foxden import snapshot
+
+CACHE_NAME = "pypi-cache.marshal"
+
+DEFAULT_INDEX_URL = "https://pypi.org/pypi"
+
+# Seconds a cached answer is trusted without asking the index again
+DEFAULT_TTL = 3600
+
+# Concurrent lookups, and so at most this many open connections
+DEFAULT_WORKERS = 16
+
+REQUEST_TIMEOUT = 10
+
+
+def index_url() -> str:
+    """JSON API base URL ($FOXDEN_PYPI_URL overrides), without a trailing slash."""
+    return (os.environ.get("FOXDEN_PYPI_URL") or DEFAULT_INDEX_URL).rstrip("/")
+
+
+def cache_ttl() -> float:
+    """Cache TTL in seconds ($FOXDEN_PYPI_TTL overrides; 0 always revalidates)."""
+    try:
+        return float(os.environ.get("FOXDEN_PYPI_TTL", DEFAULT_TTL))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+class ConnectionPool:
+    """One keep-alive HTTP(S) connection per worker thread and host."""
+
+    def __init__(self, timeout: float = REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open: list = []
+
+    def _connection(self, scheme: str, host: str):
+        import http.client
+
+        connections = self._local.__dict__.setdefault("connections", {})
+        connection = connections.get((scheme, host))
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = connections[(scheme, host)] = factory(host, timeout=self.timeout)
+            with self._lock:
+                self._open.append(connection)
+        return connection
+
+    def _request(self, scheme: str, host: str, path: str, headers: dict[str, str]):
+        import http.client
+
+        connection = self._connection(scheme, host)
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            return response.status, dict(response.headers), response.read()
+        except (OSError, http.client.HTTPException):
+            self._local.connections.pop((scheme, host)).close()
+            raise
+
+    def get(self, url: str, headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """``(status, headers, body)`` of a GET, retried once on a fresh connection."""
+        import http.client
+        from urllib.parse import urlsplit
+
+        parts = urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        try:
+            return self._request(parts.scheme, parts.netloc, path, headers)
+        except (OSError, http.client.HTTPException):
+            # The server may have closed an idle keep-alive connection
+            return self._request(parts.scheme, parts.netloc, path, headers)
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._open:
+                connection.close()
+            self._open.clear()
+
+
+def _lookup(pool: ConnectionPool, url: str, cached: Optional[tuple]) -> Optional[tuple]:
+    """Fresh cache entry ``(fetched, etag, modified, version)`` for one package, or None."""
+    import http.client
+    import json
+
+    headers = {"Accept": "application/json", "User-Agent": "foxden-tools"}
+    if cached:
+        _, etag, modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+    try:
+        status, response_headers, body = pool.get(url, headers)
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+    now = time.time()
+    if status == 304 and cached:
+        return (now, cached[1], cached[2], cached[3])
+    if status == 404:
+        return (now, "", "", None)  # Not on the index: remember that too
+    if status != 200:
+        return None
+    try:
+        version = json.loads(body)["info"]["version"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    lower = {key.lower(): value for key, value in response_headers.items()}
+    return (now, lower.get("etag", ""), lower.get("last-modified", ""), version)
+
+
+def latest_versions(
+    names: Iterable[str],
+    index: Optional[str] = None,
+    ttl: Optional[float] = None,
+    workers: int = DEFAULT_WORKERS,
+) -> dict[str, Optional[str]]:
+    """Latest release of each package on the index; None when it cannot be found."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    index = index or index_url()
+    ttl = cache_ttl() if ttl is None else ttl
+    cache_file = os.path.join(snapshot.cache_dir(), CACHE_NAME)
+    try:
+        cache = snapshot.read(cache_file)
+    except (OSError, ValueError, EOFError, TypeError):
+        cache = {}
+
+    urls = {name: f"{index}/{name}/json" for name in names}
+    now = time.time()
+    stale = [name for name, url in urls.items() if url not in cache or now - cache[url][0] >= ttl]
+
+    if stale:
+        pool = ConnectionPool()
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+                entries = executor.map(lambda name: _lookup(pool, urls[name], cache.get(urls[name])), stale)
+                fetched = dict(zip(stale, entries))
+        finally:
+            pool.close()
+        changed = False
+        for name, entry in fetched.items():
+            if entry is not None:
+                cache[urls[name]] = entry
+                changed = True
+        if changed:
+            try:
+                snapshot.write(cache_file, cache)
+            except OSError:
+                pass
+
+    return {name: cache[url][3] if url in cache else None for name, url in urls.items()}
@@ -0,0 +1,115 @@
+"""
+Pre-rendered ANSI output of the category tables.
+
+`aliases -s git` and `tools -s cli` build a rich Table inside a Panel,
+measure every column and render it, and the result only changes with the
+rows, the terminal width or the colour setup. The rendered bytes are
+stored under a key of all of those, so a warm run writes them straight to
+the terminal without importing rich at all.
+
+Entries are files in the ``render`` directory of the cache. Reading one
+bumps its mtime, and storing one evicts the least recently used entries
+once the directory grows past MAX_BYTES.
+"""
+
+import os
+from typing import Any, Callable, Optional
+
+from foxden import snapshot
+
+CACHE_SUBDIR = "render"
+
+# Total size of the cached renders; a category table is a few KB
+MAX_BYTES = 4 * 1024 * 1024
+
+# Environment rich reads to choose colours and styles
+COLOR_ENV = ("COLORTERM", "TERM", "NO_COLOR", "FORCE_COLOR", "TTY_COMPATIBLE")
+
+
+def render_dir() -> str:
+    return os.path.join(snapshot.cache_dir(), CACHE_SUBDIR)
+
+
+def terminal_width() -> int:
+    """Width to render for ($COLUMNS overrides, as in rich)."""
+    import shutil
+
+    return shutil.get_terminal_size().columns
+
+
+def render_key(source_file: str, width: int, *parts: Any) -> str:
+    """Key of one render: the script (its code draws the table), width, colour env and ``parts``."""
+    st = os.stat(source_file)
+    colors = tuple(os.environ.get(name, "") for name in COLOR_ENV)
+    identity = (st.st_mtime_ns, st.st_size, width, colors, parts)
+    return snapshot.source_hash(repr(identity).encode())
+
+
+def get(key: str) -> Optional[bytes]:
+    """Cached output for ``key``, marking it recently used; None on a miss."""
+    path = os.path.join(render_dir(), f"{key}.ansi")
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)
+    except OSError:
+        return None
+    return data
+
+
+def put(key: str, data: bytes) -> None:
+    """Store output for ``key``, evicting least recently used renders over MAX_BYTES."""
+    directory = render_dir()
+    path = os.path.join(directory, f"{key}.ansi")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        evict(directory)
+    except OSError:
+        pass  # A read-only cache only costs the next run a render
+
+
+def evict(directory: str, max_bytes: int = MAX_BYTES) -> None:
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".ansi"):
+                st = entry.stat()
+                entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.unlink(path)
+        total -= size
+
+
+def cached_render(
+    source_file: str,
+    parts: tuple,
+    render: Callable[[int, Callable[[bytes], None]], None],
+    write: Callable[[bytes], None],
+) -> None:
+    """Write the output of ``render(width, write)`` for the current terminal.
+
+    A hit is written as is; on a miss the render streams to ``write`` as it
+    is produced and is stored once complete.
+    """
+    width = terminal_width()
+    key = render_key(source_file, width, *parts)
+    data = get(key)
+    if data is not None:
+        write(data)
+        return
+
+    chunks: list[bytes] = []
+
+    def tee(chunk: bytes) -> None:
+        chunks.append(chunk)
+        write(chunk)
+
+    render(width, tee)
+    put(key, b"".join(chunks))
@@ -0,0 +1,405 @@
+"""
+Fuzzy search over catalog records for the TUIs and --search.
+
+A query matches a record when it is a subsequence of one of its fields
+("gcb" finds "git checkout -b"); fields are matched lowercased, and never
+across a field boundary. Matches are ranked in tiers, each better than
+every match of the next:
+
+  exact     a whole field equals the query, the name before other fields
+  prefix    a field starts with the query, the name before other fields
+  word      the query occurs contiguously at the start of a word
+  substring the query occurs contiguously anywhere
+  initials  every query character starts a word ("gcb", "dcu")
+  scattered any other subsequence
+
+Within the exact and prefix tiers records keep catalog order (their
+fzf-style scores are equal); within the others they are ordered by score,
+rewarding consecutive and word-start characters and matches in the name.
+
+The lowercased fields of every record are joined into one text, framed by
+a separator no query can contain, so exact and prefix matches are
+substrings of it. A trigram inverted index maps each three-character
+sequence to the records containing it: a query of three or more
+characters only checks the records in every one of its trigrams' posting
+lists for the contiguous tiers, and only those candidates are scored.
+Scattered matches are looked for only when the contiguous tiers do not
+fill the page, among the records whose 64-bit character mask covers the
+query's, which rules out most records before any string is searched. The
+page is the best ``limit`` candidates over every tier, selected with a
+heap in O(N log k). Building the postings is the expensive part, so callers
+pass a cache tag and the index is snapshotted per catalog.
+
+One record more than the page is collected, so callers know whether the
+page holds every match (``Results.truncated``).
+"""
+
+import heapq
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Sequence
+
+from foxden import snapshot
+from foxden.catalog import Record
+
+FIELD_SEPARATOR = "\0"
+
+# Delay before a search-as-you-type query runs; each keystroke restarts it
+DEFAULT_DEBOUNCE_MS = 120
+
+# Bump when the snapshotted index layout changes
+SEARCH_VERSION = 1
+
+# Ranked results returned by FuzzyIndex.rank unless asked otherwise
+DEFAULT_LIMIT = 100
+
+# fzf's scoring constants: every matched character is worth SCORE_MATCH,
+# gaps inside the match cost, and characters starting a word earn a bonus
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = SCORE_MATCH // 2
+BONUS_NON_WORD = SCORE_MATCH // 2
+BONUS_CONSECUTIVE = -(SCORE_GAP_START + SCORE_GAP_EXTENSION)
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+
+# Whole-field bonuses on top of fzf's, so "gbd" ranks the gbd alias above gbdd
+BONUS_PREFIX = 2 * SCORE_MATCH
+BONUS_EXACT = 4 * SCORE_MATCH
+BONUS_NAME = SCORE_MATCH
+
+
+def search_debounce() -> float:
+    """TUI search debounce in seconds ($FOXDEN_SEARCH_DEBOUNCE_MS overrides)."""
+    try:
+        return int(os.environ.get("FOXDEN_SEARCH_DEBOUNCE_MS", DEFAULT_DEBOUNCE_MS)) / 1000
+    except ValueError:
+        return DEFAULT_DEBOUNCE_MS / 1000
+
+
+def _bonus(previous: str, char: str) -> int:
+    if not char.isalnum():
+        return BONUS_NON_WORD
+    return BONUS_BOUNDARY if not previous.isalnum() else 0
+
+
+def fuzzy_score(query: str, text: str) -> Optional[int]:
+    """fzf-style score of a lowercase query against a lowercase text, or None.
+
+    Like fzf's fast path, the match is the leftmost occurrence of the
+    subsequence tightened backwards to its shortest window, then scored.
+    """
+    end = 0
+    for char in query:
+        end = text.find(char, end) + 1
+        if not end:
+            return None
+    start = end
+    for char in reversed(query):
+        start = text.rfind(char, 0, start)
+
+    score = 0
+    consecutive = 0
+    first_bonus = 0
+    in_gap = False
+    matched = 0
+    previous = text[start - 1] if start else " "
+    for char in text[start:end]:
+        if matched < len(query) and char == query[matched]:
+            score += SCORE_MATCH
+            bonus = _bonus(previous, char)
+            if consecutive == 0:
+                first_bonus = bonus
+            else:
+                # A run keeps the bonus of the boundary it started on
+                if bonus >= BONUS_BOUNDARY and bonus > first_bonus:
+                    first_bonus = bonus
+                bonus = max(bonus, first_bonus, BONUS_CONSECUTIVE)
+            score += bonus * BONUS_FIRST_CHAR_MULTIPLIER if matched == 0 else bonus
+            in_gap = False
+            consecutive += 1
+            matched += 1
+        else:
+            score += SCORE_GAP_EXTENSION if in_gap else SCORE_GAP_START
+            in_gap = True
+            consecutive = 0
+            first_bonus = 0
+        previous = char
+
+    if text == query:
+        score += BONUS_EXACT
+    elif start == 0 and end == len(query):
+        score += BONUS_PREFIX
+    return score
+
+
+# FuzzyIndex tiers, best first
+TIER_EXACT_NAME, TIER_EXACT, TIER_PREFIX_NAME, TIER_PREFIX, TIER_WORD, TIER_SUBSTRING, TIER_INITIALS, TIER_SCATTERED = range(8)
+
+# Nothing alphanumeric before an atom: it starts a word. Checked after the atom
+# rather than before it, so the regex engine can still search for its literal
+WORD_START = r"(?<![^\W_]{})"
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def char_mask(text: str) -> int:
+    """Bitmask of the characters in ``text``, folded into 64 bits.
+
+    Folding makes collisions possible, so the mask can only rule a record
+    out: a query whose mask is not covered cannot be a subsequence.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _subsequence_pattern(query: str, initials: bool) -> "re.Pattern[str]":
+    """Regex for ``query`` as a subsequence of one field, leftmost-first.
+
+    The gap before each character possessively skips everything that is
+    not that character, so a record is checked in linear time. With
+    ``initials``, alphanumeric characters must also start a word.
+    """
+    parts = []
+    for i, char in enumerate(query):
+        atom = re.escape(char)
+        if initials and char.isalnum():
+            atom += WORD_START.format(atom)
+        if i:
+            parts.append(f"(?:(?!{atom})[^{FIELD_SEPARATOR}])*+")
+        parts.append(atom)
+    return re.compile("".join(parts))
+
+
+class Results(list):
+    """Ranked records, best first; ``truncated`` when more records matched."""
+
+    __slots__ = ("truncated",)
+
+    def __init__(self, records: Iterable[Record] = (), truncated: bool = False):
+        super().__init__(records)
+        self.truncated = truncated
+
+
+def count_label(results: list) -> str:
+    """How many results there are, as "top N" when the page was cut short."""
+    return f"top {len(results)}" if getattr(results, "truncated", False) else str(len(results))
+
+
+class RecordIndex:
+    """Records addressed by position."""
+
+    __slots__ = ("records",)
+
+    def __init__(self, records: Sequence[Record]):
+        self.records = list(records)
+
+    def select(self, positions: Iterable[int], category: Optional[Any] = None) -> list[Record]:
+        records = self.records
+        matches = [records[position] for position in positions]
+        if category is not None:
+            matches = [record for record in matches if record.category == category]
+        return matches
+
+
+class FuzzyIndex(RecordIndex):
+    """Tiered subsequence matching over lowercased record fields.
+
+    With ``cache_tag``, the lowercased text, character masks and trigram
+    postings are snapshotted under that tag, keyed by the records' fields.
+    """
+
+    __slots__ = ("texts", "masks", "postings")
+
+    def __init__(self, records: Sequence[Record], cache_tag: Optional[str] = None):
+        super().__init__(records)
+        if cache_tag is None:
+            index = self._build()
+        else:
+            source = "\n".join(
+                [str(SEARCH_VERSION), *(FIELD_SEPARATOR.join(record.entry) for record in self.records)]
+            )
+            index = snapshot.load(cache_tag, source.encode("utf-8", "surrogatepass"), self._build)
+        self.texts = index["texts"]
+        self.masks = index["masks"]
+        self.postings = index["postings"]
+
+    def _build(self) -> dict:
+        # Every field is framed by FIELD_SEPARATOR, so exact and prefix matches
+        # are substrings of the text
+        texts = [
+            FIELD_SEPARATOR + FIELD_SEPARATOR.join(record.entry).lower() + FIELD_SEPARATOR
+            for record in self.records
+        ]
+        postings: dict[str, list[int]] = {}
+        for position, text in enumerate(texts):
+            for gram in trigrams(text):
+                postings.setdefault(gram, []).append(position)
+        return {"texts": texts, "masks": [char_mask(text) for text in texts], "postings": postings}
+
+    def score(self, position: int, query: str) -> int:
+        """Best score of a lowercase query over one record's fields; names weigh most."""
+        best = 0
+        for i, field in enumerate(self.texts[position][1:-1].split(FIELD_SEPARATOR)):
+            score = fuzzy_score(query, field)
+            if score is not None:
+                best = max(best, score + (BONUS_NAME if i == 0 else 0))
+        return best
+
+    def _masked(self, query: str, positions: Optional[list[int]] = None) -> list[int]:
+        """The positions (default all) whose character mask covers a lowercase query's."""
+        query_mask = char_mask(query)
+        masks = self.masks
+        if positions is None:
+            return [position for position, mask in enumerate(masks) if not query_mask & ~mask]
+        return [position for position in positions if not query_mask & ~masks[position]]
+
+    def _contiguous(self, query: str) -> list[int]:
+        """Positions of records with a field containing a lowercase query."""
+        texts = self.texts
+        if len(query) < 3:
+            return [position for position in self._masked(query) if query in texts[position]]
+
+        # Intersect from the shortest posting list; an unknown trigram means no match
+        lists = sorted((self.postings.get(gram, ()) for gram in trigrams(query)), key=len)
+        if not lists[0]:
+            return []
+        candidates = set(lists[0]).intersection(*lists[1:])
+        return [position for position in candidates if query in texts[position]]
+
+    def positions(
+        self,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+        category: Optional[Any] = None,
+        within: Optional[Iterable[int]] = None,
+    ) -> tuple[tuple[int, ...], bool]:
+        """Positions of the ``limit`` best matches of a lowercase query, and whether more matched.
+
+        ``within`` restricts the search to the given positions, which must
+        include every match (the complete results of a shorter query).
+        """
+        if not query or FIELD_SEPARATOR in query:
+            return (), False
+        texts, records = self.texts, self.records
+        if within is not None:
+            within = self._masked(query, list(within))
+            contiguous = [position for position in within if query in texts[position]]
+        else:
+            contiguous = self._contiguous(query)
+        if category is not None:
+            contiguous = [position for position in contiguous if records[position].category == category]
+        want = limit + 1
+
+        # Keys are (-tier, score, -position), so the best match is the largest.
+        # Exact and prefix matches need no score, and fill most pages alone
+        field = FIELD_SEPARATOR + query + FIELD_SEPARATOR
+        start = FIELD_SEPARATOR + query
+        ranked = []
+        rest = []
+        for position in contiguous:
+            text = texts[position]
+            if start not in text:
+                rest.append(position)
+            elif text.startswith(field):
+                ranked.append((-TIER_EXACT_NAME, 0, -position))
+            elif field in text:
+                ranked.append((-TIER_EXACT, 0, -position))
+            elif text.startswith(start):
+                ranked.append((-TIER_PREFIX_NAME, 0, -position))
+            else:
+                ranked.append((-TIER_PREFIX, 0, -position))
+
+        if len(ranked) < want:
+            word = re.escape(query)
+            if query[0].isalnum():  # A non-word first character scores as a word start anyway
+                word += WORD_START.format(word)
+            word_pattern = re.compile(word)
+            for position in rest:
+                tier = TIER_WORD if word_pattern.search(texts[position]) else TIER_SUBSTRING
+                ranked.append((-tier, self.score(position, query), -position))
+
+        if len(ranked) < want:
+            contiguous = set(contiguous)
+            pattern = _subsequence_pattern(query, initials=False)
+            initials = _subsequence_pattern(query, initials=True)
+            for position in self._masked(query) if within is None else within:
+                if position in contiguous or (category is not None and records[position].category != category):
+                    continue
+                text = texts[position]
+                if pattern.search(text):
+                    tier = TIER_INITIALS if initials.search(text) else TIER_SCATTERED
+                    ranked.append((-tier, self.score(position, query), -position))
+
+        positions = [-position for _, _, position in heapq.nlargest(want, ranked)]
+        return tuple(positions[:limit]), len(positions) > limit
+
+    def search(
+        self, query: str, category: Optional[Any] = None, limit: int = DEFAULT_LIMIT
+    ) -> Results:
+        """Ranked matches for ``query``, optionally within one category."""
+        positions, truncated = self.positions(query.lower(), limit, category)
+        return Results(self.select(positions), truncated)
+
+
+class IncrementalSearch:
+    """FuzzyIndex front end for search-as-you-type.
+
+    Pages are kept per query and category in a bounded LRU, so backspacing
+    or retyping a query is a dictionary hit. A query containing the
+    previous one (typing "kub" then "kube") can only match a subset of its
+    matches; when the previous page held all of them, the new page is
+    ranked among those records instead of the whole catalog.
+
+    Safe to call from worker threads; searches are serialised.
+    """
+
+    def __init__(self, index: FuzzyIndex, cache_size: int = 256):
+        self.index = index
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple, tuple[tuple[int, ...], bool]] = OrderedDict()
+        self._last: Optional[tuple] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.narrowed = 0
+        self.misses = 0
+
+    def _positions(self, query: str, category: Optional[Any], limit: int) -> tuple[tuple[int, ...], bool]:
+        key = (query, category, limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            last = self._last
+            if last is not None and last[0] and last[0] in query and last[1:3] == key[1:] and not last[4]:
+                self.narrowed += 1
+                cached = self.index.positions(query, limit, category, within=last[3])
+            else:
+                self.misses += 1
+                cached = self.index.positions(query, limit, category)
+            self._cache[key] = cached
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        self._last = (*key, *cached)
+        return cached
+
+    def rank(
+        self, query: str, category: Optional[Any] = None, limit: int = DEFAULT_LIMIT
+    ) -> Results:
+        """Same results as FuzzyIndex.search, reusing earlier work where possible."""
+        with self._lock:
+            positions, truncated = self._positions(query.lower(), category, limit)
+        return Results(self.index.select(positions), truncated)
+
+    def stats(self) -> str:
+        return (
+            f"{self.hits} hits, {self.narrowed} narrowed, {self.misses} full searches, "
+            f"{len(self._cache)}/{self.cache_size} cached"
+        )
@@ -0,0 +1,219 @@
+"""
+Where an interactive zsh spends its startup.
+
+``profile`` starts ``zsh -i -c exit`` repeatedly with xtrace on from the
+first line of .zshenv. A throwaway ZDOTDIR holds a .zshenv that sets a
+timestamped PS4, sends the trace to a file, points ZDOTDIR back at the
+real config and sources the real .zshenv, so .zshrc and everything it
+sources run unchanged.
+
+Every trace line carries a microsecond timestamp, the file the code comes
+from (%x), its line there (%I) and the running function (%N). A line is
+charged the time until the next one, and lines are grouped into items: a
+file, split into its banner sections (the ``####`` blocks of zsh/.aliases)
+and the functions defined in it. xtrace is used rather than zprof because
+zprof only sees functions, while alias definitions are top-level lines.
+
+Tracing slows the shell down, so untraced runs are timed as well and the
+report gives both.
+"""
+
+import os
+from typing import Optional
+
+from foxden.ingest import BANNER_PATTERN
+
+DEFAULT_RUNS = 20
+
+# Share of the traced time the flagged items add up to
+HOT_SHARE = 0.8
+
+# Separators of the trace fields; neither shows up in shell code
+EVENT_MARK = "\x1e"
+FIELD_MARK = "\x1f"
+
+# Item for the time between exec and the first traced line
+STARTUP_ITEM = ("zsh", "(before .zshenv)")
+
+TOP_LEVEL = "(top level)"
+
+ZSHENV_TEMPLATE = """\
+PS4=$'\\x1e%D{{%s.%6.}}\\x1f%x\\x1f%I\\x1f%N\\x1f'
+exec 2>>"$FOXDEN_TRACE"
+{restore_zdotdir}
+setopt xtrace
+[[ -r "${{ZDOTDIR:-$HOME}}/.zshenv" ]] && source "${{ZDOTDIR:-$HOME}}/.zshenv"
+"""
+
+Item = tuple[str, str]
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (``q`` in 0..1) of a non-empty list."""
+    import math
+
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def display_path(path: str) -> str:
+    home = os.path.expanduser("~")
+    return "~" + path[len(home):] if path.startswith(home + os.sep) else path
+
+
+def section_labels(path: str) -> list[str]:
+    """Banner section of each line of a file ("" before the first banner)."""
+    import re
+
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
+    labels = []
+    section = ""
+    in_banner = False
+    for line in lines:
+        if re.match(BANNER_PATTERN, line):
+            in_banner = not in_banner
+        elif in_banner:
+            section = line.lstrip("#").strip() or section
+        labels.append(section)
+    return labels
+
+
+class TraceParser:
+    """Turns xtrace output into seconds per item, remembering each item's costliest line."""
+
+    __slots__ = ("skip", "labels", "line_costs")
+
+    def __init__(self, skip: str):
+        self.skip = skip  # The wrapper .zshenv
+        self.labels: dict[str, list[str]] = {}
+        self.line_costs: dict[tuple[Item, str, int], float] = {}
+
+    def item(self, path: str, line: int, function: str) -> Item:
+        if os.path.basename(function) != os.path.basename(path):
+            return display_path(path), f"{function}()"
+        labels = self.labels.get(path)
+        if labels is None:
+            labels = self.labels[path] = section_labels(path)
+        section = labels[line - 1] if 0 < line <= len(labels) else ""
+        return display_path(path), section or TOP_LEVEL
+
+    def parse(self, trace: str, started: float) -> dict[Item, float]:
+        events = []
+        for chunk in trace.split(EVENT_MARK)[1:]:
+            fields = chunk.split(FIELD_MARK, 4)
+            if len(fields) < 4:
+                continue  # Not a trace line (stderr of a command)
+            try:
+                events.append((float(fields[0]), fields[1], int(fields[2] or 0), fields[3]))
+            except ValueError:
+                continue
+
+        costs: dict[Item, float] = {}
+        if events:
+            costs[STARTUP_ITEM] = max(0.0, events[0][0] - started)
+        for (stamp, path, line, function), (following, *_) in zip(events, events[1:]):
+            if path == self.skip:
+                continue
+            item = self.item(path, line, function)
+            cost = max(0.0, following - stamp)
+            costs[item] = costs.get(item, 0.0) + cost
+            key = (item, path, line)
+            self.line_costs[key] = self.line_costs.get(key, 0.0) + cost
+        return costs
+
+    def hottest_line(self, item: Item) -> Optional[tuple[str, int]]:
+        lines = [(cost, path, line) for (key, path, line), cost in self.line_costs.items() if key == item]
+        if not lines:
+            return None
+        _, path, line = max(lines)
+        return path, line
+
+
+def line_text(path: str, line: int) -> str:
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for number, text in enumerate(f, 1):
+                if number == line:
+                    return text.strip()
+    except OSError:
+        pass
+    return ""
+
+
+def profile(runs: int = DEFAULT_RUNS, shell: str = "zsh") -> dict:
+    """Profile ``runs`` interactive startups of ``shell``.
+
+    Returns ``startup`` and ``traced`` as (p50, p95) seconds, ``files`` as
+    ``(file, p50, p95)`` and ``items`` as ``(file, block, p50, p95, hot,
+    hottest line)`` tuples, costliest first. Raises FileNotFoundError when
+    the shell is not installed.
+    """
+    import shlex
+    import shutil
+    import subprocess
+    import tempfile
+    import time
+
+    executable = shutil.which(shell)
+    if executable is None:
+        raise FileNotFoundError(shell)
+    command = [executable, "-i", "-c", "exit"]
+
+    untraced = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        untraced.append(time.perf_counter() - started)
+
+    real_zdotdir = os.environ.get("ZDOTDIR")
+    restore = f"ZDOTDIR={shlex.quote(real_zdotdir)}" if real_zdotdir else "unset ZDOTDIR"
+    samples: list[dict[Item, float]] = []
+    traced = []
+    with tempfile.TemporaryDirectory(prefix="foxden-zsh-") as zdotdir:
+        zshenv = os.path.join(zdotdir, ".zshenv")
+        with open(zshenv, "w", encoding="utf-8") as f:
+            f.write(ZSHENV_TEMPLATE.format(restore_zdotdir=restore))
+        trace_file = os.path.join(zdotdir, "trace")
+        parser = TraceParser(zshenv)
+        env = dict(os.environ, ZDOTDIR=zdotdir, FOXDEN_TRACE=trace_file)
+        for _ in range(runs):
+            open(trace_file, "w").close()
+            started = time.time()
+            subprocess.run(command, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            traced.append(time.time() - started)
+            with open(trace_file, encoding="utf-8", errors="replace") as f:
+                samples.append(parser.parse(f.read(), started))
+
+    files = []
+    for path in {path for path, _ in set().union(*samples)}:
+        values = [sum(cost for (file, _), cost in sample.items() if file == path) for sample in samples]
+        files.append((path, percentile(values, 0.5), percentile(values, 0.95)))
+    files.sort(key=lambda row: -row[1])
+
+    items = []
+    for item in set().union(*samples):
+        values = [sample.get(item, 0.0) for sample in samples]
+        items.append((item, percentile(values, 0.5), percentile(values, 0.95)))
+    items.sort(key=lambda row: -row[1])
+
+    total = sum(p50 for _, p50, _ in items)
+    rows = []
+    running = 0.0
+    for (path, block), p50, p95 in items:
+        hot = running < HOT_SHARE * total  # The costliest items up to HOT_SHARE of the total
+        running += p50
+        hottest = parser.hottest_line((path, block))
+        where = f"{display_path(hottest[0])}:{hottest[1]}  {line_text(*hottest)}" if hottest else ""
+        rows.append((path, block, p50, p95, hot, where))
+
+    return {
+        "runs": runs,
+        "startup": (percentile(untraced, 0.5), percentile(untraced, 0.95)),
+        "traced": (percentile(traced, 0.5), percentile(traced, 0.95)),
+        "files": files,
+        "items": rows,
+    }
@@ -0,0 +1,134 @@
+"""
+Precompiled snapshots in the user cache directory.
+
+Derived data (catalog indexes, parsed config files, ...) is built once,
+marshalled into the cache directory and memory-mapped on later runs.
+Snapshots are keyed by a hash of the source they were built from, so
+editing the source (or moving to a Python with a different marshal format)
+rebuilds them automatically.
+
+Files read on every run (live config parsed by foxden.ingest) are tracked
+by stat instead: an unchanged mtime, size and inode answers from the cache
+without reading the file, and a changed stat only rebuilds when the
+contents hash differs too.
+"""
+
+import marshal
+import mmap
+import os
+from hashlib import blake2b
+from typing import Any, Callable, Optional
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+
+
+def cache_dir() -> str:
+    """Return the foxden directory under $XDG_CACHE_HOME (default ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "foxden")
+
+
+def source_hash(*sources: bytes) -> str:
+    """Hash snapshot sources together with the layout and marshal versions."""
+    digest = blake2b(digest_size=16)
+    digest.update(f"{SNAPSHOT_VERSION}:{marshal.version}".encode())
+    for source in sources:
+        digest.update(len(source).to_bytes(8, "little"))
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def read(path: str) -> Any:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return marshal.loads(mm)
+
+
+def write(path: str, data: Any) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            marshal.dump(data, f)
+        os.replace(tmp, path)  # Atomic, so concurrent readers never see half a file
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def load(tag: str, source: bytes, build: Callable[[], Any]) -> Any:
+    """Return the snapshot for ``source``, building and caching it on a miss."""
+    directory = cache_dir()
+    name = f"{tag}-{source_hash(source)}.marshal"
+    path = os.path.join(directory, name)
+    try:
+        return read(path)
+    except (OSError, ValueError, EOFError, TypeError):
+        pass  # Missing, empty or corrupt: rebuild below
+
+    data = build()
+    try:
+        write(path, data)
+        for entry in os.listdir(directory):
+            if entry.startswith(f"{tag}-") and entry.endswith(".marshal") and entry != name:
+                os.unlink(os.path.join(directory, entry))
+    except OSError:
+        pass  # Read-only cache dir: still answer from the fresh build
+    return data
+
+
+def load_for_file(
+    tag: str, source_file: str, build: Callable[[], Any], extra: bytes = b""
+) -> Any:
+    """Snapshot keyed by the contents of ``source_file`` (plus ``extra``)."""
+    with open(source_file, "rb") as f:
+        return load(tag, f.read() + extra, build)
+
+
+def file_stamp(path: str) -> Optional[tuple[int, int, int]]:
+    """``(mtime_ns, size, inode)`` of a file, or None if it is missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def load_tracked(
+    tag: str, path: str, build: Callable[[bytes], Any], salt: bytes = b""
+) -> tuple[str, Any]:
+    """Return ``(contents hash, build(contents))`` for a file that may change at any time.
+
+    ``salt`` identifies the builder (bump it when the parser changes). A
+    missing file reads as empty.
+    """
+    cache = os.path.join(cache_dir(), f"{tag}.marshal")
+    stamp = file_stamp(path)
+    try:
+        cached = read(cache)
+        if cached["salt"] != salt:
+            cached = None
+    except (OSError, ValueError, EOFError, TypeError, KeyError):
+        cached = None
+    if cached is not None and cached["stamp"] == stamp:
+        return cached["hash"], cached["data"]
+
+    contents = b""
+    if stamp is not None:
+        try:
+            with open(path, "rb") as f:
+                contents = f.read()
+        except OSError:
+            stamp = None
+    digest = source_hash(salt, contents)
+    if cached is not None and cached["hash"] == digest:
+        data = cached["data"]  # Touched but unchanged: keep the parse, refresh the stamp
+    else:
+        data = build(contents)
+    try:
+        write(cache, {"stamp": stamp, "salt": salt, "hash": digest, "data": data})
+    except OSError:
+        pass
+    return digest, data
+
@@ -0,0 +1,155 @@
+"""
+How often aliases are run, counted from the zsh history file.
+
+History files grow to hundreds of MB, so they are never re-read in full.
+The file is memory-mapped and parsed in chunks, and the counts are stored
+with a checkpoint: the byte offset reached and the bytes just before it
+(the anchor). The next run verifies the anchor and only parses what was
+appended since.
+
+zsh rewrites the file when it trims history to SAVEHIST, which moves
+everything. The anchor is then searched for in the new file and counting
+resumes right after it, so counts keep accumulating across trims. When
+the anchor is gone too (the file was truncated or replaced), there is no
+telling which entries were already counted: the stored counts are dropped
+and the whole file is counted afresh.
+
+Extended history lines look like ``: 1700000000:0;git status``; plain
+lines are the command itself. Every line of a multi-line entry (a loop
+body, say) starts a command too. Only the command word of each pipeline
+segment is counted, plus ``git NAME`` pairs so git config aliases can be
+ranked. Quoted strings, escaped characters and fd redirections (``2>&1``)
+are blanked out first, so a ``;``, ``|`` or ``&`` inside them does not
+start a command.
+"""
+
+import os
+from typing import Optional
+
+from foxden import snapshot
+
+CACHE_NAME = "usage.marshal"
+
+# Bump when counting changes, so stored counts are rebuilt from scratch
+USAGE_VERSION = 2
+
+# Bytes of history parsed per slice of the mapping
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Bytes before the checkpoint that identify it in a rewritten file
+ANCHOR_SIZE = 1024
+
+# Commands whose first argument names a subcommand alias (`git l`)
+COMPOUND_COMMANDS = (b"git",)
+
+# Prefixes that run the next word as the command
+PREFIX_WORDS = (b"sudo", b"command", b"builtin", b"noglob", b"nocorrect", b"time", b"exec")
+
+# A command position (line start, after the extended-history prefix or a
+# separator), its word and the word after it
+COMMAND_PATTERN = rb"(?:^(?:: \d+:\d+;)?|&&|\|\||[;|&])[ \t]*([^\s;|&]+)(?:[ \t]+([^\s;|&]+))?"
+
+# Spans whose separators do not start a command: single- and double-quoted
+# strings (on one line), escaped characters, and redirections such as
+# 2>&1, <&3, >&- and &>file
+NOISE_PATTERN = rb"'[^'\n]*'|\"(?:[^\"\\\n]|\\.)*\"|\\.|\d*[<>]&(?:\d+|-)?|&>"
+
+
+def history_file() -> str:
+    """$HISTFILE, defaulting to ~/.zsh_history."""
+    return os.environ.get("HISTFILE") or os.path.join(os.path.expanduser("~"), ".zsh_history")
+
+
+def count_lines(data: bytes, counts: dict[bytes, int]) -> None:
+    """Add the commands run in ``data`` (complete lines) to ``counts``.
+
+    The regex and Counter do the per-line work in C; Python only sees
+    each distinct (command, next word) pair once.
+    """
+    import re
+    from collections import Counter
+
+    data = re.sub(NOISE_PATTERN, b" ", data)
+    pairs = Counter(re.findall(COMMAND_PATTERN, data, re.M))
+    for (word, following), runs in pairs.items():
+        if word in PREFIX_WORDS or (b"=" in word and not word.startswith(b"=")):
+            word, following = following, b""  # sudo, VAR=value: the next word runs
+            if not word:
+                continue
+        counts[word] = counts.get(word, 0) + runs
+        if following and word in COMPOUND_COMMANDS:
+            pair = word + b" " + following
+            counts[pair] = counts.get(pair, 0) + runs
+
+
+def resume_offset(mm, state: Optional[dict]) -> Optional[int]:
+    """Where to continue counting in the mapped history, given the last checkpoint.
+
+    None when the checkpoint is not in the file any more, so the stored
+    counts no longer match it.
+    """
+    if not state:
+        return 0
+    offset, anchor = state["offset"], state["anchor"]
+    if offset <= len(mm) and mm[offset - len(anchor):offset] == anchor:
+        return offset  # Appended to (or untouched)
+    position = mm.rfind(anchor) if anchor else -1
+    return position + len(anchor) if position >= 0 else None
+
+
+def load_state(cache_file: str, path: str) -> Optional[dict]:
+    try:
+        state = snapshot.read(cache_file)
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != USAGE_VERSION or state.get("path") != path:
+        return None
+    return state
+
+
+def scan(path: Optional[str] = None) -> dict[bytes, int]:
+    """Command word → run count over the whole history, reading only what is new."""
+    import mmap
+
+    path = path or history_file()
+    cache_file = os.path.join(snapshot.cache_dir(), CACHE_NAME)
+    state = load_state(cache_file, path)
+    counts: dict[bytes, int] = state["counts"] if state else {}
+
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return counts
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return counts  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = resume_offset(mm, state)
+            if start is None:
+                # Surviving entries were counted already: recount everything instead
+                counts = {}
+                start = 0
+            end = mm.rfind(b"\n", start) + 1  # A last line without newline may still be written
+            if end <= start:
+                return counts
+            position = start
+            while position < end:
+                stop = min(position + CHUNK_SIZE, end)
+                if stop < end:
+                    stop = mm.rfind(b"\n", position, stop) + 1 or mm.find(b"\n", stop) + 1
+                count_lines(mm[position:stop], counts)
+                position = stop
+            anchor = mm[max(0, end - ANCHOR_SIZE):end]
+
+    new_state = {
+        "version": USAGE_VERSION,
+        "path": path,
+        "offset": end,
+        "anchor": anchor,
+        "counts": counts,
+    }
+    try:
+        snapshot.write(cache_file, new_state)
+    except OSError:
+        pass
+    return counts
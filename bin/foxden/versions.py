@@ -0,0 +1,136 @@
+"""
+Installed versions from every package manager, collected in one pass.
+
+Each group is answered by one bulk listing (``brew list --versions``,
+``uv tool list``, ``cargo install --list``, ...) instead of one query per
+tool. The listings run concurrently as asyncio subprocesses, so a full
+table costs about as long as the slowest manager. Rows are:
+
+  (group, name, version)
+
+Managers are looked up on $PATH when they run; a missing one contributes
+no rows, which also makes the collector easy to exercise with fake
+``brew``/``uv``/``cargo`` scripts on PATH.
+"""
+
+import os
+from typing import Callable, Iterable, Optional
+
+Row = tuple[str, str, str]
+Parser = Callable[[str], list[tuple[str, str]]]
+
+# Display order of the groups, as accepted by `tools --versions GROUP`
+GROUPS = ("brew", "cask", "uv", "cargo", "git", "other")
+
+# Global npm packages worth listing; npm itself and corepack are noise
+NPM_TOOLS = ("n",)
+
+# Plugin checkouts versioned by commit, relative to $HOME
+GIT_REPOS = {
+    "tpm": os.path.join(".tmux", "plugins", "tpm"),
+    "yazi-flavors": os.path.join(".config", "yazi", "flavors"),
+}
+
+SNOWSQL = "/Applications/SnowSQL.app/Contents/MacOS/snowsql"
+
+
+def parse_listing(text: str) -> list[tuple[str, str]]:
+    """``name version ...`` lines (brew, uv); a leading "v" is dropped."""
+    pairs = []
+    for line in text.splitlines():
+        fields = line.split()
+        if len(fields) < 2 or line.startswith("-"):
+            continue  # uv lists each tool's executables as "- name"
+        pairs.append((fields[0], fields[1].removeprefix("v")))
+    return pairs
+
+
+def parse_cargo(text: str) -> list[tuple[str, str]]:
+    """``name vX.Y.Z:`` lines of ``cargo install --list``; binaries are indented."""
+    pairs = []
+    for line in text.splitlines():
+        if not line or line[0].isspace():
+            continue
+        name, _, rest = line.partition(" v")
+        version = rest.split(" ", 1)[0].rstrip(":")
+        if name and version:
+            pairs.append((name, version))
+    return pairs
+
+
+def parse_npm(text: str) -> list[tuple[str, str]]:
+    """``├── name@version`` lines of ``npm list -g --depth=0``, limited to NPM_TOOLS."""
+    pairs = []
+    for line in text.splitlines()[1:]:  # The first line is the prefix directory
+        name, _, version = line.rsplit(" ", 1)[-1].rpartition("@")
+        if name in NPM_TOOLS and version:
+            pairs.append((name, version))
+    return pairs
+
+
+def single(name: str, field: int = 0) -> Parser:
+    """Parser for a command that prints one version (``field`` picks the word)."""
+    def parse(text: str) -> list[tuple[str, str]]:
+        fields = text.split()
+        return [(name, fields[field])] if len(fields) > field else []
+    return parse
+
+
+def collectors(home: Optional[str] = None) -> list[tuple[str, list[str], Parser]]:
+    """``(group, argv, parser)`` for every listing, in display order."""
+    home = home or os.path.expanduser("~")
+    listings = [
+        ("brew", ["brew", "list", "--formula", "--versions"], parse_listing),
+        ("cask", ["brew", "list", "--cask", "--versions"], parse_listing),
+        ("uv", ["uv", "tool", "list"], parse_listing),
+        ("cargo", ["cargo", "install", "--list"], parse_cargo),
+    ]
+    for name, repo in GIT_REPOS.items():
+        repo = os.path.join(home, repo)
+        # Without the check git would answer for an enclosing repository
+        if os.path.isdir(os.path.join(repo, ".git")):
+            listings.append(("git", ["git", "-C", repo, "rev-parse", "--short", "HEAD"], single(name)))
+    listings += [
+        ("other", [os.path.join(home, ".bun", "bin", "bun"), "--version"], single("bun")),
+        ("other", ["npm", "list", "-g", "--depth=0"], parse_npm),
+        ("other", [SNOWSQL, "-v"], single("snowsql", 1)),
+    ]
+    return listings
+
+
+async def run_listing(argv: list[str]) -> str:
+    """Stdout of a command, or "" when it is not installed."""
+    import asyncio
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return ""
+    stdout, _ = await process.communicate()
+    return stdout.decode("utf-8", "replace")
+
+
+async def collect_async(groups: Optional[Iterable[str]] = None) -> list[Row]:
+    """Rows of the selected groups (all by default), listings run concurrently."""
+    import asyncio
+
+    wanted = set(groups or GROUPS)
+    selected = [item for item in collectors() if item[0] in wanted]
+    outputs = await asyncio.gather(*(run_listing(argv) for _, argv, _ in selected))
+    return [
+        (group, name, version)
+        for (group, _, parse), text in zip(selected, outputs)
+        for name, version in parse(text)
+    ]
+
+
+def collect(groups: Optional[Iterable[str]] = None) -> list[Row]:
+    """Synchronous collect_async for scripts."""
+    import asyncio
+
+    return asyncio.run(collect_async(groups))
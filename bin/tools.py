@@ -14,20 +14,39 @@ Mirrors the design of aliases.py for consistency.
 """
 
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Iterable, Optional
 import os
-import shutil
-import subprocess
-from io import StringIO
-
-import typer
-from rich.box import HEAVY, ROUNDED
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-console = Console()
-app = typer.Typer(help="Fox's Den - Explore your installed tools")
+import sys
+
+from foxden.catalog import Catalog, load_catalog
+from foxden.fastpath import (
+    parse_completion,
+    parse_json_args,
+    parse_plain_describe,
+    parse_plain_fts,
+    parse_plain_outdated,
+    parse_plain_search,
+    parse_plain_versions,
+    parse_terminal_all,
+    parse_terminal_show,
+    print_fields,
+    print_row,
+    quiet_broken_pipe,
+)
+from foxden.formats import Format, encode, found, not_found, read_names
+
+# rich, typer and textual are imported where they are used, so the plain
+# paths (--json, -d on a pipe, cached -s tables) stay fast enough for shell
+# hooks and tmux popups.
+
+
+@lru_cache(maxsize=None)
+def get_console():
+    """Shared rich console, created on first use."""
+    from rich.console import Console
+    return Console()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -225,102 +244,537 @@ TOOL_MAP = {
     Category.SYS: SYS_TOOLS,
 }
 
-ALL_TOOLS = sum(TOOL_MAP.values(), [])
+ALL_TOOLS = list(chain.from_iterable(TOOL_MAP.values()))
+
+# Executable a tool puts on PATH when it is not named after the tool; None
+# for GUI apps, which live in /Applications instead
+TOOL_COMMANDS = {
+    "neovim": "nvim",
+    "ripgrep": "rg",
+    "difftastic": "difft",
+    "httpie": "http",
+    "azure-cli": "az",
+    "coreutils": "gls",
+    "gnu-sed": "gsed",
+    "gnupg": "gpg",
+    "imagemagick": "magick",
+    "mermaid-cli": "mmdc",
+    "1password": "op",
+    "wireguard": "wg",
+    "raycast": None,
+    "cleanshot": None,
+    "shortcat": None,
+    "arc": None,
+    "alt-tab": None,
+    "lulu": None,
+    "aldente": None,
+}
+
+
+# Fields of an entry in external catalog files (see foxden.external)
+EXTERNAL_FIELDS = ("name", "description", "example")
+
+
+@lru_cache(maxsize=None)
+def get_local_catalog() -> Catalog:
+    """TOOL_MAP indexed for O(1) lookups, loaded from a snapshot keyed by this file."""
+    return load_catalog(
+        "tools",
+        __file__,
+        lambda: ((cat.value, tools) for cat, tools in TOOL_MAP.items()),
+        Category,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_external():
+    """Category files of a shared tool inventory, read per category (see foxden.external)."""
+    from foxden.external import ExternalCatalog
+    return ExternalCatalog(
+        "tools",
+        EXTERNAL_FIELDS,
+        (cat.value for cat in Category),
+        lambda: (record.name for record in get_local_catalog()),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_catalog() -> Catalog:
+    """TOOL_MAP plus every external category, for lookups and search.
+
+    Listings of one category go through category_entries instead, which
+    leaves the other external files unread.
+    """
+    external = get_external()
+    if not external:
+        return get_local_catalog()
+    digest, sections = external.sections()
+    return load_catalog(
+        "tools-external",
+        __file__,
+        lambda: chain(((cat.value, tools) for cat, tools in TOOL_MAP.items()), sections),
+        Category,
+        extra=digest.encode(),
+    )
+
+
+@lru_cache(maxsize=None)
+def category_entries(category: Category) -> list[tuple[str, str, str]]:
+    """One category's tools: TOOL_MAP's, then its external file alone."""
+    return list(TOOL_MAP[category]) + get_external().entries(category.value)
+
+
+def category_count(category: Category) -> int:
+    """Tools in a category, with external ones counted from the manifest if it is current."""
+    return len(TOOL_MAP[category]) + get_external().count(category.value)
+
+
+# Static zsh completion function, installed into a directory on $fpath
+COMPLETION_FILE = "_foxden_tools"
+
+# Listing marks for the installed-status column
+STATUS_MARKS = {True: "[green]✓[/]", False: "[red]✗[/]", None: "[dim]·[/]"}
+
+
+@lru_cache(maxsize=None)
+def get_path_index():
+    """Executables on $PATH, listed once per directory (see foxden.pathindex)."""
+    from foxden import pathindex
+    return pathindex.load()
+
+
+@lru_cache(maxsize=None)
+def get_lock_index() -> dict:
+    """Versions pinned in Brewfile.lock.json (see foxden.brewlock)."""
+    from foxden import brewlock
+    return brewlock.load()
+
+
+def lock_fields(name: str) -> dict:
+    """``locked_version`` and ``locked_kind`` of a tool for JSON records (None if not locked)."""
+    entry = get_lock_index().get(name)
+    return {
+        "locked_version": entry[1] if entry else None,
+        "locked_kind": entry[0] if entry else None,
+    }
+
+
+def tool_status(name: str) -> Optional[bool]:
+    """Whether a tool's executable is on PATH; None for GUI apps."""
+    command = TOOL_COMMANDS.get(name, name)
+    return None if command is None else command in get_path_index()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # RICH CLI OUTPUT
 # ═══════════════════════════════════════════════════════════════════════════
 
-def show_tools(category: Category, tools: list[tuple[str, str, str]]) -> None:
-    """Display a category of tools in a styled table with pagination if needed."""
+def tools_panel(category: Category, tools: list[tuple[str, str, str]], statuses: list):
+    """A category of tools as a styled table in a panel."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.table import Table
+
     icon, title, desc = CATEGORY_META[category]
-    
+
     table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
     table.add_column("Tool", style="cyan bold", no_wrap=True)
     table.add_column("Description", style="white")
     table.add_column("Example", style="green dim")
 
-    for name, description, example in tools:
+    for (name, description, example), status in zip(tools, statuses):
         table.add_row(
+            STATUS_MARKS[status],
             f"[cyan bold]{name}[/]",
             description,
             f"[green dim]{example}[/]"
         )
 
-    panel = Panel(
+    return Panel(
         table,
         title=f"[blue bold]{icon}  {title}[/]",
         subtitle=f"[dim]{desc}[/]",
         title_align="center",
         border_style="blue"
     )
-    
-    # Use pager if content exceeds terminal height and we're in a TTY
-    terminal_height = shutil.get_terminal_size().lines
-    estimated_lines = len(tools) * 2 + 6
-    
-    if estimated_lines > terminal_height and os.isatty(1):
-        string_io = StringIO()
-        temp_console = Console(file=string_io, force_terminal=True)
-        temp_console.print()
-        temp_console.print(panel)
-        temp_console.print()
-        output = string_io.getvalue()
-        
-        pager = subprocess.Popen(
-            ["less", "-R", "-S"],
-            stdin=subprocess.PIPE,
-            text=True
-        )
-        pager.communicate(input=output)
-    else:
+
+
+def render_tools(
+    category: Category,
+    tools: list[tuple[str, str, str]],
+    statuses: list,
+    width: int,
+    write: Callable[[bytes], None],
+) -> None:
+    """Stream the ANSI rendering of tools_panel at a given terminal width to ``write``."""
+    from rich.console import Console
+
+    from foxden.pager import TextSink
+
+    console = Console(file=TextSink(write), force_terminal=True, width=width)
+    console.print()
+    console.print(tools_panel(category, tools, statuses))
+    console.print()
+
+
+def write_tools(category: Category, tools: list[tuple[str, str, str]], out) -> None:
+    """Write a category's table to a foxden.pager.Pager, from the render cache when warm."""
+    from foxden import rendercache
+
+    statuses = [tool_status(name) for name, _, _ in tools]
+    rendercache.cached_render(
+        __file__,
+        (category.value, tools, statuses),
+        lambda width, write: render_tools(category, tools, statuses, width, write),
+        out.write,
+    )
+
+
+def show_tools(category: Category, tools: list[tuple[str, str, str]]) -> None:
+    """Display a category of tools in a styled table with pagination if needed.
+
+    On a terminal the rendering comes from foxden.rendercache, so a warm
+    run does not import rich.
+    """
+    if not sys.stdout.isatty():
+        statuses = [tool_status(name) for name, _, _ in tools]
+        console = get_console()
         console.print()
-        console.print(panel)
+        console.print(tools_panel(category, tools, statuses))
         console.print()
+        return
+
+    from foxden.pager import Pager
+
+    with Pager() as out:
+        write_tools(category, tools, out)
+
+
+def show_all_tools() -> None:
+    """Display every category, streamed to the pager one table at a time."""
+    if not sys.stdout.isatty():
+        for category in Category:
+            tools = category_entries(category)
+            if tools:
+                show_tools(category, tools)
+        return
+
+    from foxden.pager import Pager
+
+    with Pager() as out:
+        for category in Category:
+            if out.closed:
+                break  # The reader quit less: skip rendering (and loading) the rest
+            tools = category_entries(category)
+            if tools:
+                write_tools(category, tools, out)
 
 
 def show_category_tools(category: Category):
     """Display tools for a specific category."""
-    if category in TOOL_MAP:
-        show_tools(category, TOOL_MAP[category])
+    tools = category_entries(category)
+    if tools:
+        show_tools(category, tools)
 
 
 def show_tool_description(tool_name: str):
     """Show detailed description for a specific tool."""
-    for name, description, example in ALL_TOOLS:
-        if name == tool_name:
-            # Find which category this tool belongs to
-            cat_name = "Unknown"
-            for cat, tools in TOOL_MAP.items():
-                if any(t[0] == name for t in tools):
-                    icon, title, _ = CATEGORY_META[cat]
-                    cat_name = f"{icon}  {title}"
-                    break
-
-            main_table = Table(box=HEAVY, border_style="blue", show_header=False, width=80)
-            main_table.add_column("Key", style="cyan bold", width=15)
-            main_table.add_column("Value", style="white")
-
-            main_table.add_row("Tool", f"[cyan bold]{name}[/]")
-            main_table.add_row("Description", description)
-            main_table.add_row("Example", f"[green]{example}[/]")
-            main_table.add_row("Category", cat_name)
-
-            console.print()
-            console.print(Panel(main_table, title="[blue bold]Tool Details[/]", border_style="blue"))
-            console.print()
-            return
+    from rich.box import HEAVY
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
+    record = get_catalog().get(tool_name)
+    if record is None:
+        console.print(f"[red]Tool '{tool_name}' not found.[/]")
+        return
+
+    name, description, example = record.entry
+    icon, title, _ = CATEGORY_META[record.category]
+
+    main_table = Table(box=HEAVY, border_style="blue", show_header=False, width=80)
+    main_table.add_column("Key", style="cyan bold", width=15)
+    main_table.add_column("Value", style="white")
+
+    main_table.add_row("Tool", f"[cyan bold]{name}[/]")
+    main_table.add_row("Description", description)
+    main_table.add_row("Example", f"[green]{example}[/]")
+    main_table.add_row("Category", f"{icon}  {title}")
+    locked = get_lock_index().get(name)
+    if locked:
+        from foxden.brewlock import describe
+        main_table.add_row("Locked", describe(locked))
+
+    console.print()
+    console.print(Panel(main_table, title="[blue bold]Tool Details[/]", border_style="blue"))
+    console.print()
+
+
+def print_tool_plain(tool_name: str) -> None:
+    """Print a tool's details as plain text (pipes, fzf previews)."""
+    info = get_tool_json(tool_name)
+    if info is None:
+        print(f"Tool '{tool_name}' not found.")
+        return
+    rows = [
+        ("Tool", info["name"]),
+        ("Description", info["description"]),
+        ("Example", info["example"]),
+        ("Category", info["category_title"]),
+    ]
+    locked = get_lock_index().get(tool_name)
+    if locked:
+        from foxden.brewlock import describe
+        rows.append(("Locked", describe(locked)))
+    print_fields(rows)
+
+
+def search_tools(query: str, category: Optional[Category] = None) -> list:
+    """Tools matching ``query`` as a fuzzy subsequence, best match first."""
+    from foxden.search import FuzzyIndex
+
+    return FuzzyIndex(get_catalog(), "search-tools").search(query, category)
+
+
+def show_search_results(query: str, category: Optional[Category] = None) -> int:
+    """Display ranked search results in a styled table; returns the match count."""
+    from rich.box import ROUNDED
+    from rich.panel import Panel
+    from rich.markup import escape
+    from rich.table import Table
+
+    from foxden.search import count_label
+
+    console = get_console()
+    results = search_tools(query, category)
+    if not results:
+        console.print(f"[red]No tools match '{escape(query)}'.[/]")
+        return 0
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("", width=1, no_wrap=True)
+    table.add_column("Tool", style="cyan bold", no_wrap=True)
+    table.add_column("Description", style="white")
+    table.add_column("Example", style="green dim")
+
+    for record in results:
+        name, description, example = record.entry
+        icon = CATEGORY_META[record.category][0]
+        table.add_row(
+            STATUS_MARKS[tool_status(name)],
+            f"[cyan bold]{name}[/]",
+            f"{icon} {description}",
+            f"[green dim]{example}[/]",
+        )
+
+    console.print()
+    console.print(Panel(
+        table,
+        title=f"[blue bold]󰍉  {escape(query)}[/]",
+        subtitle=f"[dim]{count_label(results)} matches, best first[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+    console.print()
+    return len(results)
+
+
+def print_search_plain(query: str, category: Optional[Category] = None) -> int:
+    """Print ranked search results as tab-separated fields; returns the match count."""
+    results = search_tools(query, category)
+    for record in results:
+        print_row(record.entry)
+    return len(results)
+
+
+# Columns of the SQLite store besides name and category (see foxden.export)
+STORE_COLUMNS = ("description", "example", "locked_version")
+
+# Columns of its full-text index, name first
+INDEXED_COLUMNS = ("name", "description", "example")
+
+
+def catalog_files() -> list[str]:
+    """Every file the catalog and its records are built from, for the search store's sync key."""
+    from foxden.brewlock import lock_path
+    return [__file__, lock_path(), *get_external().paths()]
+
+
+def fulltext_search(query: str, category: Optional[Category] = None, marks: Optional[tuple[str, str]] = None) -> list[dict]:
+    """bm25-ranked word matches from the SQLite store, which is synced first if the catalog changed.
+
+    Raises sqlite3.Error when SQLite lacks FTS5.
+    """
+    from foxden import export, fts
+
+    path = export.default_output(export.ExportFormat.SQLITE, "tools")
+    fts.sync(path, fts.source_key(catalog_files()), iter_tool_json, STORE_COLUMNS, INDEXED_COLUMNS)
+    return fts.search(
+        path, query, INDEXED_COLUMNS, category.value if category else None, marks=marks or fts.PLAIN_MARKS
+    )
+
+
+def show_fulltext_results(query: str, category: Optional[Category] = None) -> int:
+    """Display full-text matches with their hits highlighted; returns the match count."""
+    import sqlite3
+
+    from rich.box import ROUNDED
+    from rich.markup import escape
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
+    try:
+        results = fulltext_search(query, category, marks=("\x02", "\x03"))
+    except sqlite3.Error as error:
+        console.print(f"[red]Full-text search unavailable: {escape(str(error))}[/]")
+        return 0
+    if not results:
+        console.print(f"[red]No tools match '{escape(query)}'.[/]")
+        return 0
+
+    def marked(text: str, style: str) -> str:
+        return f"[{style}]" + escape(text).replace("\x02", "[reverse]").replace("\x03", "[/reverse]") + "[/]"
+
+    table = Table(box=ROUNDED, border_style="blue", expand=True)
+    table.add_column("Tool", no_wrap=True)
+    table.add_column("Match")
+
+    for result in results:
+        icon = CATEGORY_META[Category(result["category"])][0]
+        table.add_row(marked(result["highlight"], "cyan bold"), f"{icon} " + marked(result["snippet"], "white"))
+
+    console.print()
+    console.print(Panel(
+        table,
+        title=f"[blue bold]󰍉  {escape(query)}[/]",
+        subtitle=f"[dim]{len(results)} matches, bm25 ranked[/]",
+        title_align="center",
+        border_style="blue"
+    ))
+    console.print()
+    return len(results)
+
+
+def print_fulltext_plain(query: str, category: Optional[Category] = None) -> int:
+    """Print full-text matches as name, description, example and snippet fields; returns the count."""
+    import sqlite3
+
+    try:
+        results = fulltext_search(query, category)
+    except sqlite3.Error as error:
+        print(f"Full-text search unavailable: {error}", file=sys.stderr)
+        return 0
+    for result in results:
+        print_row((result["name"], result["description"], result["example"], result["snippet"]))
+    return len(results)
+
+
+def unknown_version_groups(groups: list[str]) -> list[str]:
+    from foxden.versions import GROUPS
+    return [group for group in groups if group not in GROUPS]
+
+
+def show_versions(groups: list[str]) -> int:
+    """Display installed versions per package manager; returns the row count."""
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    from foxden import versions
+
+    console = get_console()
+    with console.status("[dim]Collecting versions...[/]"):
+        rows = versions.collect(groups)
+    if not rows:
+        console.print("[yellow]No tools found.[/]")
+        return 0
+
+    title = f"Installed Tools ({', '.join(groups)})" if groups else "Installed Tools"
+    table = Table(box=ROUNDED, border_style="blue", title=f"[bold]{title}[/] ({len(rows)} packages)")
+    table.add_column("Group", style="yellow", no_wrap=True)
+    table.add_column("Tool", style="cyan", no_wrap=True)
+    table.add_column("Version", style="green")
+
+    previous = None
+    for group, name, version in rows:
+        # Show the group only on its first row
+        table.add_row(group if group != previous else "", name, version)
+        previous = group
+
+    console.print()
+    console.print(table)
+    console.print()
+    return len(rows)
+
+
+def print_versions_plain(groups: list[str]) -> int:
+    """Print ``group|name|version`` lines, the format scripts/versions.sh reads."""
+    from foxden import versions
+
+    rows = versions.collect(groups)
+    for row in rows:
+        print("|".join(row))
+    return len(rows)
+
+
+def find_outdated() -> list[tuple[str, str, str]]:
+    """``(name, installed, latest)`` for uv tools with a newer release on the index."""
+    from foxden import pypi, versions
 
-    console.print(f"[red]Tool '{tool_name}' not found.[/]")
+    installed = [(name, version) for _, name, version in versions.collect(["uv"])]
+    latest = pypi.latest_versions(name for name, _ in installed)
+    return [
+        (name, version, latest[name])
+        for name, version in installed
+        if latest[name] and latest[name] != version
+    ]
+
+
+def show_outdated() -> int:
+    """Display outdated uv tools; returns how many there are."""
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    console = get_console()
+    with console.status("[dim]Checking the package index...[/]"):
+        rows = find_outdated()
+    if not rows:
+        console.print("[green]All uv tools are up to date.[/]")
+        return 0
+
+    table = Table(box=ROUNDED, border_style="blue", title=f"[bold]Outdated uv tools[/] ({len(rows)})")
+    table.add_column("Tool", style="cyan", no_wrap=True)
+    table.add_column("Installed", style="yellow")
+    table.add_column("Latest", style="green")
+    for row in rows:
+        table.add_row(*row)
+
+    console.print()
+    console.print(table)
+    console.print()
+    return len(rows)
+
+
+def print_outdated_plain() -> int:
+    """Print ``name|installed|latest`` lines, the format scripts/versions.sh reads."""
+    rows = find_outdated()
+    for row in rows:
+        print("|".join(row))
+    return len(rows)
 
 
 def show_help():
     """Display help information with category overview."""
+    from rich.box import ROUNDED
+    from rich.table import Table
+
+    console = get_console()
     console.print("\n[cyan bold]Usage:[/]")
     console.print("  [green]tools -s vc[/]         Show version control tools")
     console.print("  [green]tools -s cli[/]        Show modern CLI tools")
     console.print("  [green]tools -d lazygit[/]    Describe lazygit")
+    console.print("  [green]tools --search lzg[/]  Fuzzy search tools")
     console.print("  [green]tools --tui[/]         Interactive browser")
 
     table = Table(title="[bold]Categories[/]", show_header=True, box=ROUNDED, border_style="blue")
@@ -331,8 +785,7 @@ def show_help():
 
     for cat in Category:
         icon, title, desc = CATEGORY_META[cat]
-        count = len(TOOL_MAP[cat])
-        table.add_row(icon, cat.value, desc, str(count))
+        table.add_row(icon, cat.value, desc, str(category_count(cat)))
 
     console.print()
     console.print(table)
@@ -346,11 +799,16 @@ def show_help():
 
 def run_tui():
     """Launch the Textual TUI application."""
+    import asyncio
+    import threading
+
     from textual.app import App, ComposeResult
     from textual.binding import Binding
     from textual.containers import Container
     from textual.widgets import DataTable, Footer, Header, Input, Static, ListView, ListItem, Label
 
+    from foxden.search import FuzzyIndex, IncrementalSearch, count_label, search_debounce
+
     class ToolsApp(App):
         """Interactive tool browser TUI."""
         
@@ -423,12 +881,16 @@ def run_tui():
             Binding("escape", "clear_search", "Clear"),
             Binding("j", "cursor_down", "Down", show=False),
             Binding("k", "cursor_up", "Up", show=False),
+            Binding("f2", "search_stats", "Debug", show=False),
         ]
 
         def __init__(self):
             super().__init__()
             self.current_category = Category.SHELL
             self.search_query = ""
+            self.search_index = None  # Built on the first search: it needs every category
+            self.search_index_lock = threading.Lock()  # Searches run in worker threads
+            self.search_debounce = search_debounce()
             self.showing_all = False
 
         def compose(self) -> ComposeResult:
@@ -445,64 +907,117 @@ def run_tui():
             with Container(id="main"):
                 yield Input(placeholder="Search tools... (press /)", id="search")
                 with Container(id="table-container"):
-                    yield DataTable(id="tool-table")
+                    yield DataTable(id="search-table")
                 yield Static("Select a tool to see details", id="details")
             yield Footer()
 
         def on_mount(self) -> None:
-            table = self.query_one("#tool-table", DataTable)
-            table.add_columns("Tool", "Description", "Example")
-            table.cursor_type = "row"
+            # Built row sets, keyed by category; None holds search results
+            self.tables = {None: self.setup_table(self.query_one("#search-table", DataTable))}
+            self.search_scope = None
+            self.row_categories = {}  # Name → category of every row shown so far
             self.load_category(self.current_category)
 
+        def setup_table(self, table: DataTable) -> DataTable:
+            table.add_column("", key="status")
+            table.add_column("Tool", key="name")
+            table.add_column("Description")
+            table.add_column("Example")
+            table.cursor_type = "row"
+            return table
+
+        def show_table(self, key) -> DataTable:
+            """Show the table for ``key``; a category's rows are built on first visit only."""
+            table = self.tables.get(key)
+            if table is None:
+                table = self.setup_table(DataTable(id=f"table-{key.value}"))
+                for entry in category_entries(key):
+                    self.row_categories[entry[0]] = key
+                    table.add_row(self.status_mark(entry[0]), *entry, key=entry[0])
+                self.query_one("#table-container", Container).mount(table)
+                self.tables[key] = table
+            for other in self.tables.values():
+                other.display = other is table
+            self.active_table = table
+            return table
+
+        def show_rows(self, records: list, scope) -> None:
+            """Diff the search table to ``records``, keyed by name, in rank order.
+
+            ``scope`` is the category being filtered, or None for results from
+            all categories (those rows carry their category icon).
+            """
+            table = self.show_table(None)
+            if scope != self.search_scope:
+                table.clear()  # Cells differ between scopes, nothing to reuse
+                self.search_scope = scope
+
+            wanted = {record.name for record in records}
+            shown = {key.value for key in table.rows}
+            for name in shown - wanted:
+                table.remove_row(name)
+            added = [record for record in records if record.name not in shown]
+            for record in added:
+                name, description, example = record.entry
+                self.row_categories[name] = record.category
+                status = self.status_mark(name)
+                if scope is None:
+                    icon = CATEGORY_META[record.category][0]
+                    table.add_row(status, name, f"{icon} {description}", example, key=name)
+                else:
+                    table.add_row(status, name, description, example, key=name)
+            ranked = [record.name for record in records]
+            if [row.key.value for row in table.ordered_rows] != ranked:
+                rank = {name: i for i, name in enumerate(ranked)}
+                table.sort("name", key=rank.__getitem__)
+
+        def status_mark(self, name: str) -> str:
+            return STATUS_MARKS[tool_status(name)]
+
+        def searcher(self) -> IncrementalSearch:
+            """The search index over every category, built once by the first search.
+
+            Only called from worker threads, so the build never blocks input.
+            """
+            with self.search_index_lock:
+                if self.search_index is None:
+                    self.search_index = IncrementalSearch(FuzzyIndex(get_catalog(), "search-tools"))
+                return self.search_index
+
         def load_category(self, category: Category) -> None:
             self.current_category = category
             self.showing_all = False
-            table = self.query_one("#tool-table", DataTable)
-            table.clear()
-
-            tools = TOOL_MAP[category]
-            filtered = self.filter_tools(tools)
 
-            for name, description, example in filtered:
-                table.add_row(name, description, example)
+            if self.search_query:
+                # Ranked in a worker, like run_search; a keystroke cancels it
+                self.run_worker(
+                    self.search_category(category, self.search_query), group="search", exclusive=True
+                )
+                return
+            self.show_table(category)
+            self.show_category_details(category, category_entries(category))
 
+        def show_category_details(self, category: Category, records: list) -> None:
             icon, title, desc = CATEGORY_META[category]
             self.query_one("#details", Static).update(
-                f"[bold]{icon}  {title}[/] — {desc} ({len(filtered)} tools)"
+                f"[bold]{icon}  {title}[/] — {desc} ({count_label(records)} tools)"
             )
 
-        def load_all_matching(self) -> None:
-            """Load tools from ALL categories matching the search query."""
+        def load_all_matching(self, results: list) -> None:
+            """Show search results for tools from ALL categories."""
             self.showing_all = True
-            table = self.query_one("#tool-table", DataTable)
-            table.clear()
-
-            query = self.search_query.lower()
-            results = []
-            for cat in Category:
-                for name, description, example in TOOL_MAP[cat]:
-                    if (query in name.lower() or 
-                        query in description.lower() or 
-                        query in example.lower()):
-                        results.append((name, description, example, cat))
-
-            for name, description, example, cat in results:
-                icon = CATEGORY_META[cat][0]
-                table.add_row(name, f"{icon} {description}", example)
+            self.show_rows(results, None)
 
             self.query_one("#details", Static).update(
-                f"[bold]󰍉  Search Results[/] — {len(results)} matches across all categories"
+                f"[bold]󰍉  Search Results[/] — {count_label(results)} matches across all categories"
             )
 
-        def filter_tools(self, tools: list) -> list:
-            if not self.search_query:
-                return tools
-            query = self.search_query.lower()
-            return [
-                t for t in tools
-                if query in t[0].lower() or query in t[1].lower() or query in t[2].lower()
-            ]
+        async def search_category(self, category: Category, query: str) -> None:
+            """Search results within one category, ranked off the UI thread."""
+            results = await asyncio.to_thread(lambda: self.searcher().rank(query, category))
+            if query == self.search_query and category == self.current_category:
+                self.show_rows(results, category)
+                self.show_category_details(category, results)
 
         def on_list_view_selected(self, event: ListView.Selected) -> None:
             item_id = event.item.id
@@ -511,46 +1026,57 @@ def run_tui():
                 self.load_category(Category(cat_name))
 
         def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-            table = self.query_one("#tool-table", DataTable)
-            row_key = event.row_key
-            row = table.get_row(row_key)
+            row = event.data_table.get_row(event.row_key)
             if row:
-                name, description, example = row
-                # Find the category for this tool
-                cat_info = ""
-                for cat in Category:
-                    if any(t[0] == name for t in TOOL_MAP[cat]):
-                        icon, title, _ = CATEGORY_META[cat]
-                        cat_info = f" [{title}]"
-                        break
+                _, name, description, example = row
+                category = self.row_categories.get(name)
+                cat_info = f" [{CATEGORY_META[category][1]}]" if category else ""
+                locked = get_lock_index().get(name)
+                if locked:
+                    from foxden.brewlock import describe
+                    cat_info += f" [dim]locked {describe(locked)}[/]"
                 details = f"[cyan bold]{name}[/]{cat_info}\n{description}\n[green]→ {example}[/]"
                 self.query_one("#details", Static).update(details)
 
         def on_input_changed(self, event: Input.Changed) -> None:
             if event.input.id == "search":
                 self.search_query = event.value
-                if self.search_query:
-                    self.load_all_matching()
-                else:
-                    self.load_category(self.current_category)
+                # exclusive: a newer keystroke cancels the pending search
+                self.run_worker(self.run_search(event.value), group="search", exclusive=True)
+
+        async def run_search(self, query: str) -> None:
+            """Debounced search off the UI thread; only the newest result set is shown."""
+            await asyncio.sleep(self.search_debounce)
+            if not query:
+                self.load_category(self.current_category)
+                return
+            # The first search builds the index, so it runs off the UI thread too
+            results = await asyncio.to_thread(lambda: self.searcher().rank(query))
+            if query == self.search_query:
+                self.load_all_matching(results)
 
         def action_focus_search(self) -> None:
             self.query_one("#search", Input).focus()
 
         def action_clear_search(self) -> None:
+            self.workers.cancel_group(self, "search")
             search = self.query_one("#search", Input)
             search.value = ""
             self.search_query = ""
             self.showing_all = False
             self.load_category(self.current_category)
 
+        def action_search_stats(self) -> None:
+            if self.search_index is None:
+                self.notify("No searches yet", title="Search cache")
+                return
+            self.notify(self.search_index.stats(), title="Search cache")
+
         def action_cursor_down(self) -> None:
-            table = self.query_one("#tool-table", DataTable)
-            table.action_cursor_down()
+            self.active_table.action_cursor_down()
 
         def action_cursor_up(self) -> None:
-            table = self.query_one("#tool-table", DataTable)
-            table.action_cursor_up()
+            self.active_table.action_cursor_up()
 
     app = ToolsApp()
     app.run()
@@ -560,87 +1086,415 @@ def run_tui():
 # MAIN CLI
 # ═══════════════════════════════════════════════════════════════════════════
 
+def iter_tool_json():
+    """Yield every tool as a dictionary for machine consumption, category by category."""
+    catalog = get_catalog()
+    for category in Category:
+        for record in catalog.in_category(category):
+            yield tool_json(record)
+
+
 def get_tool_json(tool_name: str) -> Optional[dict]:
     """Get tool info as a dictionary for machine consumption."""
-    for cat, tools in TOOL_MAP.items():
-        for name, description, example in tools:
-            if name == tool_name:
-                icon, title, _ = CATEGORY_META[cat]
-                return {
-                    "name": name,
-                    "description": description,
-                    "example": example,
-                    "category": cat.value,
-                    "category_title": title,
-                }
-    return None
-
-
-@app.command()
-def main(
-    show: Optional[Category] = typer.Option(
-        None, "--show", "-s", help="Show tools for a specific category"
-    ),
-    describe: str = typer.Option(
-        None, "--describe", "-d", help="Describe a specific tool"
-    ),
-    json_out: str = typer.Option(
-        None, "--json", "-j", help="Output tool info as JSON (for scripts)"
-    ),
-    tui: bool = typer.Option(
-        False, "--tui", "-t", help="Launch interactive TUI browser"
-    ),
-):
+    record = get_catalog().get(tool_name)
+    return None if record is None else tool_json(record)
+
+
+def tool_json(record) -> dict:
+    name, description, example = record.entry
+    return {
+        "name": name,
+        "description": description,
+        "example": example,
+        "category": record.category.value,
+        "category_title": CATEGORY_META[record.category][1],
+        **lock_fields(name),
+    }
+
+
+def serve_catalog() -> None:
+    """Keep the catalog resident and answer --json lookups over a Unix socket.
+
+    When this script or a file the catalog comes from changes, the daemon
+    restarts itself on the new catalog.
+    """
+    from foxden.daemon import serve, socket_path
+    from foxden.snapshot import file_stamp
+
+    path = socket_path("tools")
+    files = catalog_files()
+    records = {info["name"]: info for info in iter_tool_json()}
+    console = get_console()
+    console.print(f"[dim]Serving {len(records)} tools on {path} (Ctrl+C to stop)[/]", highlight=False)
+    if serve(path, records, prefix="tool_", source_key=lambda: [file_stamp(file) for file in files]):
+        console.print("[dim]Catalog changed, restarting[/]")
+        os.execv(sys.executable, [sys.executable, *sys.argv])
+
+
+def print_tool_json(names: Iterable[str], fmt: Format, flush: bool = False) -> int:
+    """Stream one record per name, misses included. Returns the number of hits.
+
+    Records come from a running `tools --serve` daemon when there is one,
+    so the catalog is not loaded here.
     """
-    Fox's Den - Explore your installed tools and packages.
-
-    Categories:
-      shell  - Terminal, prompt, multiplexer
-      edit   - Text editors & writing
-      cli    - Modern Unix replacements
-      files  - File management & navigation
-      vc     - Version control tools
-      data   - Databases & data processing
-      dev    - Development & build tools
-      infra  - Infrastructure & cloud
-      lang   - Programming languages & runtimes
-      ai     - AI & LLM tools
-      gnu    - GNU coreutils
-      media  - Media & documents
-      apps   - Productivity applications
-      wm     - Window management
-      sys    - System & security
-
-    Examples:
-      tools              # Show categories
-      tools -s vc        # Show version control tools
-      tools -d lazygit   # Describe lazygit
-      tools --tui        # Interactive browser
+    from foxden.daemon import Client, socket_path
+
+    hits = 0
+    with Client(socket_path("tools"), get_tool_json) as client:
+        for name in names:
+            info = client.lookup(name)
+            hits += info is not None
+            record = found(info) if info else not_found(name)
+            sys.stdout.write(encode(record, fmt, prefix="tool_") + "\n")
+            if flush:
+                sys.stdout.flush()
+    return hits
+
+
+# Reference page columns: (header, record key, as code)
+REFERENCE_COLUMNS = (
+    ("Tool", "name", True),
+    ("Description", "description", False),
+    ("Example", "example", False),
+)
+
+
+def export_tools(fmt, output: Optional[str]) -> None:
+    """Write every tool as NDJSON, a SQLite table or the docs reference page.
+
+    Files and rows whose content did not change are left alone.
     """
-    if tui:
-        run_tui()
+    from foxden import export
+
+    path = output or export.default_output(fmt, "tools")
+    records = iter_tool_json()
+    if fmt == export.ExportFormat.SQLITE:
+        written, unchanged, removed = export.export_sqlite(path, records, STORE_COLUMNS, INDEXED_COLUMNS)
+        print(f"{path}: {written} written, {removed} removed, {unchanged} unchanged")
         return
 
-    if json_out:
-        import json
-        info = get_tool_json(json_out)
-        if info:
-            print(json.dumps(info))
+    if fmt == export.ExportFormat.MARKDOWN:
+        headings = {cat.value: (title, desc) for cat, (_, title, desc) in CATEGORY_META.items()}
+        chunks = export.markdown_page(path, export.markdown_block(records, REFERENCE_COLUMNS, headings))
+    else:
+        chunks = export.ndjson_lines(records)
+    changed = export.write_if_changed(path, chunks)
+    if path != "-":
+        print(f"Wrote {path}" if changed else f"{path} is up to date")
+
+
+def rebuild_manifest() -> bool:
+    """Recount the external category files and rewrite their manifest (see foxden.external)."""
+    from foxden.external import MANIFEST_NAME, catalog_dir, write_manifest
+
+    directory = catalog_dir("tools")
+    if not os.path.isdir(directory):
+        get_console().print(f"[red]No external catalog at {directory}[/]")
+        return False
+    manifest = write_manifest(directory, EXTERNAL_FIELDS, (record.name for record in get_local_catalog()))
+    counts = ", ".join(f"{category} {info['count']}" for category, info in manifest["categories"].items())
+    print(f"Wrote {os.path.join(directory, MANIFEST_NAME)}: {counts or 'no category files'}")
+    return True
+
+
+def fast_main(argv: list[str]) -> bool:
+    """Answer plain-output requests without importing typer or rich.
+
+    Returns False when the arguments need the full CLI.
+    """
+    json_args = parse_json_args(argv)
+    if json_args is not None:
+        names, fmt = json_args
+        if names:
+            hits = print_tool_json(names, fmt)
         else:
-            import sys
-            sys.exit(1)
-        return
+            hits = print_tool_json(read_names(sys.stdin), fmt, flush=True)
+        sys.exit(0 if hits else 1)
+
+    tool_name = parse_plain_describe(argv)
+    if tool_name is not None:
+        print_tool_plain(tool_name)
+        return True
+
+    query = parse_plain_search(argv)
+    if query is not None:
+        sys.exit(0 if print_search_plain(query) else 1)
+
+    query = parse_plain_fts(argv)
+    if query is not None:
+        sys.exit(0 if print_fulltext_plain(query) else 1)
+
+    groups = parse_plain_versions(argv)
+    if groups is not None:
+        unknown = unknown_version_groups(groups)
+        if unknown:
+            from foxden.versions import GROUPS
+            sys.stderr.write(f"Unknown group: {unknown[0]}\nValid groups: {'|'.join(GROUPS)}\n")
+            sys.exit(2)
+        print_versions_plain(groups)
+        return True
+
+    if parse_plain_outdated(argv):
+        print_outdated_plain()
+        return True
+
+    show = parse_terminal_show(argv)
+    if show is not None:
+        try:
+            category = Category(show)
+        except ValueError:
+            return False  # typer reports the valid choices
+        show_category_tools(category)
+        return True
+
+    directory = parse_completion(argv)
+    if directory is not None:
+        install_completion(directory)
+        return True
+
+    if parse_terminal_all(argv):
+        show_all_tools()
+        return True
+
+    return False
+
+
+def completion_values() -> dict[str, list[tuple[str, str]]]:
+    """Values the static zsh completion offers, by kind."""
+    return {
+        "category": [(cat.value, CATEGORY_META[cat][2]) for cat in Category],
+        "tool": [(record.name, record.entry[1]) for record in get_catalog()],
+    }
+
+
+def install_completion(directory: str) -> None:
+    """Write the static zsh completion into ``directory`` ("-" prints it).
+
+    The file is only rewritten when the catalog or the CLI changed, so
+    install.sh can call this on every run.
+    """
+    from foxden import completion
 
-    if describe:
-        show_tool_description(describe)
-        return
+    values = completion_values()
+    digest = completion.completion_digest(__file__, chain.from_iterable(values.values()))
+
+    def build() -> str:
+        import typer.main
+
+        command = typer.main.get_command(build_app())
+        return completion.zsh_script("tools", command, values, {"show": "category", "describe": "tool", "names": "tool"}, digest)
 
-    if show:
-        show_category_tools(show)
+    if directory == "-":
+        sys.stdout.write(build())
         return
+    path = os.path.join(directory, COMPLETION_FILE)
+    if completion.write_completion(path, digest, build):
+        print(f"Wrote {path}")
+
+
+def build_app():
+    """The typer app behind the full CLI."""
+    import typer
+
+    from foxden.export import ExportFormat
+
+    app = typer.Typer(help="Fox's Den - Explore your installed tools")
+
+    @app.command()
+    def main(
+        show: Optional[Category] = typer.Option(
+            None, "--show", "-s", help="Show tools for a specific category"
+        ),
+        describe: str = typer.Option(
+            None, "--describe", "-d", help="Describe a specific tool"
+        ),
+        search: Optional[str] = typer.Option(
+            None, "--search", help="Fuzzy search tools, best match first (limit with -s)"
+        ),
+        fulltext: bool = typer.Option(
+            False, "--fts", help="With --search: match words in the SQLite FTS5 store, bm25 ranked with highlights"
+        ),
+        names: Optional[list[str]] = typer.Argument(
+            None,
+            help="Tool names for --json (read from stdin when omitted), or groups for --versions",
+            show_default=False,
+        ),
+        json_out: bool = typer.Option(
+            False, "--json", "-j", help="Output tool info, one record per line (for scripts)"
+        ),
+        output_format: Format = typer.Option(
+            Format.JSON, "--format", "-f", help="Record format for --json"
+        ),
+        versions: bool = typer.Option(
+            False, "--versions", help="Installed versions per package manager (brew cask uv cargo git other)"
+        ),
+        outdated: bool = typer.Option(
+            False, "--outdated", help="uv tools with a newer release on the package index"
+        ),
+        show_all: bool = typer.Option(
+            False, "--all", "-a", help="Show every category, paged"
+        ),
+        completion: Optional[str] = typer.Option(
+            None, "--completion", metavar="DIR", help="Write static zsh completion to DIR (- prints it)"
+        ),
+        tui: bool = typer.Option(
+            False, "--tui", "-t", help="Launch interactive TUI browser"
+        ),
+        serve: bool = typer.Option(
+            False, "--serve", help="Serve --json lookups from a resident daemon"
+        ),
+        export_format: Optional[ExportFormat] = typer.Option(
+            None, "--export", help="Export every tool, rewriting only what changed"
+        ),
+        output: Optional[str] = typer.Option(
+            None, "--output", "-o", metavar="PATH",
+            help="Where --export writes (default: stdout, cache dir or docs/reference/tools.md)",
+        ),
+        manifest: bool = typer.Option(
+            False, "--rebuild-manifest", help="Recount the external catalog files into their manifest"
+        ),
+    ):
+        """
+        Fox's Den - Explore your installed tools and packages.
+
+        Categories:
+          shell  - Terminal, prompt, multiplexer
+          edit   - Text editors & writing
+          cli    - Modern Unix replacements
+          files  - File management & navigation
+          vc     - Version control tools
+          data   - Databases & data processing
+          dev    - Development & build tools
+          infra  - Infrastructure & cloud
+          lang   - Programming languages & runtimes
+          ai     - AI & LLM tools
+          gnu    - GNU coreutils
+          media  - Media & documents
+          apps   - Productivity applications
+          wm     - Window management
+          sys    - System & security
+
+        Examples:
+          tools                      # Show categories
+          tools -s vc                # Show version control tools
+          tools -d lazygit           # Describe lazygit
+          tools --search lzg         # Fuzzy search, best match first
+          tools --search fmt --json  # Ranked matches as JSON records
+          tools --search "json query" --fts  # Word search, bm25 ranked
+          tools --json bat fd        # One JSON record per tool
+          brew list | tools --json   # Names (or NDJSON) from stdin
+          tools --json -f shell bat  # eval-able tool_* assignments
+          tools --versions           # Installed versions, all managers at once
+          tools --versions uv cargo  # Only some groups
+          tools --outdated           # uv tools behind the package index
+          tools -a                   # Every category, paged
+          tools --tui                # Interactive browser
+          tools --completion ~/.zfunc  # Static zsh completion
+          tools --serve              # Keep catalog resident for fast lookups
+          tools --export markdown    # Regenerate docs/reference/tools.md
+          tools --rebuild-manifest   # After editing $FOXDEN_CATALOG_DIR/tools/
+          tools --export sqlite -o tools.db  # Upsert changed rows only
+        """
+        if manifest:
+            if not rebuild_manifest():
+                raise typer.Exit(1)
+            return
+
+        if export_format:
+            export_tools(export_format, output)
+            return
+
+        if serve:
+            serve_catalog()
+            return
+
+        if completion:
+            install_completion(completion)
+            return
+
+        if tui:
+            run_tui()
+            return
+
+        if versions:
+            unknown = unknown_version_groups(names or [])
+            if unknown:
+                from foxden.versions import GROUPS
+                get_console().print(f"[red]Unknown group: {unknown[0]}[/] (valid: {', '.join(GROUPS)})")
+                raise typer.Exit(2)
+            if sys.stdout.isatty():
+                show_versions(names or [])
+            else:
+                print_versions_plain(names or [])
+            return
+
+        if outdated:
+            if sys.stdout.isatty():
+                show_outdated()
+            else:
+                print_outdated_plain()
+            return
+
+        if json_out:
+            if search is not None and fulltext:
+                import sqlite3
+
+                try:
+                    matches = [result["name"] for result in fulltext_search(search, show)]
+                except sqlite3.Error as error:
+                    print(f"Full-text search unavailable: {error}", file=sys.stderr)
+                    raise typer.Exit(1)
+                hits = print_tool_json(matches, output_format)
+            elif search is not None:
+                matches = [record.name for record in search_tools(search, show)]
+                hits = print_tool_json(matches, output_format)
+            elif names:
+                hits = print_tool_json(names, output_format)
+            else:
+                hits = print_tool_json(read_names(sys.stdin), output_format, flush=True)
+            if not hits:
+                raise typer.Exit(1)
+            return
+
+        if describe:
+            if sys.stdout.isatty():
+                show_tool_description(describe)
+            else:
+                print_tool_plain(describe)
+            return
+
+        if search is not None:
+            if fulltext:
+                show_results, print_results = show_fulltext_results, print_fulltext_plain
+            else:
+                show_results, print_results = show_search_results, print_search_plain
+            if sys.stdout.isatty():
+                hits = show_results(search, show)
+            else:
+                hits = print_results(search, show)
+            if not hits:
+                raise typer.Exit(1)
+            return
+
+        if show:
+            show_category_tools(show)
+            return
+
+        if show_all:
+            show_all_tools()
+            return
+
+        show_help()
+
+    return app
+
 
-    show_help()
+def cli() -> None:
+    """Full CLI with typer parsing and rich output."""
+    build_app()()
 
 
 if __name__ == "__main__":
-    app()
+    with quiet_broken_pipe():
+        if not fast_main(sys.argv[1:]):
+            cli()
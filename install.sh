@@ -24,6 +24,7 @@ source "$DOTFILES_DIR/scripts/ui.sh"
 source "$DOTFILES_DIR/scripts/versions.sh"
 
 # Tools to track: name|version_cmd|type (type: cmd, git, uv)
+# Versions are read from `tools.py --versions` (see scripts/versions.sh)
 readonly TRACKED_TOOLS=(
     "bun|bun|cmd"
     "n|n|cmd"
@@ -55,6 +56,7 @@ git_install() {
     local tool="$1" url="$2" folder="$3" name="$4"
     local old_ver was_missing=false
 
+    ensure_installed_versions
     old_ver=$(get_version "$tool")
     [[ ! -d "$folder" ]] && was_missing=true
 
@@ -348,6 +350,7 @@ install_brew() {
 configure_node() {
     log_step "📦 Installing Node.js tools"
     local old_n old_bun
+    ensure_installed_versions
     old_n=$(get_version "n")
     old_bun=$(get_version "bun")
 
@@ -389,6 +392,7 @@ setup_utils() {
 
     # Capture versions before
     local old_repgrep old_harlequin old_sqlit old_snowsql
+    ensure_installed_versions
     old_repgrep=$(get_version "repgrep")
     old_snowsql=$(get_version "snowsql")
     old_harlequin=$(get_version "harlequin")
@@ -458,6 +462,18 @@ setup_utils() {
                 execute chmod +x "$HOME/.local/bin/$name"
             }
         done
+        # Shared support package imported by the scripts above
+        if [[ -d "$DOTFILES_DIR/bin/foxden" ]]; then
+            execute rm -rf "$HOME/.local/bin/foxden"
+            execute cp -R "$DOTFILES_DIR/bin/foxden" "$HOME/.local/bin/foxden"
+        fi
+        # Static zsh completions on $fpath, rewritten only when a catalog changed
+        for name in aliases tools; do
+            if [[ -x "$HOME/.local/bin/$name" ]]; then
+                execute "$HOME/.local/bin/$name" --completion "$HOME/.zfunc" \
+                    || log_warn "Could not generate $name completions, skipping"
+            fi
+        done
     fi
 
     # Track changes
@@ -39,25 +39,21 @@ show_outdated() {
         echo ""
     fi
     
-    # UV tools
-    if has_cmd uv; then
+    # UV tools (tools.py asks the package index about all of them concurrently)
+    local tools_script="$DOTFILES_DIR/bin/tools.py"
+    if has_cmd uv && [[ -x "$tools_script" ]]; then
         echo -e "${CYAN}UV tools:${NC}"
-        # uv doesn't have a built-in outdated check, so we check PyPI
-        local uv_tools
-        uv_tools=$(uv tool list 2>/dev/null | grep -v "^-" | awk '{print $1, $2}')
-        local uv_has_outdated=false
-        while read -r name ver; do
-            [[ -z "$name" ]] && continue
-            ver=$(echo "$ver" | tr -d 'v')
-            local latest
-            latest=$(curl -s "https://pypi.org/pypi/$name/json" 2>/dev/null | jq -r '.info.version // empty' 2>/dev/null)
-            if [[ -n "$latest" && "$ver" != "$latest" ]]; then
-                has_outdated=true
-                uv_has_outdated=true
+        local uv_outdated
+        uv_outdated=$("$tools_script" --outdated 2>/dev/null)
+        if [[ -n "$uv_outdated" ]]; then
+            has_outdated=true
+            local name ver latest
+            while IFS='|' read -r name ver latest; do
                 echo -e "  ${YELLOW}$name $ver → $latest${NC}"
-            fi
-        done <<< "$uv_tools"
-        [[ "$uv_has_outdated" == false ]] && echo -e "  ${GREEN}All up to date${NC}"
+            done <<< "$uv_outdated"
+        else
+            echo -e "  ${GREEN}All up to date${NC}"
+        fi
         echo ""
     fi
     
@@ -254,6 +250,12 @@ update_tool() {
 # Tool Info (--info command)
 # =============================================================================
 
+# Socket of the `tools --serve` daemon (mirrors foxden.daemon.socket_path)
+tools_socket_path() {
+    local base="${XDG_RUNTIME_DIR:-${TMPDIR:-/tmp}}"
+    echo "${base%/}/foxden-${UID}/tools.sock"
+}
+
 # Detect which package manager owns a tool and get its info
 get_tool_info() {
     local tool="$1"
@@ -261,15 +263,24 @@ get_tool_info() {
     local source="" version="" description="" example="" category=""
     
     # Check tools.py for curated description first
+    # Ask a running `tools --serve` daemon, fall back to forking the script.
+    # Both answer with eval-able tool_* assignments, so no jq is needed.
     local tools_script="$DOTFILES_DIR/bin/tools.py"
-    if [[ -x "$tools_script" ]]; then
-        local tools_json
-        tools_json=$("$tools_script" --json "$tool" 2>/dev/null)
-        if [[ -n "$tools_json" ]] && has_cmd jq; then
-            description=$(echo "$tools_json" | jq -r '.description // empty')
-            example=$(echo "$tools_json" | jq -r '.example // empty')
-            category=$(echo "$tools_json" | jq -r '.category_title // empty')
-        fi
+    local tools_line="" tools_sock
+    tools_sock="$(tools_socket_path)"
+    if [[ -S "$tools_sock" ]] && has_cmd nc; then
+        tools_line=$(printf '@shell\n%s\n\n' "$tool" | nc -U "$tools_sock" 2>/dev/null) || true
+    fi
+    if [[ -z "$tools_line" && -x "$tools_script" ]]; then
+        tools_line=$("$tools_script" --json --format shell "$tool" 2>/dev/null) || true
+    fi
+    local tool_found=0 tool_description="" tool_example="" tool_category_title=""
+    local tool_locked_version="" tool_locked_kind=""
+    [[ -n "$tools_line" ]] && eval "local $tools_line"
+    if [[ "$tool_found" == 1 ]]; then
+        description="$tool_description"
+        example="$tool_example"
+        category="$tool_category_title"
     fi
     
     # Check Homebrew formula
@@ -329,6 +340,11 @@ get_tool_info() {
         source="git"
         version=$(git -C "$HOME/.config/yazi/flavors" rev-parse --short HEAD 2>/dev/null)
         [[ -z "$description" ]] && description="Color schemes for Yazi file manager"
+    # Not installed here (or no Homebrew, as on Linux): fall back to Brewfile.lock.json
+    elif [[ -n "$tool_locked_version" ]]; then
+        found=true
+        source="$tool_locked_kind (locked)"
+        version="$tool_locked_version"
     fi
     
     if [[ "$found" == false ]]; then
@@ -416,29 +432,31 @@ get_tool_info() {
 # Version Detection
 # =============================================================================
 
-get_version() {
-    local tool="$1"
-    case "$tool" in
-        bun)         [[ -f "$HOME/.bun/bin/bun" ]] && "$HOME/.bun/bin/bun" --version 2>/dev/null ;;
-        snowsql)     [[ -f "/Applications/SnowSQL.app/Contents/MacOS/snowsql" ]] && /Applications/SnowSQL.app/Contents/MacOS/snowsql -v 2>/dev/null | awk '{print $2}' ;;
-        repgrep)     has_cmd rgr && cargo install --list 2>/dev/null | awk '/^repgrep/{print $2}' | tr -d 'v:' ;;
-        n)           has_cmd npm && npm list -g --depth=0 2>/dev/null | sed -n 's/.*n@//p' ;;
-        tpm)         [[ -d "$HOME/.tmux/plugins/tpm/.git" ]] && git -C "$HOME/.tmux/plugins/tpm" rev-parse --short HEAD 2>/dev/null ;;
-        yazi-flavors) [[ -d "$HOME/.config/yazi/flavors/.git" ]] && git -C "$HOME/.config/yazi/flavors" rev-parse --short HEAD 2>/dev/null ;;
-        *)           get_version_by_type "$tool" ;;
-    esac
+# Versions of every tracked tool come from one collection per run
+# ("group|name|version" lines), so a lookup never re-runs a package manager.
+INSTALLED_VERSIONS=""
+INSTALLED_VERSIONS_LOADED=false
+
+load_installed_versions() {
+    INSTALLED_VERSIONS=$(collect_all_versions)
+    INSTALLED_VERSIONS_LOADED=true
 }
 
-get_version_by_type() {
-    local tool="$1"
-    for entry in "${TRACKED_TOOLS[@]}"; do
-        IFS='|' read -r name _ type <<< "$entry"
-        [[ "$name" != "$tool" ]] && continue
-        case "$type" in
-            uv)         uv tool list 2>/dev/null | awk -v t="$tool" '$1==t{print $2}' | tr -d 'v' ;;
-        esac
-        return
-    done
+# Collect before the first install or upgrade of a run, never in a dry run.
+# Call it directly, not in $(...): a subshell would not keep the collection.
+ensure_installed_versions() {
+    [[ "$DRY_RUN" == true || "$INSTALLED_VERSIONS_LOADED" == true ]] && return 0
+    load_installed_versions
+}
+
+# A linear scan per lookup rather than a keyed map: /bin/bash on macOS is 3.2,
+# which has no associative arrays, and only the few tools tracked per run are
+# looked up. Empty until ensure_installed_versions has run.
+get_version() {
+    local tool="$1" grp name ver
+    while IFS='|' read -r grp name ver; do
+        [[ "$name" == "$tool" ]] && { echo "$ver"; return; }
+    done <<< "$INSTALLED_VERSIONS"
 }
 
 record_change() {
@@ -449,9 +467,23 @@ record_change() {
     VERSION_CHANGES+=("$tool|$old|$new|$status")
 }
 
+# Tools whose new version is looked up at the end of the run ("tool|old")
+PENDING_VERSIONS=()
+
 track_version() {
-    local tool="$1" old="$2"
-    record_change "$tool" "$old" "$(get_version "$tool")"
+    PENDING_VERSIONS+=("$1|$2")
+}
+
+# Re-collect once after all installs and record every tracked change
+finish_version_tracking() {
+    [[ ${#PENDING_VERSIONS[@]} -eq 0 ]] && return
+    load_installed_versions
+    local entry tool old
+    for entry in "${PENDING_VERSIONS[@]}"; do
+        IFS='|' read -r tool old <<< "$entry"
+        record_change "$tool" "$old" "$(get_version "$tool")"
+    done
+    PENDING_VERSIONS=()
 }
 
 # =============================================================================
@@ -461,71 +493,61 @@ track_version() {
 readonly VERSION_GROUPS="brew|cask|uv|cargo|git|other"
 
 # Collect all versions into a unified list: "group|name|version"
+# tools.py runs every package manager's bulk listing once, concurrently. When
+# it cannot run (its shebang needs uv), the listings run here one by one.
 collect_all_versions() {
     local filter="${1:-}"
-    
-    # Homebrew formulae
+    local tools_script="$DOTFILES_DIR/bin/tools.py"
+    local versions
+    if [[ -x "$tools_script" ]] && has_cmd uv; then
+        if versions=$("$tools_script" --versions ${filter:+"$filter"}); then
+            [[ -n "$versions" ]] && echo "$versions"
+            return 0
+        fi
+        log_warn "tools.py --versions failed, listing versions directly" >&2
+    else
+        log_warn "tools.py needs uv to collect versions, listing them directly" >&2
+    fi
+    collect_versions_directly "$filter"
+}
+
+# The same rows as `tools.py --versions`, without Python
+collect_versions_directly() {
+    local filter="${1:-}"
+
     if [[ -z "$filter" || "$filter" == "brew" ]] && has_cmd brew; then
-        while IFS= read -r line; do
-            [[ -z "$line" ]] && continue
-            local name ver
-            name=$(echo "$line" | awk '{print $1}')
-            ver=$(echo "$line" | awk '{print $2}')
-            [[ -n "$name" && -n "$ver" ]] && echo "brew|$name|$ver"
-        done < <(brew list --formula --versions 2>/dev/null)
+        brew list --formula --versions 2>/dev/null | awk '$2 != "" {print "brew|" $1 "|" $2}' || true
     fi
-    
-    # Homebrew casks
     if [[ -z "$filter" || "$filter" == "cask" ]] && has_cmd brew; then
-        while IFS= read -r line; do
-            [[ -z "$line" ]] && continue
-            local name ver
-            name=$(echo "$line" | awk '{print $1}')
-            ver=$(echo "$line" | awk '{print $2}')
-            [[ -n "$name" && -n "$ver" ]] && echo "cask|$name|$ver"
-        done < <(brew list --cask --versions 2>/dev/null)
+        brew list --cask --versions 2>/dev/null | awk '$2 != "" {print "cask|" $1 "|" $2}' || true
     fi
-    
-    # UV tools
     if [[ -z "$filter" || "$filter" == "uv" ]] && has_cmd uv; then
-        while IFS= read -r line; do
-            [[ -z "$line" || "$line" == -* ]] && continue
-            local name ver
-            name=$(echo "$line" | awk '{print $1}')
-            ver=$(echo "$line" | awk '{print $2}' | tr -d 'v')
-            [[ -n "$name" && -n "$ver" ]] && echo "uv|$name|$ver"
-        done < <(uv tool list 2>/dev/null)
+        # Each tool's executables are listed under it as "- name"
+        uv tool list 2>/dev/null | awk '!/^-/ && $2 != "" {sub(/^v/, "", $2); print "uv|" $1 "|" $2}' || true
     fi
-    
-    # Cargo packages
     if [[ -z "$filter" || "$filter" == "cargo" ]] && has_cmd cargo; then
-        while IFS= read -r line; do
-            [[ -z "$line" || "$line" == " "* ]] && continue
-            local name ver
-            name=$(echo "$line" | awk -F' v' '{print $1}')
-            ver=$(echo "$line" | awk -F' v' '{print $2}' | tr -d ':')
-            [[ -n "$name" && -n "$ver" ]] && echo "cargo|$name|$ver"
-        done < <(cargo install --list 2>/dev/null)
+        # "name vX.Y.Z:" lines; the binaries are indented under them
+        cargo install --list 2>/dev/null \
+            | awk -F' v' '!/^[[:space:]]/ && $2 != "" {sub(/:.*/, "", $2); print "cargo|" $1 "|" $2}' || true
     fi
-    
-    # Git repos
+
     if [[ -z "$filter" || "$filter" == "git" ]]; then
         local tpm_dir="$HOME/.tmux/plugins/tpm"
         local yazi_dir="$HOME/.config/yazi/flavors"
         [[ -d "$tpm_dir/.git" ]] && echo "git|tpm|$(git -C "$tpm_dir" rev-parse --short HEAD 2>/dev/null)"
         [[ -d "$yazi_dir/.git" ]] && echo "git|yazi-flavors|$(git -C "$yazi_dir" rev-parse --short HEAD 2>/dev/null)"
     fi
-    
-    # Other tools
+
     if [[ -z "$filter" || "$filter" == "other" ]]; then
+        local snowsql_bin="/Applications/SnowSQL.app/Contents/MacOS/snowsql" n_ver
         [[ -f "$HOME/.bun/bin/bun" ]] && echo "other|bun|$("$HOME/.bun/bin/bun" --version 2>/dev/null)"
-        has_cmd npm && {
-            local n_ver
-            n_ver=$(npm list -g --depth=0 2>/dev/null | sed -n 's/.*n@//p')
+        if has_cmd npm; then
+            n_ver=$(npm list -g --depth=0 2>/dev/null | sed -n 's/.* n@//p')
             [[ -n "$n_ver" ]] && echo "other|n|$n_ver"
-        }
-        [[ -f "/Applications/SnowSQL.app/Contents/MacOS/snowsql" ]] && echo "other|snowsql|$(/Applications/SnowSQL.app/Contents/MacOS/snowsql -v 2>/dev/null | awk '{print $2}')"
+        fi
+        [[ -f "$snowsql_bin" ]] && echo "other|snowsql|$("$snowsql_bin" -v 2>/dev/null | awk '{print $2}')"
     fi
+    return 0
 }
 
 # Print unified table with Group | Tool | Version columns
@@ -602,6 +624,7 @@ show_installed_versions() {
 }
 
 print_version_summary() {
+    finish_version_tracking
     [[ ${#VERSION_CHANGES[@]} -eq 0 ]] && return
     
     local -a changes=()